@@ -1,13 +1,67 @@
+import time
+_import_start = time.perf_counter()
+
 import omni.ext
-from .ui.StageInspectorWindow import StageInspectorWindow
+import omni.ui as ui
+import omni.kit.ui
+from .ui.WindowManager import window_manager
+
+WINDOW_TITLE = "USD Stage Inspector"
+MENU_PATH = f"Window/{WINDOW_TITLE}"
 
 class UsdStageInspectorExtension(omni.ext.IExt):
     def on_startup(self, _ext_id):
-        print("[buoi_2.usd_stage_inspector_extension] Extension startup")
-        self._window = StageInspectorWindow("USD Stage Inspector")
+        start = time.perf_counter()
+        self._window = None
+
+        # Nothing is built here: the inspector is built the first time it is
+        # shown, from the Window menu or a restored layout
+        ui.Workspace.set_show_window_fn(WINDOW_TITLE, self._show_window)
+        self._menu = None
+        editor_menu = omni.kit.ui.get_editor_menu()
+        if editor_menu:
+            self._menu = editor_menu.add_item(MENU_PATH, self._on_menu_click, toggle=True, value=False)
+
+        end = time.perf_counter()
+        print(
+            f"[buoi_2.usd_stage_inspector_extension] Extension startup in {(end - start) * 1000:.2f} ms "
+            f"(module import {(start - _import_start) * 1000:.2f} ms)"
+        )
+
+    def _on_menu_click(self, _menu, value):
+        ui.Workspace.show_window(WINDOW_TITLE, value)
+
+    def _set_menu(self, value):
+        editor_menu = omni.kit.ui.get_editor_menu()
+        if editor_menu and self._menu:
+            editor_menu.set_value(MENU_PATH, value)
+
+    def _show_window(self, visible: bool):
+        if not visible:
+            if self._window:
+                self._window.hide()
+            return
+
+        if self._window:
+            self._window.show()
+            return
+
+        start = time.perf_counter()
+        from .ui.StageInspectorWindow import StageInspectorWindow
+        self._window = StageInspectorWindow(WINDOW_TITLE)
+        # keep the menu check mark in sync when the window is closed
+        self._window.set_visibility_changed_fn(self._set_menu)
+        self._set_menu(True)
+        print(f"[buoi_2.usd_stage_inspector_extension] Window built in {(time.perf_counter() - start) * 1000:.2f} ms")
 
     def on_shutdown(self):
         print("[buoi_2.usd_stage_inspector_extension] Extension shutdown")
+        editor_menu = omni.kit.ui.get_editor_menu()
+        if editor_menu and self._menu:
+            editor_menu.remove_item(MENU_PATH)
+        self._menu = None
+        ui.Workspace.set_show_window_fn(WINDOW_TITLE, None)
+        window_manager.destroy_all()
         if self._window:
             self._window.__destroy__()
             self._window = None
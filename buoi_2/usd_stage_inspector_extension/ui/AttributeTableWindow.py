@@ -0,0 +1,198 @@
+import omni.ui as ui
+import omni.usd
+from pxr import Usd
+from .BaseWindow import BaseWindow
+from .PagedListView import PagedListView
+from .PrimPropertyWindow import PrimPropertyWindow
+from .WindowManager import window_manager
+from ..utils.AttributeTableUtils import (
+    AttributeTable,
+    fetch_attribute_table,
+    format_cell,
+    group_rows,
+    sort_rows,
+    suggest_columns,
+)
+
+PATH_COLUMN_WIDTH = 300
+VALUE_COLUMN_WIDTH = 150
+
+
+class AttributeTableWindow(BaseWindow):
+    """
+    One row per prim, one column per chosen attribute, all read at one time code.
+    """
+    def __init__(self, prim_paths):
+        super().__init__(title=f"Attribute Table - {len(prim_paths)} prims", width=1000, height=600, visible=True)
+        self._prim_paths = list(prim_paths)
+        self._columns = []
+        self._table: AttributeTable = None
+        self._sort_column = None
+        self._sort_descending = False
+        self._group_column = None
+        self._suggestions = suggest_columns(self.__get_stage__(), self._prim_paths)
+
+        with self._window.frame:
+            with ui.VStack(spacing=6, style={"padding": 8}):
+                with ui.HStack(height=26, spacing=8):
+                    ui.Label("Attribute:", width=70)
+                    self._suggest_frame = ui.Frame(width=220)
+                    self._suggest_frame.set_build_fn(self._build_suggest_combo)
+                    ui.Button("Add", width=50, clicked_fn=self._on_add_suggested)
+                    self._input_column = ui.StringField(width=200)
+                    ui.Button("Add by name", width=90, clicked_fn=self._on_add_typed)
+                    ui.Spacer()
+                with ui.HStack(height=26, spacing=8):
+                    ui.Label("Time code:", width=70)
+                    self._input_time = ui.StringField(width=100, tooltip="Empty for the default time")
+                    ui.Button("Load", width=80, clicked_fn=self._reload)
+                    self._summary_label = ui.Label("")
+                self._columns_frame = ui.Frame(height=26)
+                self._columns_frame.set_build_fn(self._build_column_bar)
+                with ui.ScrollingFrame(
+                    horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
+                    vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
+                ):
+                    self._content = ui.Frame()
+                    self._content.set_build_fn(self._build)
+
+    def retarget(self, prim_paths):
+        """
+        New prim set, the chosen columns are kept.
+        """
+        self._prim_paths = list(prim_paths)
+        self._window.title = f"Attribute Table - {len(prim_paths)} prims"
+        self._suggestions = suggest_columns(self.__get_stage__(), self._prim_paths)
+        self._suggest_frame.rebuild()
+        self._reload()
+
+    # ---------------------- Columns ----------------------
+    def _build_suggest_combo(self):
+        with self._suggest_frame:
+            self._suggest_combo = ui.ComboBox(0, *self._suggestions, width=220)
+
+    def _add_column(self, name):
+        if not name or name in self._columns:
+            return
+        self._columns.append(name)
+        self._columns_frame.rebuild()
+        self._reload()
+
+    def _remove_column(self, name):
+        self._columns.remove(name)
+        if self._sort_column == name:
+            self._sort_column = None
+        if self._group_column == name:
+            self._group_column = None
+        self._columns_frame.rebuild()
+        self._reload()
+
+    def _on_add_suggested(self):
+        if not self._suggestions:
+            return
+        index = self._suggest_combo.model.get_item_value_model().get_value_as_int()
+        self._add_column(self._suggestions[index])
+
+    def _on_add_typed(self):
+        self._add_column(self._input_column.model.get_value_as_string().strip())
+
+    def _build_column_bar(self):
+        with self._columns_frame:
+            with ui.HStack(spacing=6):
+                ui.Label("Group by:", width=70)
+                for name in self._columns:
+                    grouped = name == self._group_column
+                    ui.Button(
+                        name, width=0,
+                        clicked_fn=lambda n=name: self._on_group_clicked(n),
+                        style={"background_color": 0xFF7777AA if grouped else 0xFF555555},
+                        tooltip="Group rows by this column",
+                    )
+                    ui.Button("x", width=20, clicked_fn=lambda n=name: self._remove_column(n))
+                ui.Spacer()
+
+    # ---------------------- Data ----------------------
+    def _get_time_code(self) -> Usd.TimeCode:
+        text = self._input_time.model.get_value_as_string().strip()
+        if not text:
+            return Usd.TimeCode.Default()
+        try:
+            return Usd.TimeCode(float(text))
+        except ValueError:
+            print(f"Invalid time code '{text}', using default")
+            return Usd.TimeCode.Default()
+
+    def _reload(self):
+        self._table = None
+        self._content.rebuild()
+
+    def _on_sort_clicked(self, column):
+        if column == self._sort_column:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_column = column
+            self._sort_descending = False
+        self._content.rebuild()
+
+    def _on_group_clicked(self, column):
+        self._group_column = None if column == self._group_column else column
+        self._columns_frame.rebuild()
+        self._content.rebuild()
+
+    def _build_rows(self):
+        """
+        Page rows: row indices into the table, plus (label, count) group headers.
+        """
+        order = sort_rows(self._table, self._sort_column, self._sort_descending)
+        if not self._group_column:
+            return order.tolist()
+
+        rows = []
+        for label, group in group_rows(self._table, self._group_column, order):
+            rows.append((label, len(group)))
+            rows.extend(group.tolist())
+        return rows
+
+    # ---------------------- UI ----------------------
+    def _build(self):
+        stage = self.__get_stage__()
+        if not stage:
+            with self._content:
+                ui.Label("No active USD stage")
+            return
+
+        if self._table is None:
+            self._table = fetch_attribute_table(stage, self._prim_paths, self._columns, self._get_time_code())
+            self._summary_label.text = f"{len(self._table)} prims x {len(self._columns)} columns"
+
+        with self._content:
+            with ui.VStack(spacing=2, height=0):
+                with ui.HStack(height=24):
+                    self._build_header_button("Path", None, PATH_COLUMN_WIDTH)
+                    for name in self._columns:
+                        self._build_header_button(name, name, VALUE_COLUMN_WIDTH)
+                    ui.Spacer()
+                row_list = PagedListView(self._draw_row)
+                row_list.set_rows(self._build_rows())
+
+    def _build_header_button(self, text, column, width):
+        arrow = (" v" if self._sort_descending else " ^") if column == self._sort_column else ""
+        ui.Button(text + arrow, width=width, clicked_fn=lambda c=column: self._on_sort_clicked(c))
+
+    def _draw_row(self, row):
+        if isinstance(row, tuple):
+            label, count = row
+            ui.Label(f"{self._group_column} = {label}  ({count})", height=22, style={"color": 0xFF00AACC})
+            return
+
+        path = self._table.paths[row]
+        with ui.HStack(height=22):
+            ui.Button(
+                path, width=PATH_COLUMN_WIDTH,
+                clicked_fn=lambda p=path: window_manager.show(PrimPropertyWindow, p),
+                style={"background_color": 0xFF333333}, tooltip=path,
+            )
+            for name in self._columns:
+                text = format_cell(self._table, name, row)
+                ui.Label(text, width=VALUE_COLUMN_WIDTH, elided_text=True, tooltip=text)
+            ui.Spacer()
@@ -5,15 +5,27 @@ import carb.input
 from carb.input import KeyboardEventType
 
 class BaseWindow:
+    # Max windows of this kind kept by the WindowManager
+    POOL_SIZE = 1
+
+    # Live counts over all windows, see WindowManager.get_stats
+    live_windows = 0
+    live_keyboard_subscriptions = 0
+    live_stage_event_subscriptions = 0
+
     def __init__(self, title, width, height, visible = True):
         self._window = ui.Window(title=title, width=width, height=height, visible=visible)
         self.keyboard = omni.appwindow.get_default_app_window().get_keyboard()
         self.input = carb.input.acquire_input_interface()
         
+        self._stage_event_subs = []
+        BaseWindow.live_windows += 1
+
         # Subscribe to keyboard events
         self.keyboard_sub_id = self.input.subscribe_to_keyboard_events(
             self.keyboard, self.on_keyboard_event
         )
+        BaseWindow.live_keyboard_subscriptions += 1
     
     def __get_context__(self):
         return omni.usd.get_context()
@@ -25,15 +37,60 @@ class BaseWindow:
         ctx = omni.usd.get_context()
         ctx.get_selection().set_selected_prim_paths([path], False)
 
+    def __subscribe_stage_events__(self, fn, name):
+        """
+        Stage event subscription released in __destroy__.
+        """
+        sub = self.__get_context__().get_stage_event_stream().create_subscription_to_pop(fn, name=name)
+        self._stage_event_subs.append(sub)
+        BaseWindow.live_stage_event_subscriptions += 1
+        return sub
+
     def _on_stage_selection_changed(self, selection_paths):
         pass
 
     def on_keyboard_event(self, event):
         return False
     
+    # ---------------------- Pooling ----------------------
+    def retarget(self, *args):
+        """
+        Point a pooled window at a new target (same arguments as __init__).
+        Windows without a target have nothing to change.
+        """
+        pass
+
+    def show(self):
+        if self._window:
+            self._window.visible = True
+            self._window.focus()
+
+    def hide(self):
+        if self._window:
+            self._window.visible = False
+
+    def set_visibility_changed_fn(self, fn):
+        if self._window:
+            self._window.set_visibility_changed_fn(fn)
+
+    @property
+    def is_visible(self) -> bool:
+        return bool(self._window and self._window.visible)
+
     def __destroy__(self):
+        if self.keyboard_sub_id is not None:
+            self.input.unsubscribe_to_keyboard_events(self.keyboard, self.keyboard_sub_id)
+            self.keyboard_sub_id = None
+            BaseWindow.live_keyboard_subscriptions -= 1
+
+        for sub in self._stage_event_subs:
+            sub.unsubscribe()
+        BaseWindow.live_stage_event_subscriptions -= len(self._stage_event_subs)
+        self._stage_event_subs.clear()
+
         if self._window:
             self._window.visible = False
             self._window.destroy()
             self._window = None
+            BaseWindow.live_windows -= 1
         print(f"Destroyed window {self.__class__.__name__}")
\ No newline at end of file
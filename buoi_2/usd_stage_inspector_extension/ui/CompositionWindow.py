@@ -3,15 +3,39 @@ import omni.ui as ui
 import omni.usd
 from pxr import UsdGeom, UsdLux, UsdShade, Usd, Sdf, Pcp
 from .BaseWindow import BaseWindow
+from ..utils.CompositionUtils import get_layer_arc_map, summarize_prim_attributes
+from ..utils.ValueUtils import describe_value, get_time_sample_info
 
 USD_ASSET_ROOT = r"C:\omniverse\usd"
 
+# Max time samples fetched when a stack entry is expanded
+MAX_SAMPLE_ROWS = 100
+
 class PropertyStackItem(ui.AbstractItem):
-    def __init__(self, layer_id, value, is_winner=False):
+    def __init__(self, layer_id, value, is_winner=False, spec=None, sample_count=0, sample_range=None):
         super().__init__()
         self.layer_id = layer_id
         self.value = value
         self.is_winner = is_winner
+        # time samples: only count/range are known until the entry is expanded
+        self.spec = spec
+        self.sample_count = sample_count
+        self.sample_range = sample_range
+        self.samples = None
+        self.expanded = False
+
+class TimeSampleItem(ui.AbstractItem):
+    def __init__(self, label, preview):
+        super().__init__()
+        self.label = label
+        self.preview = preview
+
+class AttributeSummaryItem(ui.AbstractItem):
+    def __init__(self, attr_name, layer_id, opinion_count):
+        super().__init__()
+        self.attr_name = attr_name
+        self.layer_id = layer_id
+        self.opinion_count = opinion_count
 
 class PropertyStackModel(ui.AbstractItemModel):
     COLUMN_COUNT = 1
@@ -39,13 +63,24 @@ class PropertyStackModel(ui.AbstractItemModel):
         return None
     
 class PropertyStackDelegate(ui.AbstractItemDelegate):
+    def __init__(self, on_toggle_samples=None):
+        super().__init__()
+        self._on_toggle_samples = on_toggle_samples
+
     def build_branch(self, model, item, column_id, level, expanded):
         pass
 
     def build_widget(self, model, item, column_id, level, expanded):
         if item is None:
             return
-        
+
+        if isinstance(item, TimeSampleItem):
+            with ui.HStack(height=22):
+                ui.Spacer(width=20)
+                ui.Label(item.label, width=120, style={"color": 0xFF999999})
+                ui.Label(item.preview, alignment=ui.Alignment.LEFT, elided_text=True, tooltip=item.preview)
+            return
+
         value = model.get_item_value(item, column_id)
 
         style = {}
@@ -65,13 +100,27 @@ class PropertyStackDelegate(ui.AbstractItemDelegate):
                 elided_text=True
             )
 
-            ui.Label(
-                str(item.value),
-                width=ui.Percent(30),
-                alignment=ui.Alignment.LEFT,
-                style=style,
-                elided_text=True
-            )
+            if item.sample_count:
+                first, last = item.sample_range
+                with ui.HStack(width=ui.Percent(30)):
+                    ui.Label(
+                        f"{item.sample_count} samples [{first:g}, {last:g}]",
+                        alignment=ui.Alignment.LEFT,
+                        style=style,
+                        elided_text=True
+                    )
+                    ui.Button(
+                        "-" if item.expanded else "+", width=22,
+                        clicked_fn=lambda i=item: self._on_toggle_samples(i) if self._on_toggle_samples else None
+                    )
+            else:
+                ui.Label(
+                    describe_value(item.value),
+                    width=ui.Percent(30),
+                    alignment=ui.Alignment.LEFT,
+                    style=style,
+                    elided_text=True
+                )
 
             ui.Label(
                 "Active" if item.is_winner else "",
@@ -80,14 +129,34 @@ class PropertyStackDelegate(ui.AbstractItemDelegate):
                 style=style
             )
 
+class AttributeSummaryDelegate(ui.AbstractItemDelegate):
+    def build_branch(self, model, item, column_id, level, expanded):
+        pass
+
+    def build_widget(self, model, item, column_id, level, expanded):
+        if item is None:
+            return
+
+        with ui.HStack(height=22):
+            ui.Label(item.attr_name, width=ui.Percent(30), alignment=ui.Alignment.LEFT, elided_text=True)
+            ui.Label(item.layer_id, width=ui.Percent(60), alignment=ui.Alignment.LEFT, elided_text=True)
+            ui.Label(str(item.opinion_count), width=ui.Percent(10), alignment=ui.Alignment.CENTER)
+
 class CompositionWindow(BaseWindow):
-    def __init__(self, prim_path, attr_name):
+    """
+    attr_name=None analyzes every attribute of the prim in one pass
+    (winning layer + opinion count) instead of one property stack.
+    """
+    POOL_SIZE = 2
+
+    def __init__(self, prim_path, attr_name=None):
         self.prim_path = prim_path
         self.attr_name = attr_name
-        print("Analyze: " + self.prim_path + " - " + self.attr_name)
+        print("Analyze: " + self.prim_path + " - " + (self.attr_name or "<all attributes>"))
         super().__init__(title="Composition Viewer", width=700, height=600, visible=True)
         self.arc_model = PropertyStackModel()
-        self.delegate = PropertyStackDelegate()
+        self.delegate = PropertyStackDelegate(self._toggle_samples) if attr_name else AttributeSummaryDelegate()
+        self._stack_items = []
         with self._window.frame:
             with ui.ScrollingFrame(
                 horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
@@ -98,16 +167,34 @@ class CompositionWindow(BaseWindow):
             
         self._content.rebuild()
 
+    def retarget(self, prim_path, attr_name=None):
+        self.prim_path = prim_path
+        self.attr_name = attr_name
+        print("Analyze: " + self.prim_path + " - " + (self.attr_name or "<all attributes>"))
+        self.arc_model = PropertyStackModel()
+        self.delegate = PropertyStackDelegate(self._toggle_samples) if attr_name else AttributeSummaryDelegate()
+        self._stack_items = []
+        self._content.rebuild()
+
     def build_property_stack_header(self):
         with ui.HStack(height=24):
             ui.Label("Layer / Source", width=ui.Percent(60), style={"font-weight": "bold"})
             ui.Label("Value", width=ui.Percent(30), style={"font-weight": "bold"})
             ui.Label("*", width=ui.Percent(10), alignment=ui.Alignment.CENTER, style={"font-weight": "bold"})
 
+    def build_attribute_summary_header(self):
+        with ui.HStack(height=24):
+            ui.Label("Attribute", width=ui.Percent(30), style={"font-weight": "bold"})
+            ui.Label("Winning Layer", width=ui.Percent(60), style={"font-weight": "bold"})
+            ui.Label("#", width=ui.Percent(10), alignment=ui.Alignment.CENTER, style={"font-weight": "bold"})
+
     def _build(self):
         with self._content:
             with ui.VStack():
-                self.build_property_stack_header()
+                if self.attr_name:
+                    self.build_property_stack_header()
+                else:
+                    self.build_attribute_summary_header()
                 ui.TreeView(
                     self.arc_model,
                     delegate=self.delegate,
@@ -120,7 +207,10 @@ class CompositionWindow(BaseWindow):
                     }
                 )
 
-        self.analyze_property_stack_V2(self.prim_path, self.attr_name, self.arc_model)
+        if self.attr_name:
+            self.analyze_property_stack_V2(self.prim_path, self.attr_name, self.arc_model)
+        else:
+            self.analyze_all_attributes(self.prim_path, self.arc_model)
 
     # def collect_all_sublayers(self, layer: Sdf.Layer, result=None):
     #     if result is None:
@@ -183,10 +273,9 @@ class CompositionWindow(BaseWindow):
         prim_name = prim.GetName()
 
         # ------------------------------------------------------------
-        # 1. Query composition arcs
+        # 1. Layer -> composition arcs (cached per prim)
         # ------------------------------------------------------------
-        query = Usd.PrimCompositionQuery(prim)
-        arcs = query.GetCompositionArcs()
+        arc_map = get_layer_arc_map(stage, prim)
 
         # ------------------------------------------------------------
         # 2. Property stack (strong → weak)
@@ -195,82 +284,129 @@ class CompositionWindow(BaseWindow):
         items = []
 
         for i, spec in enumerate(prop_stack):
-            layer = spec.layer
-            layer_id = layer.identifier if layer else "N/A"
-            class_name = self.extract_class_name_from_spec(spec)
-
-            prefix = "[UNKNOWN]"
-            found_arc = False
-
-            # --------------------------------------------------------
-            # 3. Map layer -> composition arc (THÔNG QUA TARGET NODE)
-            # --------------------------------------------------------
-            for arc in arcs:
-                node = arc.GetTargetNode()
-                if not node:
-                    continue
-
-                layer_stack = node.layerStack
-                if not layer_stack or layer not in layer_stack.layers:
-                    continue
-
-                arc_type = arc.GetArcType()
-
-                if arc_type == Pcp.ArcTypeRoot and class_name != prim_name:
-                    continue
+            display_name = self._format_spec_source(stage, prim_name, arc_map, spec)
+            value = spec.default if spec.HasDefaultValue() else None
 
-                # ---------------- ARC TYPE CLASSIFICATION ----------------
+            # count + range only, sample values are loaded on expand
+            sample_count, first, last = get_time_sample_info(spec.layer, spec.path)
 
-                if arc_type == Pcp.ArcTypeRoot:
-                    if layer == stage.GetRootLayer():
-                        prefix = "[ROOT]"
-                    elif layer == stage.GetSessionLayer():
-                        prefix = "[SESSION]"
-                    else:
-                        prefix = "[SUBLAYER]"
+            items.append(
+                PropertyStackItem(
+                    layer_id=display_name,
+                    value=value,
+                    is_winner=(i == 0),
+                    spec=spec,
+                    sample_count=sample_count,
+                    sample_range=(first, last),
+                )
+            )
 
-                elif arc_type == Pcp.ArcTypeReference:
-                    prefix = "[REFERENCE]"
+        self._stack_items = items
+        model.set_data(self._flatten_stack_items())
+
+    # ----------------------- Time samples -----------------------
+    def _flatten_stack_items(self):
+        rows = []
+        for item in self._stack_items:
+            rows.append(item)
+            if item.expanded and item.samples:
+                rows.extend(item.samples)
+        return rows
+
+    def _toggle_samples(self, item: PropertyStackItem):
+        if item.samples is None:
+            item.samples = self._load_samples(item)
+        item.expanded = not item.expanded
+        self.arc_model.set_data(self._flatten_stack_items())
+
+    def _load_samples(self, item: PropertyStackItem):
+        """
+        Fetch the first MAX_SAMPLE_ROWS samples of one spec.
+        Array values are previewed through a NumPy view of the Vt buffer.
+        """
+        layer = item.spec.layer
+        path = item.spec.path
+
+        times = layer.ListTimeSamplesForPath(path)
+        rows = [
+            TimeSampleItem(f"t = {t:g}", describe_value(layer.QueryTimeSample(path, t)))
+            for t in times[:MAX_SAMPLE_ROWS]
+        ]
+        if len(times) > MAX_SAMPLE_ROWS:
+            rows.append(TimeSampleItem("...", f"{len(times) - MAX_SAMPLE_ROWS} more samples"))
+        return rows
+
+    def analyze_all_attributes(self, prim_path: str, model: PropertyStackModel):
+        stage = self.__get_stage__()
+        prim = stage.GetPrimAtPath(prim_path)
 
-                elif arc_type == Pcp.ArcTypePayload:
-                    prefix = "[PAYLOAD]"
+        if not prim or not prim.IsValid():
+            model.set_data([])
+            return
 
-                elif arc_type == Pcp.ArcTypeInherit or class_name != prim_name:
-                    prefix = f"[INHERIT] - {class_name}"
+        prim_name = prim.GetName()
+        arc_map = get_layer_arc_map(stage, prim)
+        summary = summarize_prim_attributes(prim)
+
+        items = [
+            AttributeSummaryItem(
+                attr_name=name,
+                layer_id=self._format_spec_source(stage, prim_name, arc_map, entry["winner"]),
+                opinion_count=entry["count"],
+            )
+            for name, entry in sorted(summary.items())
+        ]
+        model.set_data(items)
 
-                elif arc_type == Pcp.ArcTypeVariant:
-                    prefix = "[VARIANT]"
+    def _format_spec_source(self, stage, prim_name, arc_map, spec) -> str:
+        layer = spec.layer
+        layer_id = layer.identifier if layer else "N/A"
+        class_name = self.extract_class_name_from_spec(spec)
+
+        # --------------------------------------------------------
+        # Map layer -> composition arc (THÔNG QUA TARGET NODE)
+        # --------------------------------------------------------
+        prefix = "[OTHER]"
+        for arc_type in arc_map.get(layer_id, []):
+            if arc_type == Pcp.ArcTypeRoot and class_name != prim_name:
+                continue
+
+            # ---------------- ARC TYPE CLASSIFICATION ----------------
+
+            if arc_type == Pcp.ArcTypeRoot:
+                if layer == stage.GetRootLayer():
+                    prefix = "[ROOT]"
+                elif layer == stage.GetSessionLayer():
+                    prefix = "[SESSION]"
+                else:
+                    prefix = "[SUBLAYER]"
 
-                elif arc_type == Pcp.ArcTypeSpecialize:
-                    prefix = "[SPECIALIZE]"
+            elif arc_type == Pcp.ArcTypeReference:
+                prefix = "[REFERENCE]"
 
-                else:
-                    prefix = f"[{arc_type}]"
+            elif arc_type == Pcp.ArcTypePayload:
+                prefix = "[PAYLOAD]"
 
-                found_arc = True
-                break
+            elif arc_type == Pcp.ArcTypeInherit or class_name != prim_name:
+                prefix = f"[INHERIT] - {class_name}"
 
-            if not found_arc:
-                prefix = "[OTHER]"
+            elif arc_type == Pcp.ArcTypeVariant:
+                prefix = "[VARIANT]"
 
-            formatted_layer_id = (
-                layer_id
-                .replace("file:/", "")
-                .replace("/", "\\")
-            )
+            elif arc_type == Pcp.ArcTypeSpecialize:
+                prefix = "[SPECIALIZE]"
 
-            display_name = f"{prefix} {formatted_layer_id}"
-            value = spec.default if spec.HasDefaultValue() else None
+            else:
+                prefix = f"[{arc_type}]"
+            break
 
-            items.append(
-                PropertyStackItem(
-                    layer_id=display_name,
-                    value=value,
-                    is_winner=(i == 0),
-                )
-            )
+        formatted_layer_id = (
+            layer_id
+            .replace("file:/", "")
+            .replace("/", "\\")
+        )
 
-        model.set_data(items)
+        return f"{prefix} {formatted_layer_id}"
 
     # def analyze_property_stack(self, prim_path: str, attr_name: str, model: PropertyStackModel):
     #     stage = self.__get_stage__()
@@ -1,14 +1,41 @@
 import os
+import time
 import omni.ui as ui
 import omni.usd
+import omni.kit.app
 from pxr import UsdGeom, UsdLux, UsdShade, Usd, Sdf
 from .BaseWindow import BaseWindow
-
-USD_ASSET_ROOT = r"C:\omniverse\usd"
+from ..utils.DependencyUtils import (
+    ARC_TYPES,
+    ArcIndex,
+    ArcRecord,
+    AsyncLayerGraphBuilder,
+    LayerDependencyGraph,
+    build_arc_index,
+    cache_layer_dependency_graph,
+    find_cached_layer_dependency_graph,
+)
+from ..utils.DependencySnapshotUtils import write_snapshot_json, write_snapshot_dot
+from .PagedListView import PagedListView
+
+# Layers opened concurrently while discovering the graph
+MAX_LAYER_OPEN_WORKERS = 8
+# Min seconds between two UI rebuilds while nodes stream in
+STREAM_REBUILD_INTERVAL = 0.25
 
 class DependencyGraphWindow(BaseWindow):
     def __init__(self):
         super().__init__(title="USD Dependency Graph", width=700, height=600, visible=True)
+        self._rebuild_graph = False
+        self._builder = None
+        self._update_sub = None
+        self._last_stream_rebuild = 0.0
+
+        # Prim composition table
+        self._arc_index = None
+        self._arc_type_list = [""] + ARC_TYPES
+        self._arc_type_model = ui.SimpleIntModel(0)
+        self._arc_target_model = ui.SimpleStringModel("")
 
         with self._window.frame:
             with ui.ScrollingFrame(
@@ -18,6 +45,64 @@ class DependencyGraphWindow(BaseWindow):
                 self._content = ui.Frame()
                 self._content.set_build_fn(self._build)
 
+    def _on_refresh_clicked(self):
+        self._cancel_builder()
+        self._rebuild_graph = True
+        self._arc_index = None
+        self._content.rebuild()
+
+    # ----------------------------
+    # BACKGROUND GRAPH DISCOVERY
+    # ----------------------------
+    def _get_layer_graph(self, root_layer: Sdf.Layer) -> LayerDependencyGraph:
+        """
+        Cached graph if any, otherwise the (partial) graph of a running
+        background build, started on demand.
+        """
+        if self._builder:
+            return self._builder.graph
+
+        graph = None if self._rebuild_graph else find_cached_layer_dependency_graph(root_layer)
+        self._rebuild_graph = False
+        if graph:
+            return graph
+
+        self._builder = AsyncLayerGraphBuilder(root_layer, MAX_LAYER_OPEN_WORKERS)
+        self._builder.start()
+        self._update_sub = omni.kit.app.get_app().get_update_event_stream().create_subscription_to_pop(
+            self._on_update, name="DependencyGraphWindow layer discovery"
+        )
+        return self._builder.graph
+
+    def _on_update(self, event):
+        builder = self._builder
+        if not builder:
+            return
+
+        added = builder.poll()
+        if builder.done:
+            if not builder.cancelled:
+                cache_layer_dependency_graph(builder.graph)
+            self._builder = None
+            self._update_sub = None
+            self._content.rebuild()
+            return
+
+        now = time.perf_counter()
+        if added and now - self._last_stream_rebuild >= STREAM_REBUILD_INTERVAL:
+            self._last_stream_rebuild = now
+            self._content.rebuild()
+
+    def _cancel_builder(self):
+        if self._builder:
+            self._builder.cancel()
+        self._builder = None
+        self._update_sub = None
+
+    def _on_cancel_clicked(self):
+        self._cancel_builder()
+        self._content.rebuild()
+
     def _build(self):
         ctx = self.__get_context__()
         stage = self.__get_stage__()
@@ -30,9 +115,19 @@ class DependencyGraphWindow(BaseWindow):
         with self._content: 
             with ui.VStack(spacing=6):
                 # 1. LAYER STACK
-                ui.Label("Layer Stack", style={"font_size": 16})
                 root_layer = self.__get_stage__().GetRootLayer()
-                self._draw_layer_recursive(root_layer, indent=0)
+                graph = self._get_layer_graph(root_layer)
+
+                with ui.HStack(height=24):
+                    ui.Label("Layer Dependencies", style={"font_size": 16})
+                    if self._builder:
+                        ui.Label(f"Resolving... {self._builder.resolved_count} / {self._builder.discovered_count} layers")
+                        ui.Button("Cancel", width=80, clicked_fn=self._on_cancel_clicked)
+                    else:
+                        ui.Label(f"{len(graph.nodes)} layers, {len(graph.cycles)} cycles")
+                        ui.Button("Refresh", width=80, clicked_fn=self._on_refresh_clicked)
+                        ui.Button("Export Snapshot", width=110, clicked_fn=lambda g=graph: self._export_snapshot(g))
+                self._draw_layer_graph(graph)
 
                 ui.Separator()
                 
@@ -42,81 +137,100 @@ class DependencyGraphWindow(BaseWindow):
     # ----------------------------
     # LAYER DEPENDENCY GRAPH
     # ----------------------------
-    def _draw_layer_recursive(self, layer: Sdf.Layer, indent: int):
-        with ui.HStack():
-            ui.Spacer(width=indent * 20)
-            ui.Label(layer.identifier)
-
-        for sub_path in layer.subLayerPaths:
-            if os.path.isabs(sub_path):
-                full_path = sub_path
-            else:
-                full_path = os.path.join(USD_ASSET_ROOT, sub_path)
-            
-            # In ra để kiểm tra (DEBUG)
-            print(f"DEBUG: Trying to open layer at: {full_path}")
-
-            sub_layer = Sdf.Layer.FindOrOpen(full_path)
-            if sub_layer:
-                self._draw_layer_recursive(sub_layer, indent + 1)
+    def _draw_layer_graph(self, graph: LayerDependencyGraph):
+        """
+        DFS over the memoized graph: each layer is expanded once,
+        repeated layers and cycle edges are only labelled.
+        """
+        shown = set()
+        stack = [(graph.root, "", 0, None)]
+        while stack:
+            key, arc, indent, parent = stack.pop()
+            node = graph.nodes.get(key)
+            prefix = f"[{arc.upper()}] " if arc else ""
+
+            with ui.HStack():
+                ui.Spacer(width=indent * 20)
+                if parent is not None and graph.is_back_edge(parent, key):
+                    ui.Label(f"{prefix}{key} (cycle)", style={"color": 0xFF5555FF})
+                    continue
+                if key in shown:
+                    ui.Label(f"{prefix}{key} (see above)", style={"color": 0xFF888888})
+                    continue
+                if node is None:
+                    status = "resolving..." if self._builder else "not resolved"
+                    ui.Label(f"{prefix}{key} ({status})", style={"color": 0xFF888888})
+                    continue
+                if node.error:
+                    ui.Label(f"{prefix}{key} ({node.error})", style={"color": 0xFF5555FF})
+                    continue
+                ui.Label(f"{prefix}{node.identifier}")
+
+            shown.add(key)
+            for edge in reversed(node.edges):
+                stack.append((edge.target, edge.arc, indent + 1, key))
 
     # ----------------------------
-    # PRIM DEPENDENCY GRAPH
+    # PRIM COMPOSITION (spec level)
     # ----------------------------
-    def _has_composition_arc(self, prim: Usd.Prim) -> bool:
-        return (
-            bool(prim.GetInherits().GetAllDirectInherits())
-            or bool(prim.GetMetadata("references"))
-            or bool(prim.GetMetadata("payload"))
-            or bool(prim.GetVariantSets().GetNames())
-        )
-    
-    def _draw_prim_dependencies(self):
-        with ui.VStack(spacing=4):
-            for prim in self.__get_stage__().Traverse():
-                if not prim.IsValid():
-                    continue
-
-                if not self._has_composition_arc(prim):
-                    continue
-                self._draw_prim_node(prim)
+    def _get_arc_index(self) -> ArcIndex:
+        if self._arc_index is None:
+            self._arc_index = build_arc_index(self.__get_stage__().GetUsedLayers())
+        return self._arc_index
 
-    def _draw_prim_node(self, prim: Usd.Prim):
-        with ui.VStack(spacing=2):
-            ui.Label(
-                f"{prim.GetPath()} ({prim.GetTypeName()})",
-                style={"font_size": 14}
-            )
-            self._draw_composition_arcs(prim, indent=1)
+    def _draw_prim_dependencies(self):
+        arc_index = self._get_arc_index()
+        with ui.VStack(spacing=4, height=0):
+            with ui.HStack(height=24, spacing=6):
+                ui.Label("Arc:", width=30)
+                self._arc_type_combo = ui.ComboBox(
+                    self._arc_type_model.as_int,
+                    *self._arc_type_list,
+                    width=120
+                )
+                ui.Label("Target:", width=50)
+                self._arc_target_field = ui.StringField(self._arc_target_model, width=300)
+                ui.Button("Filter", width=60, clicked_fn=self._apply_arc_filter)
+                ui.Label(f"{len(arc_index)} arcs")
+
+            with ui.HStack(height=22):
+                ui.Label("Prim", width=ui.Percent(35), style={"font-weight": "bold"})
+                ui.Label("Arc", width=ui.Percent(10), style={"font-weight": "bold"})
+                ui.Label("Target", width=ui.Percent(35), style={"font-weight": "bold"})
+                ui.Label("Layer", width=ui.Percent(20), style={"font-weight": "bold"})
+            self._arc_list = PagedListView(self._draw_arc_record)
+        self._apply_arc_filter()
+
+    def _apply_arc_filter(self):
+        arc_type_index = self._arc_type_combo.model.get_item_value_model().get_value_as_int()
+        self._arc_type_model.set_value(arc_type_index)
+        arc = self._arc_type_list[arc_type_index]
+        target = self._arc_target_model.get_value_as_string()
+        self._arc_list.set_rows(self._get_arc_index().query(arc or None, target or None))
+
+    def _draw_arc_record(self, record: ArcRecord):
+        with ui.HStack(height=22):
+            ui.Label(record.prim_path, width=ui.Percent(35), elided_text=True, tooltip=record.prim_path)
+            ui.Label(record.arc, width=ui.Percent(10))
+            ui.Label(record.target, width=ui.Percent(35), elided_text=True, tooltip=record.target)
+            ui.Label(record.layer, width=ui.Percent(20), elided_text=True, tooltip=record.layer)
 
     # ----------------------------
-    # COMPOSITION ARCS
+    # SNAPSHOT
     # ----------------------------
-    def _draw_composition_arcs(self, prim: Usd.Prim, indent: int):
-        # Inherits
-        for path in prim.GetInherits().GetAllDirectInherits():
-            self._draw_arc("Inherits", path, indent)
-
-        # References (via metadata)
-        refs = prim.GetMetadata("references")
-        if refs:
-            for ref in refs.GetAddedOrExplicitItems():
-                self._draw_arc("Reference", ref.assetPath, indent)
-
-        # Payloads (via metadata)
-        payload = prim.GetMetadata("payload")
-        if payload:
-            for p in payload.GetAddedOrExplicitItems():
-                self._draw_arc("Payload", p.assetPath, indent)
-
-        # Variants
-        vsets = prim.GetVariantSets()
-        for name in vsets.GetNames():
-            vs = vsets.GetVariantSet(name)
-            sel = vs.GetVariantSelection()
-            self._draw_arc(f"Variant {name}", sel, indent)
-
-    def _draw_arc(self, label: str, value: str, indent: int):
-        with ui.HStack():
-            ui.Spacer(width=indent * 20)
-            ui.Label(f"{label}: {value}")
\ No newline at end of file
+    def _export_snapshot(self, graph: LayerDependencyGraph):
+        file_path = "../outputs/dependency_snapshot"
+        folder = os.path.dirname(file_path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder, exist_ok=True)
+
+        with open(file_path + ".json", "w") as f:
+            write_snapshot_json(graph, self._get_arc_index(), f)
+        with open(file_path + ".dot", "w") as f:
+            write_snapshot_dot(graph, f)
+
+        print(f"Exported dependency snapshot to {os.path.abspath(file_path)}.json/.dot")
+
+    def __destroy__(self):
+        self._cancel_builder()
+        super().__destroy__()
\ No newline at end of file
@@ -0,0 +1,72 @@
+import omni.ui as ui
+import omni.usd
+from .BaseWindow import BaseWindow
+from .PagedListView import PagedListView
+from ..utils.InstanceUtils import find_duplicate_subtrees, DuplicateGroup
+
+
+class InstanceAdvisorWindow(BaseWindow):
+    """
+    on_show_paths(paths): called with a group's prim paths, e.g.
+    StageInspectorWindow.show_prim_paths to list them in the inspector.
+    """
+    def __init__(self, on_show_paths=None):
+        super().__init__(title="Instancing Advisor", width=800, height=600, visible=True)
+        self._on_show_paths = on_show_paths
+        self._groups = None
+
+        with self._window.frame:
+            with ui.VStack(spacing=6, style={"padding": 8}):
+                with ui.HStack(height=28, spacing=8):
+                    ui.Button("Analyze", width=80, clicked_fn=self._refresh)
+                    self._summary_label = ui.Label("")
+                with ui.ScrollingFrame(
+                    horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
+                    vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
+                ):
+                    self._content = ui.Frame()
+                    self._content.set_build_fn(self._build)
+
+    def retarget(self, on_show_paths=None):
+        self._on_show_paths = on_show_paths
+
+    def _refresh(self):
+        self._groups = None
+        self._content.rebuild()
+
+    def _build(self):
+        stage = self.__get_stage__()
+        if not stage:
+            with self._content:
+                ui.Label("No active USD stage")
+            return
+
+        if self._groups is None:
+            self._groups = find_duplicate_subtrees(stage)
+            total = sum(g.estimated_saving for g in self._groups)
+            self._summary_label.text = (
+                f"{len(self._groups)} duplicate groups, ~{total / (1024.0 * 1024.0):.1f} MB could be saved"
+            )
+
+        with self._content:
+            with ui.VStack(spacing=2, height=0):
+                with ui.HStack(height=22):
+                    ui.Label("Example", width=ui.Percent(45), style={"font-weight": "bold"})
+                    ui.Label("Copies", width=ui.Percent(10), style={"font-weight": "bold"})
+                    ui.Label("Prims/copy", width=ui.Percent(12), style={"font-weight": "bold"})
+                    ui.Label("Saving (MB)", width=ui.Percent(13), style={"font-weight": "bold"})
+                    ui.Spacer()
+                group_list = PagedListView(self._draw_group, page_size=100)
+                group_list.set_rows(self._groups)
+
+    def _draw_group(self, group: DuplicateGroup):
+        example = group.paths[0]
+        with ui.HStack(height=24):
+            ui.Label(example, width=ui.Percent(45), elided_text=True, tooltip="\n".join(group.paths[:20]))
+            ui.Label(str(len(group.paths)), width=ui.Percent(10))
+            ui.Label(str(group.prim_count), width=ui.Percent(12))
+            ui.Label(f"{group.estimated_saving / (1024.0 * 1024.0):.2f}", width=ui.Percent(13))
+            ui.Button(
+                "Show", width=70, enabled=self._on_show_paths is not None,
+                clicked_fn=lambda g=group: self._on_show_paths(g.paths)
+            )
@@ -0,0 +1,175 @@
+import os
+import time
+import omni.ui as ui
+import omni.usd
+import omni.kit.app
+from .BaseWindow import BaseWindow
+from .PagedListView import PagedListView
+from ..utils.LayerProfilerUtils import AsyncLayerProfiler, rank_layer_profile, write_layer_profile
+
+# column key, header, width %
+_COLUMNS = [
+    ("identifier", "Layer", 40),
+    ("format", "Format", 8),
+    ("file_size", "Size (KB)", 10),
+    ("spec_count", "Specs", 10),
+    ("time_samples", "Samples", 10),
+    ("reopen_ms", "Reopen (ms)", 12),
+    ("share", "%", 10),
+]
+# Min seconds between two UI rebuilds while rows stream in
+STREAM_REBUILD_INTERVAL = 0.25
+
+
+class LayerProfilerWindow(BaseWindow):
+    def __init__(self):
+        super().__init__(title="Layer Load Profiler", width=900, height=600, visible=True)
+        self._rows = None
+        self._sort_key = "reopen_ms"
+        self._sort_descending = True
+        self._profiler = None
+        self._update_sub = None
+        self._cancelled = False
+        self._last_stream_rebuild = 0.0
+
+        with self._window.frame:
+            with ui.VStack(spacing=6, style={"padding": 8}):
+                with ui.HStack(height=28, spacing=8):
+                    ui.Button("Profile", width=80, clicked_fn=self._refresh)
+                    ui.Button("Cancel", width=80, clicked_fn=self._on_cancel_clicked)
+                    ui.Button("Export", width=80, clicked_fn=self._export_report)
+                    self._summary_label = ui.Label("")
+                with ui.ScrollingFrame(
+                    horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
+                    vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
+                ):
+                    self._content = ui.Frame()
+                    self._content.set_build_fn(self._build)
+
+    def _refresh(self):
+        self._cancel_profiler()
+        self._rows = None
+        self._content.rebuild()
+
+    # ----------------------------
+    # BACKGROUND PROFILING
+    # ----------------------------
+    def _start_profiler(self, stage):
+        self._cancelled = False
+        self._profiler = AsyncLayerProfiler(stage)
+        self._profiler.start()
+        self._rows = self._profiler.rows
+        self._update_sub = omni.kit.app.get_app().get_update_event_stream().create_subscription_to_pop(
+            self._on_update, name="LayerProfilerWindow reopen pass"
+        )
+
+    def _on_update(self, event):
+        profiler = self._profiler
+        if not profiler:
+            return
+
+        added = profiler.poll()
+        if profiler.done:
+            self._profiler = None
+            self._update_sub = None
+            self._content.rebuild()
+            return
+
+        now = time.perf_counter()
+        if added and now - self._last_stream_rebuild >= STREAM_REBUILD_INTERVAL:
+            self._last_stream_rebuild = now
+            self._content.rebuild()
+
+    def _cancel_profiler(self):
+        if self._profiler:
+            self._profiler.cancel()
+            # keep the rows profiled so far
+            rank_layer_profile(self._rows)
+            self._cancelled = True
+        self._profiler = None
+        self._update_sub = None
+
+    def _on_cancel_clicked(self):
+        if self._profiler:
+            self._cancel_profiler()
+            self._content.rebuild()
+
+    def _on_sort_clicked(self, key):
+        if key == self._sort_key:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_key = key
+            self._sort_descending = key != "identifier"
+        self._content.rebuild()
+
+    def _build(self):
+        stage = self.__get_stage__()
+        if not stage:
+            with self._content:
+                ui.Label("No active USD stage")
+            return
+
+        if self._rows is None:
+            self._start_profiler(stage)
+
+        total_ms = sum(r["reopen_ms"] for r in self._rows)
+        errors = sum(1 for r in self._rows if r["error"])
+        if self._profiler:
+            self._summary_label.text = f"Profiling... {len(self._rows)} layers, {total_ms:.1f} ms reopen so far"
+        else:
+            hot = [r for r in self._rows if r["hot"]]
+            self._summary_label.text = (
+                f"{len(self._rows)} layers, {total_ms:.1f} ms total reopen, "
+                f"{len(hot)} layers make up 80%"
+                + (f", {errors} failed (red)" if errors else "")
+                + (" (cancelled)" if self._cancelled else "")
+            )
+
+        rows = sorted(self._rows, key=lambda r: r.get(self._sort_key, 0.0), reverse=self._sort_descending)
+
+        with self._content:
+            with ui.VStack(spacing=2, height=0):
+                with ui.HStack(height=24):
+                    for key, header, width in _COLUMNS:
+                        arrow = (" v" if self._sort_descending else " ^") if key == self._sort_key else ""
+                        ui.Button(
+                            header + arrow, width=ui.Percent(width),
+                            clicked_fn=lambda k=key: self._on_sort_clicked(k)
+                        )
+                layer_list = PagedListView(self._draw_row)
+                layer_list.set_rows(rows)
+
+    def _draw_row(self, row):
+        # share / hot are set once the profile is complete
+        if row["error"]:
+            style = {"color": 0xFF5555FF}
+        elif row.get("hot"):
+            style = {"color": 0xFF5599FF}
+        else:
+            style = {}
+        values = {
+            "identifier": row["identifier"],
+            "format": row["format"],
+            "file_size": f"{row['file_size'] / 1024.0:.1f}",
+            "spec_count": str(row["spec_count"]),
+            "time_samples": str(row["time_samples"]),
+            "reopen_ms": f"{row['reopen_ms']:.2f}",
+            "share": f"{row['share'] * 100.0:.1f}" if "share" in row else "",
+        }
+        with ui.HStack(height=22):
+            for key, _, width in _COLUMNS:
+                tooltip = row["error"] or values[key]
+                ui.Label(values[key], width=ui.Percent(width), style=style, elided_text=True, tooltip=tooltip)
+
+    def _export_report(self):
+        if not self._rows or self._profiler:
+            print("No profile to export.")
+            return
+
+        file_path = "../outputs/layer_profile.json"
+        write_layer_profile(self._rows, file_path)
+        print(f"Exported layer profile to {os.path.abspath(file_path)}")
+
+    def __destroy__(self):
+        self._cancel_profiler()
+        super().__destroy__()
@@ -0,0 +1,102 @@
+import os
+import omni.ui as ui
+import omni.usd
+from .BaseWindow import BaseWindow
+from .PrimPropertyWindow import PrimPropertyWindow
+from .CompositionWindow import CompositionWindow
+from .WindowManager import window_manager
+from ..utils.OpinionUtils import build_opinion_heat_map, write_opinion_report
+
+
+class OpinionHeatMapWindow(BaseWindow):
+    def __init__(self, top_n=50):
+        super().__init__(title="Opinion Heat Map", width=800, height=600, visible=True)
+        self._top_n = top_n
+        self._report = None
+
+        with self._window.frame:
+            with ui.VStack(spacing=6, style={"padding": 8}):
+                with ui.HStack(height=28, spacing=8):
+                    ui.Button("Refresh", width=80, clicked_fn=self._refresh)
+                    ui.Button("Export", width=80, clicked_fn=self._export_report)
+                    ui.Spacer()
+                with ui.ScrollingFrame(
+                    horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
+                    vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
+                ):
+                    self._content = ui.Frame()
+                    self._content.set_build_fn(self._build)
+
+    def _refresh(self):
+        self._report = None
+        self._content.rebuild()
+
+    def _build(self):
+        stage = self.__get_stage__()
+        if not stage:
+            with self._content:
+                ui.Label("No active USD stage")
+            return
+
+        if self._report is None:
+            self._report = build_opinion_heat_map(stage, self._top_n)
+        report = self._report
+
+        with self._content:
+            with ui.VStack(spacing=2):
+                ui.Label(
+                    f"{report['total_layers']} layers, {report['total_prim_paths']} prim paths",
+                    height=22
+                )
+
+                # ----- HEAVIEST LAYERS -----
+                ui.Label("Heaviest Layers", style={"color": 0xFF00AACC, "font_size": 16})
+                with ui.HStack(height=22):
+                    ui.Label("Layer", width=ui.Percent(70), style={"font-weight": "bold"})
+                    ui.Label("Prim specs", width=ui.Percent(15), style={"font-weight": "bold"})
+                    ui.Label("Property specs", width=ui.Percent(15), style={"font-weight": "bold"})
+                for entry in report["layers"]:
+                    with ui.HStack(height=22):
+                        ui.Label(entry["identifier"], width=ui.Percent(70), elided_text=True, tooltip=entry["identifier"])
+                        ui.Label(str(entry["prim_specs"]), width=ui.Percent(15))
+                        ui.Label(str(entry["property_specs"]), width=ui.Percent(15))
+
+                ui.Separator(height=2)
+
+                # ----- MOST OVERRIDDEN PRIMS -----
+                ui.Label("Most Overridden Prims", style={"color": 0xFF00AACC, "font_size": 16})
+                with ui.HStack(height=22):
+                    ui.Label("Path", width=ui.Percent(50), style={"font-weight": "bold"})
+                    ui.Label("Layers", width=ui.Percent(10), style={"font-weight": "bold"})
+                    ui.Label("Property specs", width=ui.Percent(15), style={"font-weight": "bold"})
+                    ui.Spacer()
+                for entry in report["prims"]:
+                    # stage_path: composed prim the specs map to; layer: set when they map to none
+                    path = entry["stage_path"]
+                    on_stage = bool(path and stage.GetPrimAtPath(path))
+                    if entry["layer"]:
+                        label = f"{entry['path']} ({os.path.basename(entry['layer'])})"
+                        tooltip = f"{entry['path']} in {entry['layer']}, not used by any stage prim"
+                    else:
+                        label = tooltip = entry["path"]
+                    with ui.HStack(height=24):
+                        ui.Label(label, width=ui.Percent(50), elided_text=True, tooltip=tooltip)
+                        ui.Label(str(entry["layer_count"]), width=ui.Percent(10))
+                        ui.Label(str(entry["property_specs"]), width=ui.Percent(15))
+                        ui.Button(
+                            "Inspect", width=70, enabled=on_stage,
+                            clicked_fn=lambda p=path: window_manager.show(PrimPropertyWindow, p)
+                        )
+                        ui.Button(
+                            "Analyze", width=70, enabled=on_stage,
+                            clicked_fn=lambda p=path: window_manager.show(CompositionWindow, p)
+                        )
+
+    def _export_report(self):
+        if self._report is None:
+            print("No report to export.")
+            return
+
+        file_path = "../outputs/opinion_heat_map.json"
+        write_opinion_report(self._report, file_path)
+        print(f"Exported opinion heat map to {os.path.abspath(file_path)}")
@@ -0,0 +1,55 @@
+import omni.ui as ui
+from typing import Callable, List
+
+
+class PagedListView:
+    """
+    Only builds the widgets of the current page, so the widget count stays
+    bounded by page_size whatever the number of rows.
+    """
+
+    def __init__(self, build_row_fn: Callable, page_size: int = 200):
+        self._build_row_fn = build_row_fn
+        self._page_size = page_size
+        self._rows: List = []
+        self._page = 0
+
+        with ui.VStack(spacing=2, height=0):
+            with ui.HStack(height=24, spacing=6):
+                ui.Button("<", width=30, clicked_fn=lambda: self._go_to_page(self._page - 1))
+                ui.Button(">", width=30, clicked_fn=lambda: self._go_to_page(self._page + 1))
+                self._page_label = ui.Label("")
+            self._frame = ui.Frame(height=0)
+            self._frame.set_build_fn(self._build_page)
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self._rows) // self._page_size))
+
+    def set_rows(self, rows: List):
+        self._rows = rows
+        self._page = 0
+        self._frame.rebuild()
+
+    def refresh(self):
+        """
+        Rebuild the current page (e.g. after a row's state changed).
+        """
+        self._frame.rebuild()
+
+    def _go_to_page(self, page: int):
+        page = max(0, min(page, self.page_count - 1))
+        if page == self._page:
+            return
+        self._page = page
+        self._frame.rebuild()
+
+    def _build_page(self):
+        start = self._page * self._page_size
+        end = min(start + self._page_size, len(self._rows))
+        self._page_label.text = f"{start + 1 if self._rows else 0}-{end} of {len(self._rows)}  (page {self._page + 1}/{self.page_count})"
+
+        with self._frame:
+            with ui.VStack(spacing=2, height=0):
+                for row in self._rows[start:end]:
+                    self._build_row_fn(row)
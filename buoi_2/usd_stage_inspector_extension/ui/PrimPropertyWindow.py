@@ -1,13 +1,33 @@
 import omni.ui as ui
 import omni.usd
-from pxr import UsdGeom, UsdLux, UsdShade, Usd
+import omni.kit.app
+from pxr import UsdGeom, UsdLux, UsdShade, Usd, Sdf, Tf, Gf
 from .BaseWindow import BaseWindow
 from .CompositionWindow import CompositionWindow
+from .WindowManager import window_manager
+from ..utils.ValueUtils import describe_value, is_array_value
+from ..utils.MeshUtils import get_mesh_diagnostics
+from ..utils.SpatialUtils import get_world_transform, get_world_bounds, format_vec3
 
 class PrimPropertyWindow(BaseWindow):
+    POOL_SIZE = 4
+
     def __init__(self, prim_path: str):
         super().__init__(title=f"Prim Properties - {prim_path}", width=500, height=600, visible=True)
         self._prim_path = prim_path
+        # attr name -> row frame, rebuilt on its own when expanded/collapsed
+        self._attr_frames = {}
+        self._expanded_attrs = set()
+        self._type_frame = None
+        self._show_world_model = ui.SimpleBoolModel(False)
+        self._show_world_model.add_value_changed_fn(lambda _: self._type_frame and self._type_frame.rebuild())
+
+        # Live updates: changes are collected from notices and applied once per frame
+        self._listener = None
+        self._listened_stage = None
+        self._update_sub = None
+        self._pending_attrs = set()
+        self._pending_full_rebuild = False
 
         with self._window.frame:
             with ui.ScrollingFrame(
@@ -18,7 +38,9 @@ class PrimPropertyWindow(BaseWindow):
                 self._content.set_build_fn(self._build)
 
     def _build(self):
-        prim = self.__get_stage__().GetPrimAtPath(self._prim_path)
+        stage = self.__get_stage__()
+        self._listen_to_stage(stage)
+        prim = stage.GetPrimAtPath(self._prim_path) if stage else None
         if not prim:
             with self._content:
                 ui.Label("Prim not found")
@@ -32,21 +54,44 @@ class PrimPropertyWindow(BaseWindow):
                 ui.Label(f"Name: {prim.GetName()}", style={"font_weight": "bold"})
                 ui.Label(f"Type: {prim.GetTypeName()}")
                 ui.Label(f"Active: {prim.IsActive()}")
+                selections = prim.GetVariantSets().GetAllVariantSelections()
+                if selections:
+                    with ui.HStack(height=22):
+                        ui.Label("Variants: " + ", ".join(f"{k}={v}" for k, v in selections.items()), elided_text=True)
+                        ui.Button("Sweep variants", height=22, width=110, clicked_fn=self._on_sweep_variants_clicked)
+                with ui.HStack(height=22):
+                    ui.CheckBox(model=self._show_world_model, width=20)
+                    ui.Label("World transform and bounds")
                 ui.Separator(height=2)
 
                 # ----- ATTRIBUTES -----
-                ui.Label("Attributes", style={"color": 0xFF00AACC, "font_size": 18})
+                with ui.HStack(height=22):
+                    ui.Label("Attributes", style={"color": 0xFF00AACC, "font_size": 18})
+                    ui.Button("Analyze All", height=22, width=90, clicked_fn=self._on_analyze_clicked(None))
+                self._attr_frames.clear()
                 with ui.VStack(spacing=2):
                     for attr in prim.GetAttributes():
-                        val = attr.Get()
-                        with ui.HStack(height=22):
-                            ui.Label(attr.GetName(), width=180, style={"color": 0xFFCCCCCC})
-                            ui.Label(str(val), style={"color": 0xFFAAAAFF})
-                            ui.Button("Analyze Composition", height=25, width=60, clicked_fn=self._on_analyze_clicked(attr.GetName()))
+                        name = attr.GetName()
+                        frame = ui.Frame(height=0)
+                        frame.set_build_fn(lambda n=name: self._build_attr_row(n))
+                        self._attr_frames[name] = frame
 
                 ui.Separator(height=2)
 
                 # ----- TYPE SPECIFIC -----
+                self._type_frame = ui.Frame(height=0)
+                self._type_frame.set_build_fn(self._build_type_specific)
+
+    def _build_type_specific(self):
+        prim = self.__get_stage__().GetPrimAtPath(self._prim_path)
+        if not prim:
+            return
+
+        with self._type_frame:
+            with ui.VStack(spacing=2, height=0):
+                if self._show_world_model.get_value_as_bool():
+                    self._build_world_space(prim)
+
                 prim_type = prim.GetTypeName()
                 if prim_type == "Xform":
                     self._build_xform(prim)
@@ -59,7 +104,145 @@ class PrimPropertyWindow(BaseWindow):
                 elif prim_type == "Material":
                     self._build_material(prim)
 
+    def _build_attr_row(self, attr_name):
+        """
+        Preview only. Array values are not read until the row is expanded,
+        the collapsed row shows the type and time-sample count; scalars
+        show a truncated value. The full value is stringified when expanded.
+        """
+        frame = self._attr_frames.get(attr_name)
+        prim = self.__get_stage__().GetPrimAtPath(self._prim_path)
+        if not frame or not prim:
+            return
+
+        attr = prim.GetAttribute(attr_name)
+        expanded = attr_name in self._expanded_attrs
+        is_array = attr.GetTypeName().isArray
+        if is_array and not expanded:
+            val = None
+            preview = self._describe_unread_array(attr)
+        else:
+            val = attr.Get()
+            preview = describe_value(val)
+        # arrays and truncated scalars have more to show
+        expandable = is_array or is_array_value(val) or preview.endswith("...")
+
+        with frame:
+            with ui.VStack(height=0):
+                with ui.HStack(height=22):
+                    ui.Label(attr_name, width=180, style={"color": 0xFFCCCCCC})
+                    ui.Label(str(attr.GetTypeName()), width=90, style={"color": 0xFF888888})
+                    ui.Label(preview, style={"color": 0xFFAAAAFF}, elided_text=True)
+                    if expandable:
+                        ui.Button("-" if expanded else "+", width=22, clicked_fn=lambda n=attr_name: self._toggle_attr_expanded(n))
+                    ui.Button("Analyze Composition", height=25, width=60, clicked_fn=self._on_analyze_clicked(attr_name))
+                if expanded:
+                    ui.Label(str(val), word_wrap=True, style={"color": 0xFFAAAAFF})
+
+    @staticmethod
+    def _describe_unread_array(attr) -> str:
+        if not attr.HasValue():
+            return "None"
+        # the type column already names the element type
+        samples = attr.GetNumTimeSamples()
+        return f"array, {samples} time samples (expand to read)" if samples else "array (expand to read)"
+
+    def _toggle_attr_expanded(self, attr_name):
+        if attr_name in self._expanded_attrs:
+            self._expanded_attrs.discard(attr_name)
+        else:
+            self._expanded_attrs.add(attr_name)
+        self._attr_frames[attr_name].rebuild()
+
+    def retarget(self, prim_path: str):
+        self._prim_path = prim_path
+        self._window.title = f"Prim Properties - {prim_path}"
+        self._expanded_attrs.clear()
+        self._pending_attrs.clear()
+        self._pending_full_rebuild = False
+        self._content.rebuild()
+
+    # ---------- LIVE UPDATES ----------
+    def _listen_to_stage(self, stage):
+        if stage == self._listened_stage and self._listener:
+            return
+
+        self._stop_listening()
+        if stage:
+            self._listened_stage = stage
+            self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def _stop_listening(self):
+        if self._listener:
+            self._listener.Revoke()
+        self._listener = None
+        self._listened_stage = None
+        self._update_sub = None
+        self._pending_attrs.clear()
+        self._pending_full_rebuild = False
+
+    def _on_objects_changed(self, notice, sender):
+        """
+        Only record what changed on this prim, the UI is touched in _on_update.
+        """
+        prim_path = Sdf.Path(self._prim_path)
+
+        for path in notice.GetResyncedPaths():
+            # resync of the prim, an ancestor, or an added/removed property
+            if prim_path.HasPrefix(path) or path.GetPrimPath() == prim_path:
+                self._pending_full_rebuild = True
+
+        if not self._pending_full_rebuild:
+            for path in notice.GetChangedInfoOnlyPaths():
+                if path.GetPrimPath() != prim_path:
+                    continue
+                if path.IsPropertyPath():
+                    self._pending_attrs.add(path.name)
+                else:
+                    # prim metadata
+                    self._pending_full_rebuild = True
+
+        if (self._pending_full_rebuild or self._pending_attrs) and not self._update_sub:
+            self._update_sub = omni.kit.app.get_app().get_update_event_stream().create_subscription_to_pop(
+                self._on_update, name="PrimPropertyWindow live update"
+            )
+
+    def _on_update(self, event):
+        self._update_sub = None
+        changed = self._pending_attrs
+        self._pending_attrs = set()
+
+        # added/removed attributes come as resyncs and change the row list
+        if self._pending_full_rebuild:
+            self._pending_full_rebuild = False
+            self._content.rebuild()
+            return
+
+        for name in changed:
+            frame = self._attr_frames.get(name)
+            if frame:
+                frame.rebuild()
+        if changed and self._type_frame:
+            self._type_frame.rebuild()
+
     # ---------- SPECIFIC BUILDERS ----------
+    def _build_world_space(self, prim):
+        ui.Label("World Space", style={"color": 0xFFEEDD88, "font_size": 16})
+        world = get_world_transform(prim)
+        if world is not None:
+            transform = Gf.Transform(world)
+            ui.Label(f"Translation: {format_vec3(transform.GetTranslation())}")
+            rotation = transform.GetRotation().Decompose(Gf.Vec3d.XAxis(), Gf.Vec3d.YAxis(), Gf.Vec3d.ZAxis())
+            ui.Label(f"Rotation (XYZ): {format_vec3(rotation)}")
+            ui.Label(f"Scale: {format_vec3(transform.GetScale())}")
+        bounds = get_world_bounds(prim)
+        if bounds is not None:
+            ui.Label(f"Bounds: {format_vec3(bounds.GetMin())} - {format_vec3(bounds.GetMax())}")
+            ui.Label(f"Size: {format_vec3(bounds.GetSize())}")
+        if world is None and bounds is None:
+            ui.Label("Not imageable")
+        ui.Separator(height=2)
+
     def _build_xform(self, prim):
         ui.Label("Xform", style={"color": 0xFFEEDD88, "font_size": 16})
         xform = UsdGeom.Xformable(prim)
@@ -72,13 +255,36 @@ class PrimPropertyWindow(BaseWindow):
 
     def _build_mesh(self, prim):
         ui.Label("Mesh", style={"color": 0xFF88DD88, "font_size": 16})
-        mesh = UsdGeom.Mesh(prim)
-        pts = mesh.GetPointsAttr().Get() or []
-        faces = mesh.GetFaceVertexCountsAttr().Get() or []
-        normals = mesh.GetNormalsAttr().Get() or []
-        ui.Label(f"Points: {len(pts)}")
-        ui.Label(f"Faces: {len(faces)}")
-        ui.Label(f"Normals: {len(normals)}")
+        diag = get_mesh_diagnostics(self.__get_stage__(), prim)
+        warn = {"color": 0xFF5555FF}
+
+        ui.Label(f"Points: {diag['points']}")
+        ui.Label(f"Faces: {diag['faces']}  (triangles: {diag['triangles']})")
+        if diag["bounds"]:
+            bmin, bmax = diag["bounds"]
+            ui.Label(f"Bounds: ({bmin[0]:.3g}, {bmin[1]:.3g}, {bmin[2]:.3g}) - ({bmax[0]:.3g}, {bmax[1]:.3g}, {bmax[2]:.3g})")
+        if diag["ngon_histogram"]:
+            ui.Label("Face sizes: " + ", ".join(f"{n}: {c}" for n, c in diag["ngon_histogram"].items()))
+
+        if diag["degenerate_faces"]:
+            ui.Label(f"Degenerate faces (< 3 vertices): {diag['degenerate_faces']}", style=warn)
+        if diag["zero_area_faces"]:
+            ui.Label(f"Zero-area faces: {diag['zero_area_faces']}", style=warn)
+        if diag["out_of_range_indices"]:
+            ui.Label(f"Out-of-range vertex indices: {diag['out_of_range_indices']}", style=warn)
+        if not diag["counts_match_indices"]:
+            ui.Label(f"Face vertex counts do not match {diag['face_vertices']} indices", style=warn)
+
+        normals = diag["normals"]
+        if normals["count"] == 0:
+            ui.Label("Normals: none")
+        elif normals["valid"]:
+            ui.Label(f"Normals: {normals['count']} ({normals['interpolation']}, {normals['source']})")
+        else:
+            ui.Label(
+                f"Normals: {normals['count']} ({normals['interpolation']}, {normals['source']}), expected {normals['expected']}",
+                style=warn,
+            )
 
     def _build_camera(self, prim):
         ui.Label("Camera", style={"color": 0xFF88AAFF, "font_size": 16})
@@ -91,8 +297,7 @@ class PrimPropertyWindow(BaseWindow):
     def _build_light(self, prim):
         ui.Label("Light", style={"color": 0xFFFFDD88, "font_size": 16})
         for attr in prim.GetAttributes():
-            val = attr.Get()
-            ui.Label(f"{attr.GetName()}: {val}")
+            ui.Label(f"{attr.GetName()}: {describe_value(attr.Get())}")
 
     def _build_material(self, prim):
         ui.Label("Material", style={"color": 0xFFFF88CC, "font_size": 16})
@@ -103,5 +308,13 @@ class PrimPropertyWindow(BaseWindow):
 
     def _on_analyze_clicked(self, attr_name):
         def fun():
-            CompositionWindow(self._prim_path, attr_name)
+            window_manager.show(CompositionWindow, self._prim_path, attr_name)
         return fun
+
+    def _on_sweep_variants_clicked(self):
+        from .VariantSweepWindow import VariantSweepWindow
+        window_manager.show(VariantSweepWindow, self._prim_path)
+
+    def __destroy__(self):
+        self._stop_listening()
+        super().__destroy__()
@@ -3,16 +3,21 @@ import omni.usd
 from pxr import Usd
 from ..model.PrimRow import PrimRow
 from .BaseWindow import BaseWindow
-from .PrimPropertyWindow import PrimPropertyWindow
-from .DependencyGraphWindow import DependencyGraphWindow
+from .PagedListView import PagedListView
+from .WindowManager import window_manager
 import carb.events
 from ..utils.FilterUtils import _match_filter, find_all_multi_source_attributes
-from ..utils.SplitterUtils import split_prims_to_files
+from ..utils.GeometryBudgetUtils import get_geometry_budget, format_bytes, BUDGET_KEYS
+from ..utils.SpatialUtils import get_world_transform, get_world_bounds, get_bounds_size_meters, format_vec3
+from ..utils.PrimIdUtils import PathTable, PrimIdSet
 import carb.input
 import json
 import os
 from carb.input import KeyboardEventType
 
+# Filter results listed per page
+FILTER_PAGE_SIZE = 100
+
 
 class StageInspectorWindow(BaseWindow):
     def __init__(self, title="StageInspectorWindow"):
@@ -23,12 +28,23 @@ class StageInspectorWindow(BaseWindow):
         self.__add_event__()
         self.__build_custom_ui__()
 
-        self.reload_all()
+        # While the stage is still opening, the OPENED event does the first scan
+        if self.__get_context__().get_stage_state() == omni.usd.StageState.OPENED:
+            self.reload_all()
         
     def __build_custom_ui__(self):
         self._type_list = ["", "Xform", "Mesh", "Camera", "Light", "Scope", "Material"]
         self._search_mode = ui.RadioCollection()
         self._filter_type_model = ui.SimpleIntModel(0)
+        self._split_composed_model = ui.SimpleBoolModel(False)
+        self._consolidate_merge_model = ui.SimpleBoolModel(False)
+        self._show_budget_model = ui.SimpleBoolModel(False)
+        self._show_budget_model.add_value_changed_fn(lambda _: self._content.rebuild())
+        self._budget_sort_list = ["", "Points", "Faces", "Primvar bytes", "Prims"]
+        self._show_world_xform_model = ui.SimpleBoolModel(False)
+        self._show_world_xform_model.add_value_changed_fn(lambda _: self._content.rebuild())
+        self._show_bounds_model = ui.SimpleBoolModel(False)
+        self._show_bounds_model.add_value_changed_fn(lambda _: self._content.rebuild())
         with self._window.frame:
             with ui.VStack(style={"padding": 10}, spacing=10):
 
@@ -41,6 +57,8 @@ class StageInspectorWindow(BaseWindow):
                     # Apply / Clear
                     ui.Button("Apply", width=60, height=28, clicked_fn=self._on_apply_filter)
                     ui.Button("Clear", width=60, height=28, clicked_fn=self.reload_all)
+                    ui.Button("Windows", width=60, height=28, clicked_fn=self.print_window_stats,
+                              tooltip="Print open windows and live subscriptions")
 
                     ui.Spacer(width=20)
 
@@ -74,13 +92,35 @@ class StageInspectorWindow(BaseWindow):
                         ui.Button("Unfocus All", width=60, height=28, clicked_fn=self._clear_all)
                         ui.Button("Choose All", width=60, height=28, clicked_fn=self._on_choose_all)
                         ui.Button("Export", width=60, height=28, clicked_fn=self._export_results)
+                        ui.Button("Attribute table", width=60, height=28, clicked_fn=self.view_attribute_table)
+
+                # ===================== SET ALGEBRA =====================
+                with ui.HStack(spacing=8, height=28):
+                    ui.Label("Chosen:", width=60)
+                    ui.Button("+ Results", width=80, clicked_fn=self._on_choose_union, tooltip="Chosen | results")
+                    ui.Button("- Results", width=80, clicked_fn=self._on_choose_difference, tooltip="Chosen - results")
+                    ui.Button("Keep Results", width=90, clicked_fn=self._on_choose_intersection, tooltip="Chosen & results")
+                    ui.Spacer(width=20)
+                    ui.Label("Results:", width=60)
+                    ui.Button("- Chosen", width=80, clicked_fn=self._on_show_results_minus_chosen, tooltip="List results - chosen")
+                    ui.Button("& Previous", width=80, clicked_fn=self._on_show_results_and_previous, tooltip="List results & previous query")
+                    ui.Spacer()
 
                 # ===================== PATH (FULL WIDTH) =====================
                 with ui.HStack(spacing=10):
                     ui.Label("Path:", width=60)
                     self._input_path = ui.StringField(width=600, height=22)
                     ui.Button("View dependency graph", width=60, height=28, clicked_fn=self.view_dependency_graph)
+                    ui.Button("Opinion heat map", width=60, height=28, clicked_fn=self.view_opinion_heat_map)
+                    ui.Button("Layer profiler", width=60, height=28, clicked_fn=self.view_layer_profiler)
+                    ui.Button("Instancing advisor", width=60, height=28, clicked_fn=self.view_instance_advisor)
                     ui.Button("USD Splitter", width=60, height=28, clicked_fn=self.usd_splitter)
+                    ui.CheckBox(model=self._split_composed_model, width=20)
+                    ui.Label("Composed", width=60, tooltip="Export the composed subtree instead of the strongest spec")
+                    ui.Button("Consolidate", width=60, height=28, clicked_fn=self.usd_consolidate,
+                              tooltip="Bring the payload files under the chosen prims back together")
+                    ui.CheckBox(model=self._consolidate_merge_model, width=20)
+                    ui.Label("Merge", width=40, tooltip="Merge sibling payload files into bundles instead of inlining them")
 
                 # ===================== ATTRIBUTE NAME + VALUE =====================
                 with ui.HStack(spacing=10):
@@ -96,6 +136,25 @@ class StageInspectorWindow(BaseWindow):
 
                     ui.Spacer()
 
+                    # Geometry budget column
+                    with ui.HStack(width=260, spacing=6):
+                        ui.CheckBox(model=self._show_budget_model, width=20)
+                        ui.Label("Budget", width=50, tooltip="Points / faces / primvar bytes / prims per subtree")
+                        ui.Label("Sort by:", width=50)
+                        self._budget_sort_combo = ui.ComboBox(0, *self._budget_sort_list, width=120, height=22)
+                        self._budget_sort_combo.model.add_item_changed_fn(lambda *_: self._content.rebuild())
+
+                # ===================== WORLD SPACE =====================
+                with ui.HStack(spacing=10, height=22):
+                    with ui.HStack(width=300):
+                        ui.Label("Min size (m):", width=80, tooltip="Prims whose largest world bounds side is at least this")
+                        self._input_min_bounds = ui.StringField(width=100, height=22)
+                    ui.Spacer()
+                    ui.CheckBox(model=self._show_world_xform_model, width=20)
+                    ui.Label("World position", width=100)
+                    ui.CheckBox(model=self._show_bounds_model, width=20)
+                    ui.Label("World bounds", width=100)
+
                 # ===================== SCROLLING AREA (2/3 HEIGHT) =====================
                 with ui.ScrollingFrame(
                     height=400,
@@ -113,40 +172,52 @@ class StageInspectorWindow(BaseWindow):
         # List root prim
         self._rows = []
         
-        self._selected_prim_paths = set()
+        # Result sets are id arrays against one path table
+        self._reset_path_table()
 
         # For filter
-        self._filtered_prim_paths = []
         self._filter_name = ""
         self._filter_type = ""
         self._filter_path = ""
         self._filter_attributeName = ""
         self._filter_attributeValue = ""
+        self._filter_min_bounds = None
+        self._filter_prim_path_list = None
         self.use_regex = False
         self.use_wildcard = False
+        self._result_list = None
         
+        # On-disk prim index used by the filters, opened on first filter
+        self._prim_index = None
+
         # For UI
         self._is_choose_select_all = False
 
+    def _reset_path_table(self):
+        # The table is append only: start a new one (and new sets on it) for
+        # every stage so it does not keep the paths of every stage ever opened
+        self._path_table = PathTable()
+        self._selected_prim_paths = PrimIdSet(self._path_table)
+        self._filtered_prim_paths = PrimIdSet(self._path_table)
+        self._previous_filtered_prim_paths = PrimIdSet(self._path_table)
+
     def __add_event__(self):
-        self._sub = self.__get_context__().get_stage_event_stream().create_subscription_to_pop(
-            self._on_stage_event, 
-            name="MySelectionSubscription"
-        )
+        self._sub = self.__subscribe_stage_events__(self._on_stage_event, "MySelectionSubscription")
         
         print("Selection subscription created.")
     
     # ---------------------- LOAD UI ----------------------
     def reload_all(self):
-        self._filtered_prim_paths.clear()
+        self._reset_path_table()
         self._cache.clear()
         self._rows.clear()
-        self._selected_prim_paths.clear()
         self._filter_name = ""
         self._filter_type = ""
         self._filter_path = ""
         self._filter_attributeName = ""
         self._filter_attributeValue = ""
+        self._filter_min_bounds = None
+        self._filter_prim_path_list = None
         self.use_regex = False
         self.use_wildcard = False
         self.reload_root_prim()
@@ -211,11 +282,28 @@ class StageInspectorWindow(BaseWindow):
             print("No USD stage loaded")
             return
         
-        self._filtered_prim_paths.clear()
+        self._filtered_prim_paths = PrimIdSet(self._path_table)
+        self._result_list = None
+        filtered_ids = []
+        result_rows = []
         with self._content:
             with ui.VStack(style={"min_width": 600}):
-                if self._filter_name or self._filter_type or self._filter_path or (self._filter_attributeName and self._filter_attributeValue):
-                    for prim in stage.Traverse():
+                # Explicit path list (e.g. a duplicate group from the instancing advisor)
+                if self._filter_prim_path_list is not None:
+                    for path in self._filter_prim_path_list:
+                        prim = stage.GetPrimAtPath(path)
+                        if not prim:
+                            continue
+                        type_name = prim.GetTypeName()
+                        color = 0xFFCCCCCC if prim.IsActive() else 0xFF777777
+                        filtered_ids.append(self._path_table.intern(path, type_name))
+                        result_rows.append((path, prim.GetName(), type_name, color))
+                    self._filtered_prim_paths = PrimIdSet(self._path_table, filtered_ids)
+                    self._show_filter_results(result_rows)
+                    return
+
+                if self._filter_name or self._filter_type or self._filter_path or (self._filter_attributeName and self._filter_attributeValue) or self._filter_min_bounds is not None:
+                    for prim in self._iter_filter_candidates(stage):
                         name = prim.GetName()
                         type_name = prim.GetTypeName()
                         path = prim.GetPath().pathString
@@ -257,33 +345,20 @@ class StageInspectorWindow(BaseWindow):
                                 except Exception:
                                     continue
 
-                        self._filtered_prim_paths.append({
-                            "path": path,
-                            "type": type_name
-                        })
-                        # UI row
-                        with ui.HStack():
-                            ui.Label(f"{path} - ({name} - {type_name})", style={"color": color}, tooltip=path)
-                            ui.Button(
-                                "Choose", width=60, height=40,
-                                clicked_fn=lambda p=path: self._on_toggle_multiple(p),
-                                style={"background_color": 0xFF7777AA if path in self._selected_prim_paths else 0xFF555555}
-                            )
-                            ui.Button(
-                                "Select", width=60, height=40,
-                                clicked_fn=lambda p=path: self.__select_prim__(p),
-                                style={"background_color": 0xFF555555}
-                            )
-                            ui.Button(
-                                "Inspect", width=70, height=40,
-                                clicked_fn=lambda p=path: self._open_prim_window(p),
-                                style={"background_color": 0xFF7777AA}
-                            )
-                        ui.Spacer()
+                        # World bounds size filter
+                        if self._filter_min_bounds is not None:
+                            size = get_bounds_size_meters(prim)
+                            if size is None or size < self._filter_min_bounds:
+                                continue
+
+                        filtered_ids.append(self._path_table.intern(path, type_name))
+                        result_rows.append((path, name, type_name, color))
+                    self._filtered_prim_paths = PrimIdSet(self._path_table, filtered_ids)
+                    self._show_filter_results(result_rows)
                     return
 
                 rows_to_process = []
-                for r in self._rows:
+                for r in self._sort_rows_by_budget(self._rows):
                     rows_to_process.append( (r, 0) )  # (PrimRow, indent_level)
 
                 while rows_to_process:
@@ -298,6 +373,10 @@ class StageInspectorWindow(BaseWindow):
                         ui.Label(f"{row.path} - ({row.name} - {row.type})", style={"color": color}, tooltip=row.path)
                         ui.Spacer()
 
+                        if self._is_budget_visible():
+                            self._build_budget_label(row.path)
+                        self._build_world_space_labels(row.path)
+
                         symbol = ">" if row.expanded else "^"
                         ui.Button(symbol, width=22, clicked_fn=lambda r=row: self._toggle_expand(r))
                         ui.Spacer(width=4)
@@ -323,8 +402,134 @@ class StageInspectorWindow(BaseWindow):
 
                     # Add to list if expand
                     if row.expanded and row.children:
-                        for child_row in row.children:
-                            rows_to_process.insert(0, (child_row, indent + 1))
+                        rows_to_process[0:0] = [(c, indent + 1) for c in self._sort_rows_by_budget(row.children)]
+
+    def _show_filter_results(self, rows):
+        # Only the current page is built, however many prims match
+        self._result_list = PagedListView(self._build_filtered_row, page_size=FILTER_PAGE_SIZE)
+        self._result_list.set_rows(rows)
+
+    def _build_filtered_row(self, row):
+        path, name, type_name, color = row
+        with ui.HStack():
+            ui.Label(f"{path} - ({name} - {type_name})", style={"color": color}, tooltip=path)
+            self._build_world_space_labels(path)
+            ui.Button(
+                "Choose", width=60, height=40,
+                clicked_fn=lambda p=path: self._on_toggle_multiple(p),
+                style={"background_color": 0xFF7777AA if path in self._selected_prim_paths else 0xFF555555}
+            )
+            ui.Button(
+                "Select", width=60, height=40,
+                clicked_fn=lambda p=path: self.__select_prim__(p),
+                style={"background_color": 0xFF555555}
+            )
+            ui.Button(
+                "Inspect", width=70, height=40,
+                clicked_fn=lambda p=path: self._open_prim_window(p),
+                style={"background_color": 0xFF7777AA}
+            )
+        ui.Spacer()
+
+    # ----------------------- PRIM INDEX -----------------------
+    def _get_prim_index(self, stage):
+        if self._prim_index and self._prim_index.stage == stage:
+            return self._prim_index
+
+        self._close_prim_index()
+        try:
+            from ..utils.PrimIndexUtils import PrimIndex
+            self._prim_index = PrimIndex(stage)
+        except Exception as e:
+            print(f"Prim index unavailable, filters will traverse the stage: {e}")
+        return self._prim_index
+
+    def _close_prim_index(self):
+        if self._prim_index:
+            self._prim_index.close()
+            self._prim_index = None
+
+    def _sync_prim_index(self):
+        stage = self.__get_stage__()
+        index = self._get_prim_index(stage) if stage else None
+        if not index:
+            return
+        stats = index.sync()
+        if stats["mode"] != "cached":
+            print(f"Prim index {stats['mode']}: {stats['layers']} layers, {stats['prims']} prims in {stats['seconds']:.2f}s ({index.path})")
+
+    def _iter_filter_candidates(self, stage):
+        """
+        Prims matching the name/type/path/attribute-name filters according to the
+        prim index; every candidate is still checked by build_content.
+        """
+        index = self._prim_index if self._prim_index and self._prim_index.stage == stage else None
+        if not index:
+            yield from stage.Traverse()
+            return
+
+        rows = index.query(
+            name=self._filter_name,
+            type_name=self._filter_type,
+            path=self._filter_path,
+            attr_name=self._filter_attributeName,
+            use_regex=self.use_regex,
+            use_wildcard=self.use_wildcard,
+        )
+        for path, _, _ in rows:
+            prim = stage.GetPrimAtPath(path)
+            if prim:
+                yield prim
+
+    # ----------------------- GEOMETRY BUDGET -----------------------
+    def _get_budget_sort_key(self):
+        index = self._budget_sort_combo.model.get_item_value_model().get_value_as_int()
+        return BUDGET_KEYS[index - 1] if index > 0 else None
+
+    def _is_budget_visible(self):
+        return self._show_budget_model.get_value_as_bool() or self._get_budget_sort_key() is not None
+
+    def _sort_rows_by_budget(self, rows):
+        key = self._get_budget_sort_key()
+        if key is None:
+            return rows
+
+        stage = self.__get_stage__()
+        def cost_of(row):
+            cost = get_geometry_budget(stage, row.path)
+            return getattr(cost, key) if cost else -1
+
+        return sorted(rows, key=cost_of, reverse=True)
+
+    def _build_budget_label(self, path):
+        cost = get_geometry_budget(self.__get_stage__(), path)
+        if not cost:
+            ui.Label("-", width=260, style={"color": 0xFF777777})
+            return
+        ui.Label(
+            f"{cost.points} pts | {cost.faces} faces | {format_bytes(cost.primvar_bytes)} | {cost.prims} prims",
+            width=260,
+            style={"color": 0xFF88DD88},
+            tooltip="Subtree totals: points, faces, primvar bytes, prims",
+        )
+
+    # ----------------------- WORLD SPACE -----------------------
+    def _build_world_space_labels(self, path):
+        show_xform = self._show_world_xform_model.get_value_as_bool()
+        show_bounds = self._show_bounds_model.get_value_as_bool()
+        if not show_xform and not show_bounds:
+            return
+
+        prim = self.__get_stage__().GetPrimAtPath(path)
+        if show_xform:
+            world = get_world_transform(prim) if prim else None
+            text = format_vec3(world.ExtractTranslation()) if world is not None else "-"
+            ui.Label(text, width=160, style={"color": 0xFFEEDD88}, tooltip="World position")
+        if show_bounds:
+            bounds = get_world_bounds(prim) if prim else None
+            text = format_vec3(bounds.GetSize()) if bounds is not None else "-"
+            tooltip = f"{format_vec3(bounds.GetMin())} - {format_vec3(bounds.GetMax())}" if bounds is not None else "No bounds"
+            ui.Label(text, width=160, style={"color": 0xFF88CCEE}, tooltip=tooltip)
 
     # ----------------------- UI HELPERS -----------------------
     def _select_all(self):
@@ -346,16 +551,36 @@ class StageInspectorWindow(BaseWindow):
         if not self._filtered_prim_paths:
             print("No prims to choose")
             return
-        self._selected_prim_paths.clear()
-        for obj in self._filtered_prim_paths:
-            self._selected_prim_paths.add(obj["path"])
+        self._selected_prim_paths = PrimIdSet(self._path_table, self._filtered_prim_paths.ids)
+        self._content.rebuild()
+
+    def _on_choose_union(self):
+        self._selected_prim_paths = self._selected_prim_paths | self._filtered_prim_paths
         self._content.rebuild()
+
+    def _on_choose_difference(self):
+        self._selected_prim_paths = self._selected_prim_paths - self._filtered_prim_paths
+        self._content.rebuild()
+
+    def _on_choose_intersection(self):
+        self._selected_prim_paths = self._selected_prim_paths & self._filtered_prim_paths
+        self._content.rebuild()
+
+    def _on_show_results_minus_chosen(self):
+        self.show_prim_paths(self._filtered_prim_paths - self._selected_prim_paths)
+
+    def _on_show_results_and_previous(self):
+        self.show_prim_paths(self._filtered_prim_paths & self._previous_filtered_prim_paths)
          
     def _on_toggle_multiple(self, path):
         if path not in self._selected_prim_paths:
             self._selected_prim_paths.add(path)
         else:
             self._selected_prim_paths.discard(path)
+        if self._result_list:
+            # only the Choose button of the listed page changes
+            self._result_list.refresh()
+            return
         self._content.rebuild()
 
     def _toggle_expand(self, row: PrimRow):
@@ -373,11 +598,31 @@ class StageInspectorWindow(BaseWindow):
         self._filter_path = self._input_path.model.get_value_as_string()
         self._filter_attributeName = self._input_attributeName.model.get_value_as_string()
         self._filter_attributeValue = self._input_attributeValue.model.get_value_as_string()
+        min_bounds = self._input_min_bounds.model.get_value_as_string().strip()
+        try:
+            self._filter_min_bounds = float(min_bounds) if min_bounds else None
+        except ValueError:
+            print(f"Invalid min size '{min_bounds}'")
+            self._filter_min_bounds = None
+        self._filter_prim_path_list = None
+        self._previous_filtered_prim_paths = self._filtered_prim_paths
+        self._sync_prim_index()
+        self._content.rebuild()
+
+    def show_prim_paths(self, paths):
+        """
+        List exactly these prims in the inspector (Clear / Reload to go back).
+        """
+        self._previous_filtered_prim_paths = self._filtered_prim_paths
+        self._filter_prim_path_list = list(paths)
         self._content.rebuild()
 
     # ----------------------- Window -----------------------
+    # Tool windows and the splitter are imported on first use, they pull in
+    # UsdUtils, sqlite3, concurrent.futures... that the inspector does not need
     def _open_prim_window(self, path):
-        PrimPropertyWindow(path)
+        from .PrimPropertyWindow import PrimPropertyWindow
+        window_manager.show(PrimPropertyWindow, path)
         
     def _export_results(self):
         if not self._filtered_prim_paths:
@@ -389,26 +634,72 @@ class StageInspectorWindow(BaseWindow):
         if folder and not os.path.exists(folder):
             os.makedirs(folder, exist_ok=True)
         
+        # ids follow interning order, the file lists prims by path
+        records = sorted(self._filtered_prim_paths.to_records(), key=lambda r: r["path"])
         if file_path.endswith(".json"):
             with open(file_path, "w") as f:
-                json.dump(self._filtered_prim_paths, f)
+                json.dump(records, f)
         else:
             with open(file_path, "w") as f:
-                for p in self._filtered_prim_paths:
+                for p in records:
                     f.write(str(p) + "\n")
 
         print(f"Exported filter results to {os.path.abspath(file_path)}")
     
     def view_dependency_graph(self):
-        DependencyGraphWindow()
+        from .DependencyGraphWindow import DependencyGraphWindow
+        window_manager.show(DependencyGraphWindow)
+
+    def view_opinion_heat_map(self):
+        from .OpinionHeatMapWindow import OpinionHeatMapWindow
+        window_manager.show(OpinionHeatMapWindow)
+
+    def view_layer_profiler(self):
+        from .LayerProfilerWindow import LayerProfilerWindow
+        window_manager.show(LayerProfilerWindow)
+
+    def view_instance_advisor(self):
+        from .InstanceAdvisorWindow import InstanceAdvisorWindow
+        window_manager.show(InstanceAdvisorWindow, self.show_prim_paths)
+
+    def view_attribute_table(self):
+        # chosen prims first, else the current filter results
+        paths = (self._selected_prim_paths or self._filtered_prim_paths).paths()
+        if not paths:
+            print("No prims chosen or filtered")
+            return
+        from .AttributeTableWindow import AttributeTableWindow
+        window_manager.show(AttributeTableWindow, paths)
+
+    def print_window_stats(self):
+        print(f"Window stats: {window_manager.get_stats()}")
 
     def usd_splitter(self):
-        split_prims_to_files(self.__get_stage__(), self._selected_prim_paths, "splitted-asset")
+        from ..utils.SplitterUtils import split_prims_to_files, EXPORT_MODE_COMPOSED, EXPORT_MODE_STRONGEST_SPEC
+        export_mode = EXPORT_MODE_COMPOSED if self._split_composed_model.get_value_as_bool() else EXPORT_MODE_STRONGEST_SPEC
+        split_prims_to_files(self.__get_stage__(), self._selected_prim_paths, "splitted-asset", export_mode)
+
+    def usd_consolidate(self):
+        from ..utils.SplitterUtils import consolidate_payloads, CONSOLIDATE_MODE_INLINE, CONSOLIDATE_MODE_MERGE
+        if not self._selected_prim_paths:
+            print("No prims chosen to consolidate")
+            return
+        mode = CONSOLIDATE_MODE_MERGE if self._consolidate_merge_model.get_value_as_bool() else CONSOLIDATE_MODE_INLINE
+        stage = self.__get_stage__()
+        for path in self._selected_prim_paths.paths():
+            try:
+                consolidate_payloads(stage, path, mode)
+            except RuntimeError as e:
+                print(f"Consolidate {path} failed: {e}")
 
     # ----------------------- Event -----------------------
     def _on_stage_event(self, event: carb.events.IEvent):
         if event.type == int(omni.usd.StageEventType.SELECTION_CHANGED):
             self._on_selection_changed()
+        elif event.type == int(omni.usd.StageEventType.OPENED):
+            self.reload_all()
+        elif event.type == int(omni.usd.StageEventType.CLOSING):
+            self._close_prim_index()
     
     def on_keyboard_event(self, event):
         if event.input == carb.input.KeyboardInput.ENTER:
@@ -452,4 +743,8 @@ class StageInspectorWindow(BaseWindow):
             return False
 
         expand_to_path(self._rows)
-        self._content.rebuild()
\ No newline at end of file
+        self._content.rebuild()
+
+    def __destroy__(self):
+        self._close_prim_index()
+        super().__destroy__()
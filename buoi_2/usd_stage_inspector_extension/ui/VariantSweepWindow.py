@@ -0,0 +1,167 @@
+import os
+import omni.ui as ui
+from .BaseWindow import BaseWindow
+from .PagedListView import PagedListView
+from ..utils.VariantSweepUtils import (
+    DEFAULT_MAX_COMBINATIONS,
+    DEFAULT_MAX_SECONDS,
+    count_combinations,
+    get_variant_sets,
+    sweep_variants,
+    write_variant_sweep,
+)
+
+# column key, header, width %
+_COLUMNS = [
+    ("label", "Selection", 40),
+    ("compose_ms", "Compose (ms)", 12),
+    ("prim_count", "Prims", 10),
+    ("payloads", "Payloads", 10),
+    ("layers", "Layers", 10),
+    ("layer_bytes", "Layers (KB)", 12),
+]
+
+
+class VariantSweepWindow(BaseWindow):
+    """
+    Composes the prim once per variant combination on a masked stage and
+    lists what each choice costs. The open stage is not modified.
+    """
+
+    def __init__(self, prim_path):
+        super().__init__(title=f"Variant Sweep - {prim_path}", width=900, height=600, visible=True)
+        self._prim_path = prim_path
+        self._sweep = None
+        self._sort_key = "compose_ms"
+        self._sort_descending = True
+        self._load_payloads_model = ui.SimpleBoolModel(True)
+
+        with self._window.frame:
+            with ui.VStack(spacing=6, style={"padding": 8}):
+                with ui.HStack(height=22, spacing=8):
+                    ui.Label("Max combinations:", width=110)
+                    self._max_combinations_field = ui.StringField(width=60, height=22)
+                    self._max_combinations_field.model.set_value(str(DEFAULT_MAX_COMBINATIONS))
+                    ui.Label("Max seconds:", width=80)
+                    self._max_seconds_field = ui.StringField(width=60, height=22)
+                    self._max_seconds_field.model.set_value(str(DEFAULT_MAX_SECONDS))
+                    ui.Label("Variant sets:", width=80, tooltip="Comma separated, empty for all")
+                    self._set_names_field = ui.StringField(width=160, height=22)
+                    ui.CheckBox(model=self._load_payloads_model, width=20)
+                    ui.Label("Load payloads", width=90)
+                with ui.HStack(height=28, spacing=8):
+                    ui.Button("Sweep", width=80, clicked_fn=self._run_sweep)
+                    ui.Button("Export", width=80, clicked_fn=self._export_report)
+                    self._summary_label = ui.Label("")
+                with ui.ScrollingFrame(
+                    horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
+                    vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
+                ):
+                    self._content = ui.Frame()
+                    self._content.set_build_fn(self._build)
+
+    def retarget(self, prim_path):
+        self._prim_path = prim_path
+        self._window.title = f"Variant Sweep - {prim_path}"
+        self._sweep = None
+        self._content.rebuild()
+
+    def _read_limits(self):
+        try:
+            max_combinations = int(self._max_combinations_field.model.get_value_as_string())
+        except ValueError:
+            max_combinations = DEFAULT_MAX_COMBINATIONS
+        try:
+            max_seconds = float(self._max_seconds_field.model.get_value_as_string())
+        except ValueError:
+            max_seconds = DEFAULT_MAX_SECONDS
+        set_names = [n.strip() for n in self._set_names_field.model.get_value_as_string().split(",") if n.strip()]
+        return max_combinations, max_seconds, set_names or None
+
+    def _run_sweep(self):
+        stage = self.__get_stage__()
+        if not stage:
+            return
+        max_combinations, max_seconds, set_names = self._read_limits()
+        self._sweep = sweep_variants(
+            stage, self._prim_path, max_combinations, max_seconds, set_names,
+            self._load_payloads_model.get_value_as_bool(),
+        )
+        self._content.rebuild()
+
+    def _on_sort_clicked(self, key):
+        if key == self._sort_key:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_key = key
+            self._sort_descending = key != "label"
+        self._content.rebuild()
+
+    def _build(self):
+        stage = self.__get_stage__()
+        prim = stage.GetPrimAtPath(self._prim_path) if stage else None
+        if not prim:
+            with self._content:
+                ui.Label("Prim not found")
+            return
+
+        if self._sweep is None:
+            variant_sets = get_variant_sets(prim)
+            self._summary_label.text = (
+                f"{len(variant_sets)} variant sets, {count_combinations(variant_sets)} combinations"
+            )
+            with self._content:
+                with ui.VStack(spacing=2, height=0):
+                    if not variant_sets:
+                        ui.Label("No variant sets")
+                    for name, choices in variant_sets.items():
+                        ui.Label(f"{name}: {', '.join(choices)}")
+            return
+
+        sweep = self._sweep
+        self._summary_label.text = (
+            f"{len(sweep.rows)} of {sweep.total_combinations} combinations in {sweep.seconds:.2f}s, "
+            "first row is the current selection"
+        )
+        rows = sorted(sweep.rows, key=lambda r: getattr(r, self._sort_key), reverse=self._sort_descending)
+
+        with self._content:
+            with ui.VStack(spacing=2, height=0):
+                with ui.HStack(height=24):
+                    for key, header, width in _COLUMNS:
+                        arrow = (" v" if self._sort_descending else " ^") if key == self._sort_key else ""
+                        ui.Button(
+                            header + arrow, width=ui.Percent(width),
+                            clicked_fn=lambda k=key: self._on_sort_clicked(k)
+                        )
+                sweep_list = PagedListView(self._draw_row)
+                sweep_list.set_rows(rows)
+
+    def _draw_row(self, row):
+        if row.error:
+            style = {"color": 0xFF5555FF}
+        elif row.is_current:
+            style = {"color": 0xFF5599FF}
+        else:
+            style = {}
+        values = {
+            "label": row.label + (" (current)" if row.is_current else ""),
+            "compose_ms": f"{row.compose_ms:.2f}",
+            "prim_count": str(row.prim_count),
+            "payloads": str(row.payloads),
+            "layers": str(row.layers),
+            "layer_bytes": f"{row.layer_bytes / 1024.0:.1f}",
+        }
+        with ui.HStack(height=22):
+            for key, _, width in _COLUMNS:
+                tooltip = row.error or values[key]
+                ui.Label(values[key], width=ui.Percent(width), style=style, elided_text=True, tooltip=tooltip)
+
+    def _export_report(self):
+        if not self._sweep or not self._sweep.rows:
+            print("No variant sweep to export.")
+            return
+
+        file_path = "../outputs/variant_sweep.json"
+        write_variant_sweep(self._sweep, file_path)
+        print(f"Exported variant sweep to {os.path.abspath(file_path)}")
@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from typing import Dict
+from .BaseWindow import BaseWindow
+
+
+def _make_key(args) -> tuple:
+    return tuple(tuple(a) if isinstance(a, (list, set)) else a for a in args)
+
+
+class WindowManager:
+    """
+    Reuses windows instead of creating one per click.
+
+    Each window class has a pool of at most POOL_SIZE windows, keyed by the
+    constructor arguments. show() brings back the window already showing that
+    target; when the pool is full, a closed window (or else the least recently
+    used one) is retargeted.
+    """
+
+    def __init__(self):
+        self._pools: Dict[type, "OrderedDict[tuple, BaseWindow]"] = {}
+
+    def show(self, window_cls, *args) -> BaseWindow:
+        pool = self._pools.setdefault(window_cls, OrderedDict())
+        key = _make_key(args)
+
+        window = pool.pop(key, None)
+        if window is None:
+            if len(pool) < window_cls.POOL_SIZE:
+                window = window_cls(*args)
+            else:
+                hidden = next((k for k, w in pool.items() if not w.is_visible), None)
+                window = pool.pop(hidden) if hidden is not None else pool.popitem(last=False)[1]
+                window.retarget(*args)
+
+        window.show()
+        pool[key] = window
+        return window
+
+    def destroy_all(self):
+        for pool in self._pools.values():
+            for window in pool.values():
+                window.__destroy__()
+        self._pools.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "pooled_windows": {cls.__name__: len(pool) for cls, pool in self._pools.items()},
+            "live_windows": BaseWindow.live_windows,
+            "keyboard_subscriptions": BaseWindow.live_keyboard_subscriptions,
+            "stage_event_subscriptions": BaseWindow.live_stage_event_subscriptions,
+        }
+
+
+# Shared by every window that opens other windows
+window_manager = WindowManager()
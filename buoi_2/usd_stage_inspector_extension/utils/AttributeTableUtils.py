@@ -0,0 +1,151 @@
+import numpy as np
+from dataclasses import dataclass, field
+from pxr import Usd
+from typing import Dict, List, Tuple
+from .ValueUtils import describe_value, is_array_value
+
+# Prims sampled to propose attribute columns
+MAX_COLUMN_SUGGESTION_PRIMS = 200
+
+
+@dataclass
+class AttributeTable:
+    """
+    One row per prim, one array per attribute column.
+
+    Numeric scalars are float64 arrays, fixed-size vectors (Gf.Vec*, Gf.Quat*)
+    are (rows, n) float64 arrays, missing values are NaN. Every other type is
+    an object array of short previews, missing values are None.
+    """
+    paths: np.ndarray
+    time: Usd.TimeCode
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def is_numeric(self, name: str) -> bool:
+        return self.columns[name].dtype != object
+
+
+def suggest_columns(stage: Usd.Stage, prim_paths: List[str]) -> List[str]:
+    """
+    Attribute names found on the first prims of the set.
+    """
+    names = set()
+    for path in prim_paths[:MAX_COLUMN_SUGGESTION_PRIMS]:
+        prim = stage.GetPrimAtPath(path)
+        if prim:
+            names.update(attr.GetName() for attr in prim.GetAttributes())
+    return sorted(names)
+
+
+def _to_column(values: list) -> np.ndarray:
+    """
+    Pack raw values into the tightest array type that holds all of them.
+    """
+    present = [v for v in values if v is not None]
+
+    if present and all(isinstance(v, (bool, int, float)) for v in present):
+        return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+    if present and not any(is_array_value(v) or isinstance(v, str) for v in present):
+        try:
+            width = len(present[0])
+            if all(len(v) == width for v in present):
+                column = np.full((len(values), width), np.nan, dtype=np.float64)
+                mask = np.array([v is not None for v in values])
+                column[mask] = np.array([tuple(v) for v in present], dtype=np.float64)
+                return column
+        except (TypeError, ValueError):
+            pass
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = [None if v is None else describe_value(v) for v in values]
+    return column
+
+
+def fetch_attribute_table(stage: Usd.Stage, prim_paths: List[str], attr_names: List[str],
+                          time: Usd.TimeCode = Usd.TimeCode.Default()) -> AttributeTable:
+    """
+    Each prim is looked up once and all requested attributes are read at the
+    same time code, then every column is packed into one array.
+    """
+    raw = {name: [None] * len(prim_paths) for name in attr_names}
+
+    for row, path in enumerate(prim_paths):
+        prim = stage.GetPrimAtPath(path)
+        if not prim:
+            continue
+        for name in attr_names:
+            attr = prim.GetAttribute(name)
+            if attr:
+                raw[name][row] = attr.Get(time)
+
+    table = AttributeTable(paths=np.array(prim_paths, dtype=object), time=time)
+    for name in attr_names:
+        table.columns[name] = _to_column(raw[name])
+    return table
+
+
+# ---------------------- Sort / group ----------------------
+def _column_keys(table: AttributeTable, column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (rows, n) float keys and the missing mask. Strings are replaced by their rank.
+    """
+    values = table.columns[column]
+    if table.is_numeric(column):
+        keys = values if values.ndim == 2 else values[:, None]
+        missing = np.isnan(keys).any(axis=1)
+        return np.nan_to_num(keys, nan=0.0), missing
+
+    missing = np.array([v is None for v in values], dtype=bool)
+    strings = np.array(["" if v is None else v for v in values], dtype=str)
+    _, ranks = np.unique(strings, return_inverse=True)
+    return ranks.reshape(-1, 1).astype(np.float64), missing
+
+
+def sort_rows(table: AttributeTable, column: str = None, descending: bool = False) -> np.ndarray:
+    """
+    Row order for column (None sorts by path). Missing values always sort last.
+    """
+    if column is None:
+        order = np.argsort(table.paths.astype(str), kind="stable")
+        return order[::-1] if descending else order
+
+    keys, missing = _column_keys(table, column)
+    if descending:
+        keys = -keys
+    # np.lexsort: last key is the primary one
+    return np.lexsort([keys[:, i] for i in reversed(range(keys.shape[1]))] + [missing])
+
+
+def group_rows(table: AttributeTable, column: str, order: np.ndarray) -> List[Tuple[str, np.ndarray]]:
+    """
+    Split order into groups of equal column value, groups in first-seen order.
+    """
+    keys, missing = _column_keys(table, column)
+    keys = np.where(missing[:, None], np.inf, keys)[order]
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    # one stable sort instead of a mask per group
+    by_group = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse))[:-1]
+    rows_per_group = np.split(order[by_group], bounds)
+
+    return [
+        (format_cell(table, column, rows_per_group[group][0]), rows_per_group[group])
+        for group in np.argsort(first)
+    ]
+
+
+def format_cell(table: AttributeTable, column: str, row: int) -> str:
+    value = table.columns[column][row]
+    if not table.is_numeric(column):
+        return "-" if value is None else value
+    if np.ndim(value) == 0:
+        return "-" if np.isnan(value) else f"{value:.6g}"
+    if np.isnan(value).any():
+        return "-"
+    return "(" + ", ".join(f"{v:.4g}" for v in value) + ")"
@@ -0,0 +1,82 @@
+from pxr import Usd, Sdf, Tf
+from typing import Callable, Dict, Any
+
+
+class StageNoticeCache:
+    """
+    Per-stage cache keyed by prim path.
+
+    Entries are dropped when Usd.Notice.ObjectsChanged reports a change on
+    their prim (or a resync of an ancestor). Switching stage, or changing the
+    stage's layer stack, clears everything.
+
+    resync_only: only composition changes (resyncs) invalidate entries,
+        value/metadata edits are ignored.
+    """
+
+    def __init__(self, resync_only: bool = False):
+        self._resync_only = resync_only
+        self._stage = None
+        self._stage_key = None
+        self._listener = None
+        self._entries: Dict[Sdf.Path, Any] = {}
+
+    # ---------------------- Stage binding ----------------------
+    def _make_stage_key(self, stage: Usd.Stage) -> tuple:
+        return tuple(layer.identifier for layer in stage.GetLayerStack())
+
+    def _bind(self, stage: Usd.Stage):
+        stage_key = self._make_stage_key(stage)
+        if self._stage is not None and stage == self._stage and stage_key == self._stage_key:
+            return
+
+        self.destroy()
+        self._stage = stage
+        self._stage_key = stage_key
+        self._listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+        )
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+            self._listener = None
+        self._stage = None
+        self._stage_key = None
+        self._entries.clear()
+
+    # ---------------------- Access ----------------------
+    def get(self, stage: Usd.Stage, prim_path, compute_fn: Callable[[], Any]):
+        self._bind(stage)
+        path = Sdf.Path(prim_path)
+        if path not in self._entries:
+            self._entries[path] = compute_fn()
+        return self._entries[path]
+
+    def peek(self, prim_path):
+        return self._entries.get(Sdf.Path(prim_path))
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ---------------------- Invalidation ----------------------
+    def invalidate(self, prim_path: Sdf.Path, recursive: bool):
+        if not recursive:
+            self._entries.pop(prim_path, None)
+            return
+
+        for path in [p for p in self._entries if p.HasPrefix(prim_path)]:
+            del self._entries[path]
+
+    def _on_objects_changed(self, notice, sender):
+        if not self._entries:
+            return
+
+        for path in notice.GetResyncedPaths():
+            self.invalidate(path.GetPrimPath(), recursive=path.IsPrimPath() or path.IsAbsoluteRootPath())
+
+        if self._resync_only:
+            return
+
+        for path in notice.GetChangedInfoOnlyPaths():
+            self.invalidate(path.GetPrimPath(), recursive=False)
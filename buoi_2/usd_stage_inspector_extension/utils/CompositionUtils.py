@@ -0,0 +1,59 @@
+from pxr import Usd, Sdf
+from typing import Dict, List
+from .CacheUtils import StageNoticeCache
+
+# layer identifier -> arc types whose target layer stack contains it (strong -> weak)
+LayerArcMap = Dict[str, List]
+
+# Shared by every CompositionWindow, invalidated on composition change only
+_layer_arc_cache = StageNoticeCache(resync_only=True)
+
+
+def build_layer_arc_map(prim: Usd.Prim) -> LayerArcMap:
+    """
+    Classify every layer contributing to prim by composition arc,
+    with a single Usd.PrimCompositionQuery.
+    """
+    arc_map: LayerArcMap = {}
+    query = Usd.PrimCompositionQuery(prim)
+    for arc in query.GetCompositionArcs():
+        node = arc.GetTargetNode()
+        if not node or not node.layerStack:
+            continue
+
+        arc_type = arc.GetArcType()
+        for layer in node.layerStack.layers:
+            arc_map.setdefault(layer.identifier, []).append(arc_type)
+
+    return arc_map
+
+
+def get_layer_arc_map(stage: Usd.Stage, prim: Usd.Prim) -> LayerArcMap:
+    return _layer_arc_cache.get(stage, prim.GetPath(), lambda: build_layer_arc_map(prim))
+
+
+def summarize_prim_attributes(prim: Usd.Prim) -> Dict[str, dict]:
+    """
+    One pass over the prim stack (strong -> weak):
+        attr name -> {"winner": attr spec holding the strongest value, "count": opinions}
+    """
+    summary: Dict[str, dict] = {}
+    for prim_spec in prim.GetPrimStack():
+        layer = prim_spec.layer
+        for name, attr_spec in prim_spec.attributes.items():
+            entry = summary.get(name)
+            if entry is None:
+                entry = summary[name] = {"winner": None, "first": attr_spec, "count": 0}
+            entry["count"] += 1
+
+            if entry["winner"] is None and (
+                attr_spec.HasDefaultValue() or layer.GetNumTimeSamplesForPath(attr_spec.path)
+            ):
+                entry["winner"] = attr_spec
+
+    for entry in summary.values():
+        if entry["winner"] is None:
+            entry["winner"] = entry["first"]
+        del entry["first"]
+
+    return summary
@@ -0,0 +1,199 @@
+"""
+Dependency graph snapshots: streaming JSON / Graphviz DOT writers and a diff.
+
+Reading and diffing snapshots only needs the standard library, so the diff
+can run in pipeline checks outside Kit:
+
+    python DependencySnapshotUtils.py before.json after.json --max-added-layers 50
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Dict, Iterable, Optional, TextIO
+
+# 2: layer keys relative to the root layer's folder, anonymous layers left out
+SNAPSHOT_VERSION = 2
+ARC_VARIANT = "variant"
+ANONYMOUS_PREFIX = "anon:"
+
+
+# ------------------------------------------------------------
+# Writers
+# ------------------------------------------------------------
+
+def _write_json_array(fp: TextIO, name: str, items: Iterable[dict], last: bool = False):
+    fp.write(f'  "{name}": [')
+    first = True
+    for item in items:
+        fp.write("\n    " if first else ",\n    ")
+        fp.write(json.dumps(item, sort_keys=True))
+        first = False
+    fp.write("\n  ]" if not first else "]")
+    fp.write("\n" if last else ",\n")
+
+
+def snapshot_key(identifier: str, root_dir: str) -> Optional[str]:
+    """
+    Layer identifier as stored in a snapshot: files relative to the root
+    layer's folder ("sub/car.usda", "../lib/wheel.usda") so two checkouts
+    or machines produce the same keys; other asset paths (URIs) as is.
+    None for anonymous layers, which differ in every process.
+    """
+    if identifier.startswith(ANONYMOUS_PREFIX):
+        return None
+    if root_dir and os.path.isabs(identifier):
+        return os.path.relpath(identifier, root_dir).replace(os.sep, "/")
+    return identifier
+
+
+def write_snapshot_json(graph, arc_index, fp: TextIO):
+    """
+    Stream graph (LayerDependencyGraph) and arc_index (ArcIndex) to fp,
+    one record per line, without building the whole document in memory.
+    Layers are keyed with snapshot_key; anything on an anonymous layer is
+    left out.
+    """
+    root_dir = os.path.dirname(graph.root) if os.path.isabs(graph.root) else ""
+    keys = {key: snapshot_key(key, root_dir) for key in graph.nodes}
+
+    def _key(identifier):
+        return keys[identifier] if identifier in keys else snapshot_key(identifier, root_dir)
+
+    fp.write("{\n")
+    fp.write(f'  "version": {SNAPSHOT_VERSION},\n')
+    fp.write(f'  "root": {json.dumps(_key(graph.root))},\n')
+    _write_json_array(fp, "layers", (
+        {"id": keys[key], "error": node.error}
+        for key, node in graph.nodes.items() if keys[key]
+    ))
+    _write_json_array(fp, "edges", (
+        {"source": keys[key], "arc": edge.arc, "target": _key(edge.target)}
+        for key, node in graph.nodes.items() if keys[key]
+        for edge in node.edges if _key(edge.target)
+    ))
+    _write_json_array(fp, "arcs", (
+        {"prim": r.prim_path, "arc": r.arc, "target": r.target, "layer": _key(r.layer)}
+        for r in (arc_index.records if arc_index else []) if _key(r.layer)
+    ), last=True)
+    fp.write("}\n")
+
+
+def write_snapshot_dot(graph, fp: TextIO):
+    """
+    Layer graph as Graphviz DOT, streamed node by node. Cycle edges are red.
+    """
+    ids: Dict[str, str] = {}
+
+    def _node_id(key):
+        if key not in ids:
+            ids[key] = f"n{len(ids)}"
+        return ids[key]
+
+    fp.write("digraph dependencies {\n")
+    fp.write("  rankdir=LR;\n  node [shape=box, fontsize=10];\n")
+    for key, node in graph.nodes.items():
+        attrs = f"label={json.dumps(key)}"
+        if node.error:
+            attrs += ", color=red"
+        fp.write(f"  {_node_id(key)} [{attrs}];\n")
+
+    for key, node in graph.nodes.items():
+        for edge in node.edges:
+            attrs = f"label={json.dumps(edge.arc)}"
+            if graph.is_back_edge(key, edge.target):
+                attrs += ", color=red"
+            fp.write(f"  {_node_id(key)} -> {_node_id(edge.target)} [{attrs}];\n")
+    fp.write("}\n")
+
+
+def load_snapshot(file_path: str) -> dict:
+    with open(file_path, "r") as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version in {file_path}: {snapshot.get('version')}")
+    return snapshot
+
+
+# ------------------------------------------------------------
+# Diff
+# ------------------------------------------------------------
+
+def diff_snapshots(old: dict, new: dict) -> dict:
+    """
+    Compare two snapshots in time linear in their size.
+
+    Returns added/removed layers, layer edges and arcs, plus variant
+    selections whose value changed on the same (layer, prim, variant set).
+    """
+    old_layers = {layer["id"] for layer in old["layers"]}
+    new_layers = {layer["id"] for layer in new["layers"]}
+
+    def _edge_key(e):
+        return (e["source"], e["arc"], e["target"])
+
+    old_edges = {_edge_key(e) for e in old["edges"]}
+    new_edges = {_edge_key(e) for e in new["edges"]}
+
+    def _split_arcs(snapshot):
+        arcs, variants = set(), {}
+        for a in snapshot["arcs"]:
+            if a["arc"] == ARC_VARIANT:
+                vset, _, selection = a["target"].partition("=")
+                variants[(a["layer"], a["prim"], vset)] = selection
+            else:
+                arcs.add((a["layer"], a["prim"], a["arc"], a["target"]))
+        return arcs, variants
+
+    old_arcs, old_variants = _split_arcs(old)
+    new_arcs, new_variants = _split_arcs(new)
+
+    changed_variants = []
+    for key, selection in new_variants.items():
+        before = old_variants.get(key)
+        if before != selection:
+            layer, prim, vset = key
+            changed_variants.append({"layer": layer, "prim": prim, "variant_set": vset, "old": before, "new": selection})
+    for key, before in old_variants.items():
+        if key not in new_variants:
+            layer, prim, vset = key
+            changed_variants.append({"layer": layer, "prim": prim, "variant_set": vset, "old": before, "new": None})
+
+    def _arc_dicts(keys):
+        return [{"layer": l, "prim": p, "arc": a, "target": t} for l, p, a, t in sorted(keys)]
+
+    def _edge_dicts(keys):
+        return [{"source": s, "arc": a, "target": t} for s, a, t in sorted(keys)]
+
+    return {
+        "added_layers": sorted(new_layers - old_layers),
+        "removed_layers": sorted(old_layers - new_layers),
+        "added_edges": _edge_dicts(new_edges - old_edges),
+        "removed_edges": _edge_dicts(old_edges - new_edges),
+        "added_arcs": _arc_dicts(new_arcs - old_arcs),
+        "removed_arcs": _arc_dicts(old_arcs - new_arcs),
+        "changed_variant_selections": changed_variants,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Diff two dependency graph snapshots")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--max-added-layers", type=int, default=None,
+                        help="exit with 1 if more layers than this were added")
+    args = parser.parse_args(argv)
+
+    diff = diff_snapshots(load_snapshot(args.old), load_snapshot(args.new))
+    json.dump(diff, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+    if args.max_added_layers is not None and len(diff["added_layers"]) > args.max_added_layers:
+        print(f"Dependency check failed: {len(diff['added_layers'])} layers added "
+              f"(max {args.max_added_layers})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,388 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pxr import Sdf
+from typing import Dict, List, Tuple
+
+ARC_SUBLAYER = "sublayer"
+ARC_REFERENCE = "reference"
+ARC_PAYLOAD = "payload"
+
+
+@dataclass
+class LayerEdge:
+    arc: str
+    asset_path: str      # as authored
+    target: str          # anchored asset path, key into LayerDependencyGraph.nodes
+
+
+@dataclass
+class LayerNode:
+    identifier: str
+    edges: List[LayerEdge] = field(default_factory=list)
+    error: str = ""
+
+
+@dataclass
+class LayerDependencyGraph:
+    """
+    Deduplicated layer DAG: one node per anchored layer path.
+    cycles holds the back edges (from, to) found while building.
+    """
+    root: str
+    nodes: Dict[str, LayerNode] = field(default_factory=dict)
+    cycles: List[Tuple[str, str]] = field(default_factory=list)
+
+    def is_back_edge(self, source: str, target: str) -> bool:
+        return (source, target) in self.cycles
+
+
+# root layer identifier -> graph, reused across window rebuilds
+_graph_cache: Dict[str, LayerDependencyGraph] = {}
+
+
+def _layer_asset_paths(layer: Sdf.Layer) -> Dict[str, List[str]]:
+    """
+    {arc: asset paths} of the layer's sublayers and its prim specs'
+    references / payloads, in authored order without duplicates.
+    Asset-valued attributes (textures...) are not layer dependencies.
+    """
+    asset_paths = {ARC_SUBLAYER: list(dict.fromkeys(layer.subLayerPaths)), ARC_REFERENCE: {}, ARC_PAYLOAD: {}}
+
+    def _visit(path: Sdf.Path):
+        if not (path.IsPrimPath() or path.IsPrimVariantSelectionPath()):
+            return
+        prim_spec = layer.GetPrimAtPath(path)
+        if not prim_spec:
+            return
+        for arc, key in ((ARC_REFERENCE, "references"), (ARC_PAYLOAD, "payload")):
+            for item in _list_op_items(prim_spec, key):
+                if item.assetPath:
+                    asset_paths[arc][item.assetPath] = None
+
+    layer.Traverse(Sdf.Path.absoluteRootPath, _visit)
+    asset_paths[ARC_REFERENCE] = list(asset_paths[ARC_REFERENCE])
+    asset_paths[ARC_PAYLOAD] = list(asset_paths[ARC_PAYLOAD])
+    return asset_paths
+
+
+def open_layer_node(identifier: str) -> LayerNode:
+    """
+    Open one layer and list its sublayer/reference/payload dependencies,
+    anchored against the layer itself (no hard-coded asset root).
+    """
+    node = LayerNode(identifier=identifier)
+    layer = Sdf.Layer.FindOrOpen(identifier)
+    if not layer:
+        node.error = "Could not open layer"
+        return node
+
+    for arc, asset_paths in _layer_asset_paths(layer).items():
+        for asset_path in asset_paths:
+            target = Sdf.ComputeAssetPathRelativeToLayer(layer, asset_path)
+            node.edges.append(LayerEdge(arc=arc, asset_path=asset_path, target=target))
+
+    return node
+
+
+def find_cycles(graph: LayerDependencyGraph) -> List[Tuple[str, str]]:
+    """
+    Iterative DFS from the root; an edge to a node still on the stack
+    closes a cycle.
+    """
+    WHITE, GRAY, BLACK = 0, 1, 2
+    color = {key: WHITE for key in graph.nodes}
+    back_edges = []
+
+    color[graph.root] = GRAY
+    stack = [(graph.root, iter(graph.nodes[graph.root].edges))]
+    while stack:
+        key, edges = stack[-1]
+        edge = next(edges, None)
+        if edge is None:
+            color[key] = BLACK
+            stack.pop()
+            continue
+
+        state = color.get(edge.target)
+        if state == GRAY:
+            back_edges.append((key, edge.target))
+        elif state == WHITE:
+            color[edge.target] = GRAY
+            stack.append((edge.target, iter(graph.nodes[edge.target].edges)))
+
+    return back_edges
+
+
+def build_layer_dependency_graph(root_layer: Sdf.Layer) -> LayerDependencyGraph:
+    """
+    Walk sublayers, references and payloads (like UsdUtils.ComputeAllDependencies),
+    opening every layer once.
+    """
+    graph = LayerDependencyGraph(root=root_layer.identifier)
+    pending = [root_layer.identifier]
+    while pending:
+        key = pending.pop()
+        if key in graph.nodes:
+            continue
+
+        try:
+            node = open_layer_node(key)
+        except Exception as e:
+            node = LayerNode(identifier=key, error=str(e))
+        graph.nodes[key] = node
+        pending.extend(e.target for e in node.edges if e.target not in graph.nodes)
+
+    graph.cycles = find_cycles(graph)
+    return graph
+
+
+def get_layer_dependency_graph(root_layer: Sdf.Layer, rebuild: bool = False) -> LayerDependencyGraph:
+    graph = _graph_cache.get(root_layer.identifier)
+    if graph is None or rebuild:
+        graph = build_layer_dependency_graph(root_layer)
+        _graph_cache[root_layer.identifier] = graph
+    return graph
+
+
+def find_cached_layer_dependency_graph(root_layer: Sdf.Layer) -> LayerDependencyGraph:
+    return _graph_cache.get(root_layer.identifier)
+
+
+def cache_layer_dependency_graph(graph: LayerDependencyGraph):
+    _graph_cache[graph.root] = graph
+
+
+def clear_layer_dependency_graphs():
+    _graph_cache.clear()
+
+
+class AsyncLayerGraphBuilder:
+    """
+    Discover the layer graph on a bounded thread pool.
+
+    Workers open layers concurrently and queue finished nodes; the UI
+    thread calls poll() (e.g. once per frame) to move them into graph,
+    so nodes stream in as they resolve. cancel() stops scheduling new
+    layers and drops the ones not started yet.
+    """
+
+    def __init__(self, root_layer: Sdf.Layer, max_workers: int = 8):
+        self.graph = LayerDependencyGraph(root=root_layer.identifier)
+        self.done = False
+        self.cancelled = False
+
+        self._queue = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._submitted = set()
+        self._pending = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="LayerGraph")
+
+    # ---------------------- Progress ----------------------
+    @property
+    def discovered_count(self) -> int:
+        return len(self._submitted)
+
+    @property
+    def resolved_count(self) -> int:
+        return len(self.graph.nodes)
+
+    # ---------------------- Control ----------------------
+    def start(self):
+        with self._lock:
+            self._submit(self.graph.root)
+
+    def cancel(self):
+        self._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.cancelled = True
+        self.done = True
+
+    def poll(self) -> int:
+        """
+        UI thread only. Returns the number of nodes added to graph.
+        """
+        added = 0
+        while True:
+            try:
+                node = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if node is None:
+                self.graph.cycles = find_cycles(self.graph)
+                self._executor.shutdown(wait=False)
+                self.done = True
+                continue
+
+            self.graph.nodes[node.identifier] = node
+            added += 1
+        return added
+
+    # ---------------------- Workers ----------------------
+    def _submit(self, key: str):
+        # caller holds self._lock
+        if key in self._submitted or self._cancel_event.is_set():
+            return
+        try:
+            self._executor.submit(self._work, key)
+        except RuntimeError:
+            # executor shut down by cancel() in the meantime
+            return
+        self._submitted.add(key)
+        self._pending += 1
+
+    def _work(self, key: str):
+        node = None
+        if not self._cancel_event.is_set():
+            try:
+                node = open_layer_node(key)
+            except Exception as e:
+                node = LayerNode(identifier=key, error=str(e))
+
+        with self._lock:
+            if node is not None:
+                self._queue.put(node)
+                for edge in node.edges:
+                    self._submit(edge.target)
+
+            self._pending -= 1
+            if self._pending == 0:
+                # every discovered layer is resolved
+                self._queue.put(None)
+
+
+# ------------------------------------------------------------
+# Prim composition arcs (spec level)
+# ------------------------------------------------------------
+
+ARC_INHERIT = "inherit"
+ARC_SPECIALIZE = "specialize"
+ARC_VARIANT = "variant"
+
+ARC_TYPES = [ARC_REFERENCE, ARC_PAYLOAD, ARC_INHERIT, ARC_SPECIALIZE, ARC_VARIANT]
+
+
+@dataclass
+class ArcRecord:
+    prim_path: str       # path in the authoring layer's namespace
+    arc: str
+    target: str          # asset path, </prim path>, or variantSet=selection
+    layer: str
+
+
+class ArcIndex:
+    """
+    Flat table of composition arcs, indexed by arc type and by target.
+    """
+
+    def __init__(self):
+        self.records: List[ArcRecord] = []
+        self._by_arc: Dict[str, List[int]] = {}
+        self._by_target: Dict[str, List[int]] = {}
+
+    def add(self, record: ArcRecord):
+        row = len(self.records)
+        self.records.append(record)
+        self._by_arc.setdefault(record.arc, []).append(row)
+        self._by_target.setdefault(record.target, []).append(row)
+
+    def __len__(self):
+        return len(self.records)
+
+    def targets(self) -> List[str]:
+        return sorted(self._by_target)
+
+    def query(self, arc: str = None, target: str = None) -> List[ArcRecord]:
+        """
+        arc: exact arc type (None = all)
+        target: exact target if indexed, else case-insensitive substring (None = all)
+        """
+        rows = self._by_arc.get(arc, []) if arc else None
+
+        if target:
+            if target in self._by_target:
+                target_rows = self._by_target[target]
+            else:
+                needle = target.lower()
+                target_rows = [
+                    row for key, key_rows in self._by_target.items()
+                    if needle in key.lower() for row in key_rows
+                ]
+            rows = target_rows if rows is None else sorted(set(rows).intersection(target_rows))
+
+        if rows is None:
+            return list(self.records)
+        return [self.records[row] for row in rows]
+
+
+def _list_op_items(prim_spec: Sdf.PrimSpec, key: str) -> list:
+    if not prim_spec.HasInfo(key):
+        return []
+    return prim_spec.GetInfo(key).GetAddedOrExplicitItems()
+
+
+def _format_arc_target(item) -> str:
+    """
+    Sdf.Reference / Sdf.Payload -> asset path (+ </prim>), Sdf.Path -> </path>
+    """
+    if isinstance(item, Sdf.Path):
+        return f"<{item}>"
+    if not item.assetPath:
+        return f"<{item.primPath}>"
+    if item.primPath.isEmpty:
+        return item.assetPath
+    return f"{item.assetPath}<{item.primPath}>"
+
+
+def scan_layer_arcs(layer: Sdf.Layer, index: ArcIndex):
+    """
+    Read composition arcs straight from the prim specs of one layer,
+    without composing any prim.
+    """
+    arc_keys = (
+        (ARC_REFERENCE, "references"),
+        (ARC_PAYLOAD, "payload"),
+        (ARC_INHERIT, "inheritPaths"),
+        (ARC_SPECIALIZE, "specializes"),
+    )
+
+    def _visit(path: Sdf.Path):
+        if not (path.IsPrimPath() or path.IsPrimVariantSelectionPath()):
+            return
+
+        prim_spec = layer.GetPrimAtPath(path)
+        if not prim_spec:
+            return
+
+        prim_path = path.pathString
+        for arc, key in arc_keys:
+            for item in _list_op_items(prim_spec, key):
+                index.add(ArcRecord(prim_path, arc, _format_arc_target(item), layer.identifier))
+
+        if prim_spec.HasInfo("variantSelection"):
+            for vset, selection in prim_spec.variantSelections.items():
+                index.add(ArcRecord(prim_path, ARC_VARIANT, f"{vset}={selection}", layer.identifier))
+
+    layer.Traverse(Sdf.Path.absoluteRootPath, _visit)
+
+
+def build_arc_index(layers: List[Sdf.Layer]) -> ArcIndex:
+    index = ArcIndex()
+    for layer in layers:
+        scan_layer_arcs(layer, index)
+    return index
+
+
+def has_composition_arc(prim) -> bool:
+    """
+    Composed check on a Usd.Prim (inherits, references, payload, variant sets).
+    """
+    return (
+        bool(prim.GetInherits().GetAllDirectInherits())
+        or bool(prim.GetMetadata("references"))
+        or bool(prim.GetMetadata("payload"))
+        or bool(prim.GetVariantSets().GetNames())
+    )
@@ -0,0 +1,211 @@
+from dataclasses import dataclass
+from pxr import Usd, UsdGeom, Sdf, Tf
+from typing import Dict, Optional, Set
+
+BUDGET_KEYS = ["points", "faces", "primvar_bytes", "prims"]
+
+
+@dataclass
+class GeometryCost:
+    points: int = 0
+    faces: int = 0
+    primvar_bytes: int = 0
+    prims: int = 0
+
+    def add(self, other: "GeometryCost"):
+        self.points += other.points
+        self.faces += other.faces
+        self.primvar_bytes += other.primvar_bytes
+        self.prims += other.prims
+
+    def copy(self) -> "GeometryCost":
+        return GeometryCost(self.points, self.faces, self.primvar_bytes, self.prims)
+
+
+def _value_bytes(value) -> int:
+    if value is None:
+        return 0
+    try:
+        return memoryview(value).nbytes
+    except TypeError:
+        return 0
+
+
+def compute_local_cost(prim: Usd.Prim) -> GeometryCost:
+    """
+    Cost of the prim alone. Only array lengths are used, the same
+    attributes PrimPropertyWindow._build_mesh reads.
+    """
+    cost = GeometryCost(prims=1)
+
+    if prim.IsA(UsdGeom.PointBased):
+        cost.points = len(UsdGeom.PointBased(prim).GetPointsAttr().Get() or [])
+    if prim.IsA(UsdGeom.Mesh):
+        cost.faces = len(UsdGeom.Mesh(prim).GetFaceVertexCountsAttr().Get() or [])
+
+    if prim.IsA(UsdGeom.Imageable):
+        for primvar in UsdGeom.PrimvarsAPI(prim).GetAuthoredPrimvars():
+            cost.primvar_bytes += _value_bytes(primvar.Get())
+            if primvar.IsIndexed():
+                cost.primvar_bytes += _value_bytes(primvar.GetIndices())
+
+    return cost
+
+
+def _is_traversed(prim: Usd.Prim) -> bool:
+    """
+    Same prims Usd.PrimRange visits with the default predicate.
+    """
+    return prim.IsActive() and prim.IsLoaded() and prim.IsDefined() and not prim.IsAbstract()
+
+
+class GeometryBudget:
+    """
+    Subtree totals (points, faces, primvar bytes, prim count) for a stage.
+
+    The first access aggregates the whole stage bottom-up in one pre/post-order
+    traversal. Edits are recorded from Usd.Notice.ObjectsChanged and applied
+    on the next access: changed prims get a new local cost, resynced subtrees
+    are re-traversed, then only the ancestor chains of those prims are summed
+    again.
+    """
+
+    def __init__(self):
+        self._stage = None
+        self._listener = None
+        self._local: Dict[Sdf.Path, GeometryCost] = {}
+        self._totals: Dict[Sdf.Path, GeometryCost] = {}
+        self._changed: Set[Sdf.Path] = set()
+        self._resynced: Set[Sdf.Path] = set()
+
+    # ---------------------- Stage binding ----------------------
+    def _bind(self, stage: Usd.Stage):
+        if self._stage is not None and stage == self._stage:
+            return
+
+        self.destroy()
+        self._stage = stage
+        self._listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+        )
+        self._aggregate_subtree(stage.GetPseudoRoot())
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+            self._listener = None
+        self._stage = None
+        self._local.clear()
+        self._totals.clear()
+        self._changed.clear()
+        self._resynced.clear()
+
+    # ---------------------- Access ----------------------
+    def get(self, stage: Usd.Stage, prim_path) -> Optional[GeometryCost]:
+        self._bind(stage)
+        self._flush()
+        return self._totals.get(Sdf.Path(prim_path))
+
+    # ---------------------- Aggregation ----------------------
+    def _aggregate_subtree(self, root: Usd.Prim):
+        """
+        Local costs on pre-visit, children folded into the parent on post-visit.
+        """
+        for path in [p for p in self._totals if p.HasPrefix(root.GetPath())]:
+            self._totals.pop(path, None)
+            self._local.pop(path, None)
+
+        it = iter(Usd.PrimRange.PreAndPostVisit(root))
+        for prim in it:
+            path = prim.GetPath()
+            if not it.IsPostVisit():
+                local = GeometryCost() if prim.IsPseudoRoot() else compute_local_cost(prim)
+                self._local[path] = local
+                self._totals[path] = local.copy()
+                continue
+
+            if path != root.GetPath():
+                self._totals[path.GetParentPath()].add(self._totals[path])
+
+    def _sum_children(self, prim: Usd.Prim):
+        path = prim.GetPath()
+        total = self._local[path].copy()
+        for child in prim.GetChildren():
+            child_total = self._totals.get(child.GetPath())
+            if child_total:
+                total.add(child_total)
+        self._totals[path] = total
+
+    def _flush(self):
+        if not self._changed and not self._resynced:
+            return
+
+        stage = self._stage
+        dirty = set()
+
+        # Outermost resyncs only, their subtrees are rebuilt from scratch
+        for path in sorted(self._resynced, key=lambda p: p.pathElementCount):
+            if any(path.HasPrefix(done) for done in dirty):
+                continue
+            prim = stage.GetPrimAtPath(path)
+            if prim and _is_traversed(prim) and (path.IsAbsoluteRootPath() or path.GetParentPath() in self._totals):
+                self._aggregate_subtree(prim)
+            else:
+                # removed or deactivated
+                for stale in [p for p in self._totals if p.HasPrefix(path)]:
+                    self._totals.pop(stale, None)
+                    self._local.pop(stale, None)
+            dirty.add(path)
+
+        for path in self._changed:
+            if path in self._local and not any(path.HasPrefix(done) for done in dirty):
+                prim = stage.GetPrimAtPath(path)
+                if prim:
+                    self._local[path] = compute_local_cost(prim)
+                    dirty.add(path)
+
+        self._changed.clear()
+        self._resynced.clear()
+
+        # Ancestor chains, deepest first so every parent sees final child totals
+        ancestors = set()
+        for path in dirty:
+            if path in self._local:
+                ancestors.add(path)
+            parent = path.GetParentPath()
+            while not parent.isEmpty:
+                ancestors.add(parent)
+                parent = parent.GetParentPath()
+
+        for path in sorted(ancestors, key=lambda p: p.pathElementCount, reverse=True):
+            prim = stage.GetPrimAtPath(path)
+            if prim and path in self._local:
+                self._sum_children(prim)
+
+    # ---------------------- Notices ----------------------
+    def _on_objects_changed(self, notice, sender):
+        for path in notice.GetResyncedPaths():
+            if path.IsPrimPath() or path.IsAbsoluteRootPath():
+                self._resynced.add(path)
+            else:
+                # added / removed property
+                self._changed.add(path.GetPrimPath())
+
+        for path in notice.GetChangedInfoOnlyPaths():
+            self._changed.add(path.GetPrimPath())
+
+
+def format_bytes(num_bytes: int) -> str:
+    for unit in ["B", "KB", "MB"]:
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+# Shared by the inspector windows
+_geometry_budget = GeometryBudget()
+
+
+def get_geometry_budget(stage: Usd.Stage, prim_path) -> Optional[GeometryCost]:
+    return _geometry_budget.get(stage, prim_path)
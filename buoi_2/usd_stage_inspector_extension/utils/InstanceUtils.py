@@ -0,0 +1,186 @@
+import hashlib
+from dataclasses import dataclass, field
+from pxr import Usd, Sdf
+from typing import Dict, List
+from .DependencyUtils import has_composition_arc
+
+# Rough per-prim cost of a non-instanced prim (prim index, specs, Hydra prim)
+PRIM_OVERHEAD_BYTES = 2048
+
+
+@dataclass
+class DuplicateGroup:
+    digest: str
+    paths: List[str] = field(default_factory=list)
+    prim_count: int = 0          # prims per copy
+    value_bytes: int = 0         # authored value bytes per copy
+
+    @property
+    def estimated_saving(self) -> int:
+        """
+        Bytes saved if the copies shared one prototype.
+        """
+        per_copy = self.value_bytes + self.prim_count * PRIM_OVERHEAD_BYTES
+        return (len(self.paths) - 1) * per_copy
+
+
+class _SubtreeHash:
+    __slots__ = ("hasher", "path", "prim_count", "value_bytes", "external")
+
+    def __init__(self, path: Sdf.Path):
+        self.hasher = hashlib.blake2b(digest_size=16)
+        self.path = path
+        self.prim_count = 1
+        self.value_bytes = 0
+        # relationship targets / connections outside the subtree, in first-use order
+        self.external: Dict[Sdf.Path, int] = {}
+
+    def add_target(self, target: Sdf.Path):
+        """
+        Targets inside the subtree are hashed relative to its root, so copies
+        binding their own materials still match. Targets outside are hashed
+        by index here and by absolute path in group_key.
+        """
+        if target.HasPrefix(self.path):
+            self.hasher.update(b"in:" + target.MakeRelativePath(self.path).pathString.encode("utf-8"))
+        else:
+            index = self.external.setdefault(target, len(self.external))
+            self.hasher.update(b"ex:%d" % index)
+
+    def add_targets(self, targets):
+        self.hasher.update(b"%d" % len(targets))
+        for target in targets:
+            self.add_target(target)
+
+    def group_key(self, digest: str) -> str:
+        if not self.external:
+            return digest
+        hasher = hashlib.blake2b(digest.encode("utf-8"), digest_size=16)
+        hasher.update("\n".join(p.pathString for p in self.external).encode("utf-8"))
+        return hasher.hexdigest()
+
+
+def _hash_value(hasher, value) -> int:
+    """
+    Feed value into hasher, returns its size in bytes.
+    Vt arrays are hashed straight from their buffer.
+    """
+    try:
+        buffer = memoryview(value)
+        hasher.update(buffer)
+        return buffer.nbytes
+    except TypeError:
+        data = repr(value).encode("utf-8")
+        hasher.update(data)
+        return len(data)
+
+
+def _hash_prim(node: _SubtreeHash, prim: Usd.Prim):
+    """
+    Prim type, composition arcs and authored property values (default and
+    time samples).
+    The prim's own name is left out so renamed copies still match.
+    """
+    hasher = node.hasher
+    hasher.update(prim.GetTypeName().encode("utf-8"))
+
+    for key in ("references", "payload", "inheritPaths", "specializes"):
+        list_op = prim.GetMetadata(key)
+        if list_op:
+            hasher.update(repr(list_op.GetAddedOrExplicitItems()).encode("utf-8"))
+
+    selections = prim.GetVariantSets().GetAllVariantSelections()
+    if selections:
+        hasher.update(repr(sorted(selections.items())).encode("utf-8"))
+
+    for attr in prim.GetAuthoredAttributes():
+        hasher.update(attr.GetName().encode("utf-8"))
+        node.value_bytes += _hash_value(hasher, attr.Get())
+        # animation must match too: sharing a prototype would drop one copy's samples
+        times = attr.GetTimeSamples()
+        hasher.update(repr(times).encode("utf-8"))
+        for sample_time in times:
+            node.value_bytes += _hash_value(hasher, attr.Get(sample_time))
+        if attr.HasAuthoredConnections():
+            node.add_targets(attr.GetConnections())
+
+    for rel in prim.GetAuthoredRelationships():
+        hasher.update(rel.GetName().encode("utf-8"))
+        node.add_targets(rel.GetTargets())
+
+
+def _merge_child(parent: _SubtreeHash, child: _SubtreeHash, name: str, digest: str):
+    """
+    Fold a finished child into its parent. The child's outside targets are
+    re-resolved against the parent: now inside, or still outside.
+    """
+    parent.hasher.update(name.encode("utf-8"))
+    parent.hasher.update(digest.encode("utf-8"))
+    for target in child.external:
+        parent.add_target(target)
+    parent.prim_count += child.prim_count
+    parent.value_bytes += child.value_bytes
+
+
+def find_duplicate_subtrees(stage: Usd.Stage, min_copies: int = 2) -> List[DuplicateGroup]:
+    """
+    Hash every subtree bottom-up in one pre/post-order traversal and group
+    identical subtrees rooted at non-instanced prims with composition arcs.
+
+    Returns groups ranked by estimated memory saved; a group nested inside
+    the copies of a better-ranked group is dropped.
+    """
+    groups: Dict[str, DuplicateGroup] = {}
+    stack: List[_SubtreeHash] = []
+
+    prim_range = Usd.PrimRange.PreAndPostVisit(stage.GetPseudoRoot())
+    iterator = iter(prim_range)
+    for prim in iterator:
+        if prim.IsPseudoRoot():
+            continue
+
+        if not iterator.IsPostVisit():
+            node = _SubtreeHash(prim.GetPath())
+            _hash_prim(node, prim)
+            stack.append(node)
+            continue
+
+        node = stack.pop()
+        digest = node.hasher.hexdigest()
+
+        if stack:
+            _merge_child(stack[-1], node, prim.GetName(), digest)
+
+        if prim.IsInstance() or prim.IsInstanceable() or not has_composition_arc(prim):
+            continue
+
+        key = node.group_key(digest)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = DuplicateGroup(key, [], node.prim_count, node.value_bytes)
+        group.paths.append(prim.GetPath().pathString)
+
+    ranked = sorted(
+        (g for g in groups.values() if len(g.paths) >= min_copies),
+        key=lambda g: g.estimated_saving,
+        reverse=True
+    )
+
+    # Keep the outermost duplicates: drop copies living inside accepted ones
+    accepted_paths = set()
+    result = []
+    for group in ranked:
+        kept = []
+        for path in group.paths:
+            parent = Sdf.Path(path).GetParentPath()
+            while not parent.IsAbsoluteRootPath() and parent.pathString not in accepted_paths:
+                parent = parent.GetParentPath()
+            if parent.IsAbsoluteRootPath():
+                kept.append(path)
+        if len(kept) < min_copies:
+            continue
+        group.paths = kept
+        accepted_paths.update(kept)
+        result.append(group)
+
+    return result
@@ -0,0 +1,289 @@
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pxr import Ar, Usd, Sdf
+from typing import Dict, List
+from .DependencyUtils import (
+    LayerDependencyGraph,
+    build_layer_dependency_graph,
+    cache_layer_dependency_graph,
+    find_cached_layer_dependency_graph,
+    get_layer_dependency_graph,
+)
+
+PROFILE_COLUMNS = ["identifier", "format", "file_size", "spec_count", "time_samples", "reopen_ms", "share", "error"]
+
+
+def _count_specs_and_samples(layer: Sdf.Layer):
+    counts = {"specs": 0, "time_samples": 0}
+
+    def _visit(path: Sdf.Path):
+        counts["specs"] += 1
+        if path.IsPropertyPath():
+            counts["time_samples"] += layer.GetNumTimeSamplesForPath(path)
+
+    layer.Traverse(Sdf.Path.absoluteRootPath, _visit)
+    return counts["specs"], counts["time_samples"]
+
+
+def _time_reopen(real_path: str) -> float:
+    """
+    Open the file again as an anonymous layer, so the layer registry
+    (and the copy held by the stage) is bypassed. Returns milliseconds.
+    """
+    start = time.perf_counter()
+    layer = Sdf.Layer.OpenAsAnonymous(real_path)
+    elapsed = (time.perf_counter() - start) * 1000.0
+    del layer
+    return elapsed
+
+
+def profile_layer(layer: Sdf.Layer) -> dict:
+    real_path = layer.realPath
+    on_disk = bool(real_path) and os.path.isfile(real_path)
+    spec_count, time_samples = _count_specs_and_samples(layer)
+
+    return {
+        "identifier": layer.identifier,
+        "format": layer.GetFileFormat().formatId,
+        "file_size": os.path.getsize(real_path) if on_disk else 0,
+        "spec_count": spec_count,
+        "time_samples": time_samples,
+        "reopen_ms": _time_reopen(real_path) if on_disk else 0.0,
+        "error": "",
+    }
+
+
+def profile_layer_file(identifier: str, real_path: str) -> dict:
+    """
+    Same row as profile_layer, from a private anonymous copy of the file:
+    safe on a worker thread, but counts what is on disk (unsaved edits of
+    the live layer are not seen).
+    """
+    start = time.perf_counter()
+    layer = Sdf.Layer.OpenAsAnonymous(real_path)
+    reopen_ms = (time.perf_counter() - start) * 1000.0
+    if not layer:
+        raise RuntimeError(f"Could not open {real_path}")
+    spec_count, time_samples = _count_specs_and_samples(layer)
+
+    return {
+        "identifier": identifier,
+        "format": layer.GetFileFormat().formatId,
+        "file_size": os.path.getsize(real_path),
+        "spec_count": spec_count,
+        "time_samples": time_samples,
+        "reopen_ms": reopen_ms,
+        "error": "",
+    }
+
+
+def error_row(identifier: str, error: str) -> dict:
+    """
+    Row for a layer (or graph) that could not be profiled; ranks last.
+    """
+    return {
+        "identifier": identifier,
+        "format": "",
+        "file_size": 0,
+        "spec_count": 0,
+        "time_samples": 0,
+        "reopen_ms": 0.0,
+        "error": error,
+    }
+
+
+def _graph_error_row(root_layer: Sdf.Layer, error: str) -> dict:
+    return error_row(f"dependency graph of {root_layer.identifier}", error)
+
+
+def rank_layer_profile(rows: List[dict]):
+    """
+    Sort rows by reopen time; each row gets its share of the total and
+    "hot" marks the layers making up the first 80% of it.
+    """
+    rows.sort(key=lambda r: r["reopen_ms"], reverse=True)
+
+    total_ms = sum(r["reopen_ms"] for r in rows) or 1.0
+    cumulative = 0.0
+    for row in rows:
+        row["share"] = row["reopen_ms"] / total_ms
+        row["hot"] = cumulative < 0.8
+        cumulative += row["share"]
+
+
+def profile_stage_layers(stage: Usd.Stage, include_dependencies: bool = True) -> List[dict]:
+    """
+    Profile every used layer of stage (plus the layers of the dependency
+    graph, e.g. unloaded payloads), on the calling thread. The window uses
+    AsyncLayerProfiler instead.
+    """
+    layers: Dict[str, Sdf.Layer] = {layer.identifier: layer for layer in stage.GetUsedLayers()}
+    rows = []
+
+    if include_dependencies:
+        try:
+            graph = get_layer_dependency_graph(stage.GetRootLayer())
+        except Exception as e:
+            graph = None
+            rows.append(_graph_error_row(stage.GetRootLayer(), str(e)))
+
+        for key, node in (graph.nodes.items() if graph else ()):
+            if key in layers:
+                continue
+            if node.error:
+                rows.append(error_row(key, node.error))
+                continue
+            try:
+                layer = Sdf.Layer.FindOrOpen(key)
+            except Exception as e:
+                rows.append(error_row(key, str(e)))
+                continue
+            if layer and layer.identifier not in layers:
+                layers[layer.identifier] = layer
+
+    for layer in layers.values():
+        try:
+            rows.append(profile_layer(layer))
+        except Exception as e:
+            rows.append(error_row(layer.identifier, str(e)))
+    rank_layer_profile(rows)
+    return rows
+
+
+class AsyncLayerProfiler:
+    """
+    Profile the layers of a stage on a worker thread.
+
+    start() profiles the in-memory-only layers (anonymous, not on disk) on
+    the calling thread and hands the files to the worker, which reopens
+    each one as a private anonymous copy, then walks the dependency graph
+    (built there if not cached) for layers the stage does not use, such as
+    unloaded payloads. The UI thread calls poll() (e.g. once per frame) to
+    collect rows. One worker by default, so reopen times are not skewed by
+    concurrent parses.
+    """
+
+    def __init__(self, stage: Usd.Stage, include_dependencies: bool = True):
+        self.rows: List[dict] = []
+        self.done = False
+        self.cancelled = False
+
+        self._root_layer = stage.GetRootLayer()
+        self._used_layers = list(stage.GetUsedLayers())
+        self._include_dependencies = include_dependencies
+        self._queue = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LayerProfiler")
+
+    # ---------------------- Control ----------------------
+    def start(self):
+        files = []
+        for layer in self._used_layers:
+            real_path = layer.realPath
+            if real_path and os.path.isfile(real_path):
+                files.append((layer.identifier, real_path))
+                continue
+            try:
+                self.rows.append(profile_layer(layer))
+            except Exception as e:
+                self.rows.append(error_row(layer.identifier, str(e)))
+        graph = find_cached_layer_dependency_graph(self._root_layer) if self._include_dependencies else None
+        self._executor.submit(self._work, files, graph)
+
+    def cancel(self):
+        self._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.cancelled = True
+        self.done = True
+
+    def poll(self) -> int:
+        """
+        UI thread only. Returns the number of rows added.
+        """
+        added = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None:
+                rank_layer_profile(self.rows)
+                self._executor.shutdown(wait=False)
+                self.done = True
+            elif isinstance(item, LayerDependencyGraph):
+                cache_layer_dependency_graph(item)
+            else:
+                self.rows.append(item)
+                added += 1
+        return added
+
+    # ---------------------- Worker ----------------------
+    def _profile_files(self, files):
+        for identifier, real_path in files:
+            if self._cancel_event.is_set():
+                return
+            try:
+                self._queue.put(profile_layer_file(identifier, real_path))
+            except Exception as e:
+                self._queue.put(error_row(identifier, str(e)))
+
+    def _dependency_files(self, graph):
+        """
+        (identifier, real path) of graph layers the stage does not use;
+        failing nodes are queued as error rows and skipped.
+        """
+        # resolved here rather than opened: no registry layer is kept alive
+        profiled = {layer.identifier for layer in self._used_layers}
+        resolver = Ar.GetResolver()
+        files = []
+        for key, node in graph.nodes.items():
+            if key in profiled:
+                continue
+            if node.error:
+                self._queue.put(error_row(key, node.error))
+                continue
+            try:
+                real_path = str(resolver.Resolve(key))
+            except Exception as e:
+                self._queue.put(error_row(key, str(e)))
+                continue
+            if real_path and os.path.isfile(real_path):
+                files.append((key, real_path))
+            else:
+                self._queue.put(error_row(key, "Could not resolve layer"))
+        return files
+
+    def _work(self, files, graph):
+        try:
+            self._profile_files(files)
+
+            if self._include_dependencies and not self._cancel_event.is_set():
+                if graph is None:
+                    try:
+                        graph = build_layer_dependency_graph(self._root_layer)
+                        self._queue.put(graph)
+                    except Exception as e:
+                        self._queue.put(_graph_error_row(self._root_layer, str(e)))
+                if graph is not None:
+                    self._profile_files(self._dependency_files(graph))
+        except Exception as e:
+            self._queue.put(error_row(self._root_layer.identifier, f"Profiler stopped: {e}"))
+        finally:
+            self._queue.put(None)
+
+
+def write_layer_profile(rows: List[dict], file_path: str):
+    folder = os.path.dirname(file_path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder, exist_ok=True)
+
+    with open(file_path, "w") as f:
+        json.dump({
+            "total_reopen_ms": sum(r["reopen_ms"] for r in rows),
+            "layers": rows,
+        }, f, indent=2)
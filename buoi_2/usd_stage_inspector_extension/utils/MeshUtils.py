@@ -0,0 +1,132 @@
+import numpy as np
+from pxr import Usd, UsdGeom
+from .CacheUtils import StageNoticeCache
+
+# Faces with a smaller area are reported as zero-area
+ZERO_AREA_EPSILON = 1e-12
+# n-gon histogram buckets: 3, 4, ..., NGON_HISTOGRAM_MAX - 1, then ">= NGON_HISTOGRAM_MAX"
+NGON_HISTOGRAM_MAX = 8
+
+# Shared by every PrimPropertyWindow, any edit on the prim drops its entry
+_mesh_diagnostics_cache = StageNoticeCache()
+
+
+def _read_array(attr, dtype, width=None) -> np.ndarray:
+    value = attr.Get() if attr else None
+    if value is None or len(value) == 0:
+        return np.zeros((0, width) if width else 0, dtype=dtype)
+    return np.asarray(value, dtype=dtype)
+
+
+def _expected_element_count(interpolation, num_points, num_faces, num_face_vertices):
+    return {
+        UsdGeom.Tokens.constant: 1,
+        UsdGeom.Tokens.uniform: num_faces,
+        UsdGeom.Tokens.vertex: num_points,
+        UsdGeom.Tokens.varying: num_points,
+        UsdGeom.Tokens.faceVarying: num_face_vertices,
+    }.get(interpolation)
+
+
+def _check_normals(mesh: UsdGeom.Mesh, num_points, num_faces, num_face_vertices) -> dict:
+    """
+    primvars:normals wins over normals when authored; indexed primvars
+    are checked through their index count.
+    """
+    primvar = UsdGeom.PrimvarsAPI(mesh.GetPrim()).GetPrimvar("normals")
+    if primvar and primvar.HasAuthoredValue():
+        source = "primvars:normals"
+        interpolation = primvar.GetInterpolation()
+        values = primvar.Get()
+        indices = primvar.GetIndices() if primvar.IsIndexed() else None
+        count = len(indices) if indices is not None else len(values or [])
+    else:
+        source = "normals"
+        interpolation = mesh.GetNormalsInterpolation()
+        count = len(mesh.GetNormalsAttr().Get() or [])
+
+    if count == 0:
+        return {"source": None, "interpolation": None, "count": 0, "expected": None, "valid": True}
+
+    expected = _expected_element_count(interpolation, num_points, num_faces, num_face_vertices)
+    return {
+        "source": source,
+        "interpolation": str(interpolation),
+        "count": count,
+        "expected": expected,
+        "valid": expected == count,
+    }
+
+
+def compute_mesh_diagnostics(mesh: UsdGeom.Mesh) -> dict:
+    """
+    Vectorized checks straight on the Vt arrays (no per-face Python loop).
+    """
+    points = _read_array(mesh.GetPointsAttr(), np.float64, 3).reshape(-1, 3)
+    counts = _read_array(mesh.GetFaceVertexCountsAttr(), np.int64)
+    indices = _read_array(mesh.GetFaceVertexIndicesAttr(), np.int64)
+
+    num_points = len(points)
+    num_faces = len(counts)
+    num_face_vertices = len(indices)
+
+    result = {
+        "points": num_points,
+        "faces": num_faces,
+        "face_vertices": num_face_vertices,
+        "bounds": None,
+        "triangles": int(np.maximum(counts - 2, 0).sum()),
+        "ngon_histogram": {},
+        "degenerate_faces": int((counts < 3).sum()),
+        "zero_area_faces": None,
+        "out_of_range_indices": int(((indices < 0) | (indices >= num_points)).sum()),
+        "counts_match_indices": int(counts.sum()) == num_face_vertices,
+        "normals": _check_normals(mesh, num_points, num_faces, num_face_vertices),
+    }
+
+    if num_points:
+        result["bounds"] = (points.min(axis=0).tolist(), points.max(axis=0).tolist())
+
+    if num_faces:
+        histogram = np.bincount(np.minimum(counts, NGON_HISTOGRAM_MAX).clip(min=0), minlength=NGON_HISTOGRAM_MAX + 1)
+        result["ngon_histogram"] = {
+            (str(n) if n < NGON_HISTOGRAM_MAX else f">={NGON_HISTOGRAM_MAX}"): int(histogram[n])
+            for n in range(3, NGON_HISTOGRAM_MAX + 1) if histogram[n]
+        }
+
+    # Face areas need a consistent topology
+    if num_faces and result["counts_match_indices"] and not result["out_of_range_indices"]:
+        result["zero_area_faces"] = int((_face_areas(points, counts, indices) <= ZERO_AREA_EPSILON).sum())
+
+    return result
+
+
+def _face_areas(points: np.ndarray, counts: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Fan-triangulate every face at once and sum the triangle areas per face.
+    Faces with fewer than 3 vertices get area 0.
+    """
+    starts = np.cumsum(counts) - counts
+    tris_per_face = np.maximum(counts - 2, 0)
+    num_tris = int(tris_per_face.sum())
+    if num_tris == 0:
+        return np.zeros(len(counts))
+
+    face_of_tri = np.repeat(np.arange(len(counts)), tris_per_face)
+    # k = 1 .. count-2 inside each face
+    first_tri = np.cumsum(tris_per_face) - tris_per_face
+    k = np.arange(num_tris) - np.repeat(first_tri, tris_per_face) + 1
+
+    base = starts[face_of_tri]
+    p0 = points[indices[base]]
+    p1 = points[indices[base + k]]
+    p2 = points[indices[base + k + 1]]
+
+    tri_areas = 0.5 * np.linalg.norm(np.cross(p1 - p0, p2 - p0), axis=1)
+    return np.bincount(face_of_tri, weights=tri_areas, minlength=len(counts))
+
+
+def get_mesh_diagnostics(stage: Usd.Stage, prim: Usd.Prim) -> dict:
+    return _mesh_diagnostics_cache.get(
+        stage, prim.GetPath(), lambda: compute_mesh_diagnostics(UsdGeom.Mesh(prim))
+    )
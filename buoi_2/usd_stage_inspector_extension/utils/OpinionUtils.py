@@ -0,0 +1,143 @@
+import json
+import os
+from pxr import Usd, Sdf
+from typing import Dict, Optional, Set, Tuple
+
+
+# per_path key: (None, path) for root layer stack layers, whose paths are
+# stage paths; (layer identifier, path) for any other layer
+OpinionKey = Tuple[Optional[str], Sdf.Path]
+
+
+def _count_layer_opinions(layer: Sdf.Layer, group: Optional[str], per_path: Dict[OpinionKey, dict]) -> dict:
+    """
+    Walk layer once with Sdf.Layer.Traverse and accumulate spec counts
+    per layer and per (group, prim path) (variant selections stripped).
+    """
+    layer_counts = {"identifier": layer.identifier, "prim_specs": 0, "property_specs": 0}
+
+    def _visit(path: Sdf.Path):
+        if path.IsPropertyPath():
+            kind = "property_specs"
+            prim_path = path.GetPrimPath().StripAllVariantSelections()
+        elif path.IsPrimPath() or (path.IsPrimVariantSelectionPath() and path.GetVariantSelection()[1]):
+            kind = "prim_specs"
+            prim_path = path.StripAllVariantSelections()
+        else:
+            # pseudo-root, variant sets, relationship targets, connections...
+            return
+
+        layer_counts[kind] += 1
+
+        key = (group, prim_path)
+        entry = per_path.get(key)
+        if entry is None:
+            entry = per_path[key] = {"prim_specs": 0, "property_specs": 0, "layers": set()}
+        entry[kind] += 1
+        entry["layers"].add(layer.identifier)
+
+    layer.Traverse(Sdf.Path.absoluteRootPath, _visit)
+    return layer_counts
+
+
+def _map_to_stage_paths(stage: Usd.Stage, root_stack: Set[str], per_path: Dict[OpinionKey, dict]):
+    """
+    One pass over the composed prims: add the counts of every (layer, path)
+    in a prim's prim stack to that prim's stage path.
+
+    Returns ({stage path: entry}, keys reached by composition). A referenced
+    spec used by several prims counts for each of them.
+    """
+    composed: Dict[Sdf.Path, dict] = {}
+    mapped = set()
+    # instanced subtrees only compose under their prototypes
+    roots = [stage.GetPseudoRoot()] + list(stage.GetPrototypes())
+    for prim in (p for root in roots for p in Usd.PrimRange(root, Usd.PrimAllPrimsPredicate)):
+        if prim.IsPseudoRoot():
+            continue
+
+        seen = set()
+        for spec in prim.GetPrimStack():
+            identifier = spec.layer.identifier
+            key = (None if identifier in root_stack else identifier, spec.path.StripAllVariantSelections())
+            source = per_path.get(key)
+            if source is None or key in seen:
+                continue
+            seen.add(key)
+            mapped.add(key)
+
+            entry = composed.get(prim.GetPath())
+            if entry is None:
+                entry = composed[prim.GetPath()] = {"prim_specs": 0, "property_specs": 0, "layers": set()}
+            entry["prim_specs"] += source["prim_specs"]
+            entry["property_specs"] += source["property_specs"]
+            entry["layers"] |= source["layers"]
+
+    return composed, mapped
+
+
+def _prim_row(path: Sdf.Path, layer: Optional[str], stage_path: Optional[Sdf.Path], entry: dict) -> dict:
+    return {
+        "path": path.pathString,
+        "layer": layer,
+        "stage_path": stage_path.pathString if stage_path else None,
+        "prim_specs": entry["prim_specs"],
+        "property_specs": entry["property_specs"],
+        "layer_count": len(entry["layers"]),
+    }
+
+
+def build_opinion_heat_map(stage: Usd.Stage, top_n: int = 20) -> dict:
+    """
+    Count prim/property specs for every used layer of stage, one Traverse per layer.
+
+    Specs of layers outside the root layer stack are kept per layer (their
+    paths are inside the referenced asset, so "/Body" of two assets are
+    different prims) and mapped to stage paths through the composed prim
+    stacks. Specs no composed prim uses are listed under their own layer
+    with no stage path.
+
+    Returns:
+        {
+            "layers": [{"identifier", "prim_specs", "property_specs"}, ...]  heaviest first,
+            "prims":  [{"path", "layer", "stage_path", "prim_specs", "property_specs", "layer_count"}, ...]
+                      heaviest first,
+        }
+    """
+    root_stack = {layer.identifier for layer in stage.GetLayerStack(includeSessionLayers=True)}
+    per_path: Dict[OpinionKey, dict] = {}
+    layers = [
+        _count_layer_opinions(layer, None if layer.identifier in root_stack else layer.identifier, per_path)
+        for layer in stage.GetUsedLayers()
+    ]
+
+    layers.sort(key=lambda e: (e["property_specs"] + e["prim_specs"]), reverse=True)
+
+    composed, mapped = _map_to_stage_paths(stage, root_stack, per_path)
+    prims = [_prim_row(path, None, path, entry) for path, entry in composed.items()]
+    for (group, path), entry in per_path.items():
+        if (group, path) in mapped:
+            continue
+        # root layer stack paths are stage paths even when not traversed (inactive, unloaded)
+        stage_path = path if group is None and stage.GetPrimAtPath(path) else None
+        prims.append(_prim_row(path, group, stage_path, entry))
+
+    # most overridden first: prims with opinions in many layers, then by opinion volume
+    prims.sort(key=lambda e: (e["layer_count"], e["property_specs"]), reverse=True)
+
+    return {
+        "root_layer": stage.GetRootLayer().identifier,
+        "total_layers": len(layers),
+        "total_prim_paths": len(prims),
+        "layers": layers[:top_n] if top_n else layers,
+        "prims": prims[:top_n] if top_n else prims,
+    }
+
+
+def write_opinion_report(report: dict, file_path: str):
+    folder = os.path.dirname(file_path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder, exist_ok=True)
+
+    with open(file_path, "w") as f:
+        json.dump(report, f, indent=2)
@@ -0,0 +1,134 @@
+import sys
+import numpy as np
+from typing import Dict, Iterable, Iterator, List
+
+PRIM_ID_DTYPE = np.int32
+
+
+class PathTable:
+    """
+    Interns prim paths to dense integer ids, append only, so ids stay valid
+    for every PrimIdSet built on the table.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._paths: List[str] = []
+        self._types: List[str] = []
+
+    def __len__(self):
+        return len(self._paths)
+
+    def intern(self, path: str, type_name: str = "") -> int:
+        prim_id = self._ids.get(path)
+        if prim_id is None:
+            prim_id = len(self._paths)
+            self._ids[path] = prim_id
+            self._paths.append(path)
+            self._types.append(sys.intern(type_name))
+        elif type_name:
+            self._types[prim_id] = sys.intern(type_name)
+        return prim_id
+
+    def find(self, path: str) -> int:
+        """
+        Id of path, -1 if it was never interned.
+        """
+        return self._ids.get(path, -1)
+
+    def path(self, prim_id: int) -> str:
+        return self._paths[prim_id]
+
+    def type_name(self, prim_id: int) -> str:
+        return self._types[prim_id]
+
+
+class PrimIdSet:
+    """
+    Set of prims as a sorted, unique int32 array of PathTable ids.
+
+    Union / intersection / difference are vectorized over boolean masks.
+    Iterating, `in` and add/discard work with path strings so the set can
+    stand in for a set of paths.
+    """
+    __slots__ = ("table", "ids")
+
+    def __init__(self, table: PathTable, ids=None):
+        self.table = table
+        if ids is None:
+            self.ids = np.empty(0, dtype=PRIM_ID_DTYPE)
+        else:
+            self.ids = np.unique(np.asarray(ids, dtype=PRIM_ID_DTYPE))
+
+    @classmethod
+    def from_paths(cls, table: PathTable, paths: Iterable[str]) -> "PrimIdSet":
+        return cls(table, np.fromiter((table.intern(p) for p in paths), dtype=PRIM_ID_DTYPE))
+
+    def _wrap(self, ids: np.ndarray) -> "PrimIdSet":
+        result = PrimIdSet(self.table)
+        result.ids = ids
+        return result
+
+    # ---------------------- Set algebra ----------------------
+    def _mask(self) -> np.ndarray:
+        """
+        Membership mask over the whole path table (ids are dense, so this is
+        cheaper than the sort-based np.union1d / np.setdiff1d).
+        """
+        mask = np.zeros(len(self.table), dtype=bool)
+        mask[self.ids] = True
+        return mask
+
+    def __or__(self, other: "PrimIdSet") -> "PrimIdSet":
+        mask = self._mask()
+        mask[other.ids] = True
+        return self._wrap(np.flatnonzero(mask).astype(PRIM_ID_DTYPE))
+
+    def __and__(self, other: "PrimIdSet") -> "PrimIdSet":
+        return self._wrap(self.ids[other._mask()[self.ids]])
+
+    def __sub__(self, other: "PrimIdSet") -> "PrimIdSet":
+        return self._wrap(self.ids[~other._mask()[self.ids]])
+
+    # ---------------------- Path access ----------------------
+    def __len__(self):
+        return len(self.ids)
+
+    def __bool__(self):
+        return len(self.ids) > 0
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.table.path(i) for i in self.ids.tolist())
+
+    def __contains__(self, path: str) -> bool:
+        prim_id = self.table.find(path)
+        if prim_id < 0:
+            return False
+        index = np.searchsorted(self.ids, prim_id)
+        return index < len(self.ids) and self.ids[index] == prim_id
+
+    def add(self, path: str):
+        prim_id = self.table.intern(path)
+        index = np.searchsorted(self.ids, prim_id)
+        if index == len(self.ids) or self.ids[index] != prim_id:
+            self.ids = np.insert(self.ids, index, prim_id)
+
+    def discard(self, path: str):
+        prim_id = self.table.find(path)
+        if prim_id < 0:
+            return
+        index = np.searchsorted(self.ids, prim_id)
+        if index < len(self.ids) and self.ids[index] == prim_id:
+            self.ids = np.delete(self.ids, index)
+
+    def clear(self):
+        self.ids = np.empty(0, dtype=PRIM_ID_DTYPE)
+
+    def paths(self) -> List[str]:
+        return list(self)
+
+    def to_records(self) -> List[dict]:
+        """
+        [{"path", "type"}], the format of the filter export.
+        """
+        return [{"path": self.table.path(i), "type": self.table.type_name(i)} for i in self.ids.tolist()]
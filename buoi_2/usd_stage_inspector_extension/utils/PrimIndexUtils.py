@@ -0,0 +1,425 @@
+import hashlib
+import os
+import sqlite3
+import time
+from pxr import Usd, Sdf, Tf
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from .DependencyUtils import has_composition_arc
+from .FilterUtils import _match_filter
+from .GeometryBudgetUtils import _is_traversed
+
+INDEX_CACHE_DIR = "../outputs/index_cache"
+INDEX_VERSION = "2"
+# Rows per executemany while indexing
+INDEX_BATCH_SIZE = 10000
+
+# layer_prims key for the session layer specs and prims edited in a session
+SESSION_KEY = "<session>"
+
+INDEX_MODE_CACHED = "cached"
+INDEX_MODE_INCREMENTAL = "incremental"
+INDEX_MODE_FULL = "full"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS layers (identifier TEXT PRIMARY KEY, fingerprint TEXT, in_root_stack INTEGER);
+CREATE TABLE IF NOT EXISTS layer_prims (identifier TEXT, path TEXT);
+CREATE INDEX IF NOT EXISTS layer_prims_identifier ON layer_prims (identifier);
+CREATE TABLE IF NOT EXISTS prims (path TEXT PRIMARY KEY, name TEXT, type TEXT, attrs TEXT);
+CREATE INDEX IF NOT EXISTS prims_name ON prims (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS prims_type ON prims (type COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS arc_targets (target TEXT, path TEXT);
+CREATE INDEX IF NOT EXISTS arc_targets_target ON arc_targets (target);
+CREATE INDEX IF NOT EXISTS arc_targets_path ON arc_targets (path);
+"""
+
+
+def layer_fingerprint(layer: Sdf.Layer) -> Optional[str]:
+    """
+    mtime + size of the layer file. None when it cannot be trusted
+    (anonymous, unsaved edits, not on disk): such layers always count as changed.
+    """
+    if layer.anonymous or layer.dirty or not layer.realPath:
+        return None
+    try:
+        st = os.stat(layer.realPath)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _collect_prim_spec_paths(layer: Sdf.Layer) -> Set[str]:
+    """
+    Prim paths the layer has specs for, variant selections stripped.
+    """
+    paths = set()
+
+    def visit(path):
+        if path.IsPrimPath() or path.IsPrimVariantSelectionPath():
+            paths.add(path.StripAllVariantSelections().pathString)
+
+    layer.Traverse(Sdf.Path.absoluteRootPath, visit)
+    paths.discard("/")
+    return paths
+
+
+def _prim_row(prim: Usd.Prim) -> Tuple[str, str, str, str]:
+    # space-delimited so a name is matched with instr(attrs, ' name ')
+    attrs = " " + " ".join(attr.GetName() for attr in prim.GetAttributes()) + " "
+    return prim.GetPath().pathString, prim.GetName(), prim.GetTypeName(), attrs
+
+
+def _internal_arc_targets(prim: Usd.Prim) -> Set[str]:
+    """
+    Paths in the root layer stack that prim composes from through an arc
+    (inherits, specializes, internal references, implied class arcs).
+    Their specs change prim without any spec under prim's own path changing.
+    """
+    root_node = prim.GetPrimIndex().rootNode
+    root_stack = root_node.layerStack.identifier
+    targets = set()
+    nodes = list(root_node.children)
+    while nodes:
+        node = nodes.pop()
+        if node.layerStack.identifier == root_stack:
+            targets.add(node.path.StripAllVariantSelections().pathString)
+        nodes.extend(node.children)
+    return targets
+
+
+def _glob_prefilter(pattern: str) -> Optional[str]:
+    """
+    fnmatch pattern as a SQLite GLOB pattern matching at least the same
+    names, or None when GLOB cannot be used as a prefilter: fnmatch folds
+    case where os.path.normcase does (Windows), and treats '[^' and an
+    unclosed '[' literally where GLOB does not.
+    """
+    if os.path.normcase("A") != "A":
+        return None
+
+    result = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c != "[":
+            result.append(c)
+            continue
+
+        j = i
+        if j < n and pattern[j] == "!":
+            j += 1
+        if j < n and pattern[j] == "]":
+            j += 1
+        j = pattern.find("]", j)
+        if j < 0 or pattern[i:i + 1] == "^":
+            return None
+        stuff = pattern[i:j]
+        if stuff.startswith("!"):
+            stuff = "^" + stuff[1:]
+        result.append("[" + stuff + "]")
+        i = j + 1
+    return "".join(result)
+
+
+def _subtree_range(path: str) -> Tuple[str, str]:
+    """
+    [low, high) bounds of the descendants of path on the text primary key
+    ('0' is the character right after '/').
+    """
+    prefix = path.rstrip("/")
+    return prefix + "/", prefix + "0"
+
+
+class PrimIndex:
+    """
+    Prim names, types and attribute names of a stage, kept in a SQLite file
+    so filters do not need a stage traversal.
+
+    The file is keyed by the root layer and stores a fingerprint per used
+    layer. sync() compares them:
+      - nothing changed: the stored index is used as is;
+      - only root layer stack layers changed: prims those layers have specs
+        for (before and after) are re-indexed, whole subtrees for prims with
+        composition arcs and for prims inheriting / specializing /
+        referencing one of those paths (arc targets are stored per prim);
+      - any other layer changed: full re-index, since its namespace does not
+        map to stage paths without composing.
+    Within a session, edits are followed through Usd.Notice.ObjectsChanged.
+    """
+
+    def __init__(self, stage: Usd.Stage, cache_dir: str = INDEX_CACHE_DIR):
+        self.stage = stage
+        digest = hashlib.sha1(stage.GetRootLayer().identifier.encode("utf-8")).hexdigest()[:16]
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, f"{digest}.sqlite")
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.create_function("REGEXP", 2, lambda pattern, text: _match_filter(text or "", pattern, use_regex=True))
+        self._conn.executescript(_SCHEMA)
+
+        self._synced = False
+        self._changed_prims: Set[str] = set()
+        self._resynced_prims: Set[str] = set()
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def close(self):
+        if self._listener:
+            self._listener.Revoke()
+            self._listener = None
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    # ---------------------- Sync ----------------------
+    def _session_layers(self) -> List[Sdf.Layer]:
+        root_stack = set(self.stage.GetLayerStack(includeSessionLayers=False))
+        return [layer for layer in self.stage.GetLayerStack() if layer not in root_stack]
+
+    def _current_layers(self) -> Dict[str, Tuple[Optional[str], bool]]:
+        """
+        Used layers except the session layers, which are anonymous and new
+        every session; they are tracked under SESSION_KEY instead.
+        """
+        root_stack = {layer.identifier for layer in self.stage.GetLayerStack(includeSessionLayers=False)}
+        session = {layer.identifier for layer in self._session_layers()}
+        return {
+            layer.identifier: (layer_fingerprint(layer), layer.identifier in root_stack)
+            for layer in self.stage.GetUsedLayers()
+            if layer.identifier not in session
+        }
+
+    def _session_spec_paths(self) -> Set[str]:
+        paths = set()
+        for layer in self._session_layers():
+            paths |= _collect_prim_spec_paths(layer)
+        return paths
+
+    def _replace_layer_prims(self, identifier: str, paths: Iterable[str]):
+        self._conn.execute("DELETE FROM layer_prims WHERE identifier = ?", (identifier,))
+        self._conn.executemany("INSERT INTO layer_prims VALUES (?, ?)", [(identifier, path) for path in paths])
+
+    def _stored_layer_prims(self, identifier: str) -> Set[str]:
+        rows = self._conn.execute("SELECT path FROM layer_prims WHERE identifier = ?", (identifier,))
+        return {row[0] for row in rows}
+
+    def _stored_layers(self) -> Dict[str, Tuple[Optional[str], bool]]:
+        rows = self._conn.execute("SELECT identifier, fingerprint, in_root_stack FROM layers")
+        return {identifier: (fingerprint, bool(in_root_stack)) for identifier, fingerprint, in_root_stack in rows}
+
+    def _stored_version(self) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return row[0] if row else None
+
+    def sync(self) -> dict:
+        """
+        Bring the index up to date, returns {"mode", "layers", "prims", "seconds"}.
+        """
+        start = time.perf_counter()
+        current = self._current_layers()
+        reindexed_layers = []
+        session_paths = set()
+
+        if self._synced:
+            # in-session edits come from notices
+            mode = INDEX_MODE_INCREMENTAL if (self._changed_prims or self._resynced_prims) else INDEX_MODE_CACHED
+        elif self._stored_version() != INDEX_VERSION or not self._stored_layers():
+            mode = INDEX_MODE_FULL
+        else:
+            stored = self._stored_layers()
+            for identifier in set(current) | set(stored):
+                old = stored.get(identifier)
+                new = current.get(identifier)
+                if old is None or new is None or new[0] is None or old[0] != new[0]:
+                    reindexed_layers.append(identifier)
+
+            # prims edited last session + current session layer opinions
+            session_paths = self._stored_layer_prims(SESSION_KEY) | self._session_spec_paths()
+
+            if any(not (current.get(i) or stored.get(i))[1] for i in reindexed_layers):
+                mode = INDEX_MODE_FULL
+            elif reindexed_layers or session_paths or self._resynced_prims or self._changed_prims:
+                mode = INDEX_MODE_INCREMENTAL
+            else:
+                mode = INDEX_MODE_CACHED
+
+        with self._conn:
+            if mode == INDEX_MODE_FULL:
+                self._reindex_all()
+                reindexed_layers = list(current)
+            elif mode == INDEX_MODE_INCREMENTAL:
+                touched = self._changed_prims | session_paths
+                for identifier in reindexed_layers:
+                    touched |= self._reindex_layer_specs(identifier)
+                self._reindex_prims(touched, self._resynced_prims)
+
+                if self._synced:
+                    # re-checked on the next session, whichever layer the edits end up in
+                    self._conn.executemany(
+                        "INSERT INTO layer_prims VALUES (?, ?)",
+                        [(SESSION_KEY, path) for path in self._changed_prims | self._resynced_prims],
+                    )
+                else:
+                    self._replace_layer_prims(SESSION_KEY, self._session_spec_paths())
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO layers VALUES (?, ?, ?)",
+                [(identifier, fingerprint, int(in_root_stack)) for identifier, (fingerprint, in_root_stack) in current.items()],
+            )
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (INDEX_VERSION,))
+
+        self._changed_prims.clear()
+        self._resynced_prims.clear()
+        self._synced = True
+
+        prim_count = self._conn.execute("SELECT COUNT(*) FROM prims").fetchone()[0]
+        return {"mode": mode, "layers": len(reindexed_layers), "prims": prim_count, "seconds": time.perf_counter() - start}
+
+    def _insert_prims(self, prims: Iterable[Usd.Prim]):
+        batch = []
+        for prim in prims:
+            batch.append(_prim_row(prim))
+            if len(batch) >= INDEX_BATCH_SIZE:
+                self._conn.executemany("INSERT OR REPLACE INTO prims VALUES (?, ?, ?, ?)", batch)
+                batch.clear()
+        if batch:
+            self._conn.executemany("INSERT OR REPLACE INTO prims VALUES (?, ?, ?, ?)", batch)
+
+    def _insert_arc_targets(self, prims: Iterable[Usd.Prim]):
+        self._conn.executemany("INSERT INTO arc_targets VALUES (?, ?)", [
+            (target, prim.GetPath().pathString)
+            for prim in prims if has_composition_arc(prim)
+            for target in _internal_arc_targets(prim)
+        ])
+
+    def _delete_subtree(self, path: str, include_root: bool = True):
+        low, high = _subtree_range(path)
+        for table in ("prims", "arc_targets"):
+            self._conn.execute(f"DELETE FROM {table} WHERE path >= ? AND path < ?", (low, high))
+            if include_root:
+                self._conn.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+
+    def _reindex_all(self):
+        self._conn.execute("DELETE FROM prims")
+        self._conn.execute("DELETE FROM layer_prims")
+        self._conn.execute("DELETE FROM layers")
+        self._conn.execute("DELETE FROM arc_targets")
+        self._insert_prims(self.stage.Traverse())
+        self._insert_arc_targets(self.stage.Traverse())
+
+        for layer in self.stage.GetLayerStack(includeSessionLayers=False):
+            self._replace_layer_prims(layer.identifier, _collect_prim_spec_paths(layer))
+        self._replace_layer_prims(SESSION_KEY, self._session_spec_paths())
+
+    def _reindex_layer_specs(self, identifier: str) -> Set[str]:
+        """
+        Replace the stored spec paths of a root layer stack layer, returns
+        the paths it had specs for before and after.
+        """
+        old = self._stored_layer_prims(identifier)
+        layer = next((l for l in self.stage.GetLayerStack(includeSessionLayers=False) if l.identifier == identifier), None)
+        new = _collect_prim_spec_paths(layer) if layer else set()
+
+        self._replace_layer_prims(identifier, new)
+        if not layer:
+            self._conn.execute("DELETE FROM layers WHERE identifier = ?", (identifier,))
+        return old | new
+
+    def _arc_dependents(self, paths: Set[str]) -> Set[str]:
+        """
+        Prims composing from any of paths (or from their ancestors or
+        descendants) through a root layer stack arc, followed transitively.
+        """
+        dependents = set()
+        pending = set(paths)
+        while pending:
+            path = pending.pop()
+            sdf_path = Sdf.Path(path)
+            ancestors = [p.pathString for p in sdf_path.GetPrefixes()]
+            low, high = _subtree_range(path)
+            rows = self._conn.execute(
+                f"SELECT path FROM arc_targets WHERE target IN ({', '.join('?' * len(ancestors))}) "
+                "OR (target >= ? AND target < ?)",
+                ancestors + [low, high],
+            )
+            for (dependent,) in rows:
+                if dependent not in dependents:
+                    dependents.add(dependent)
+                    pending.add(dependent)
+        return dependents
+
+    def _reindex_prims(self, touched: Set[str], resynced: Set[str]):
+        """
+        Single rows for touched prims; whole subtrees for resynced prims, for
+        prims with composition arcs, whose children may come from elsewhere,
+        and for prims inheriting / specializing / referencing a touched path.
+        """
+        resynced = resynced | self._arc_dependents(touched | resynced)
+        done_subtrees: List[str] = []
+
+        def under_done(path):
+            return any(path == root or path.startswith(root.rstrip("/") + "/") for root in done_subtrees)
+
+        for path in sorted(touched | resynced, key=lambda p: p.count("/")):
+            if under_done(path):
+                continue
+
+            prim = self.stage.GetPrimAtPath(path)
+            if not prim or not _is_traversed(prim):
+                self._delete_subtree(path)
+                done_subtrees.append(path)
+                continue
+
+            if prim.IsPseudoRoot():
+                self._delete_subtree(path, include_root=False)
+                self._insert_prims(self.stage.Traverse())
+                self._insert_arc_targets(self.stage.Traverse())
+                done_subtrees.append(path)
+            elif path in resynced or has_composition_arc(prim):
+                self._delete_subtree(path)
+                self._insert_prims(Usd.PrimRange(prim))
+                self._insert_arc_targets(Usd.PrimRange(prim))
+                done_subtrees.append(path)
+            else:
+                self._conn.execute("DELETE FROM arc_targets WHERE path = ?", (path,))
+                self._insert_prims([prim])
+
+    # ---------------------- Notices ----------------------
+    def _on_objects_changed(self, notice, sender):
+        for path in notice.GetResyncedPaths():
+            if path.IsPrimPath() or path.IsAbsoluteRootPath():
+                self._resynced_prims.add(path.pathString)
+            else:
+                # property added / removed
+                self._changed_prims.add(path.GetPrimPath().pathString)
+
+    # ---------------------- Query ----------------------
+    def query(self, name="", type_name="", path="", attr_name="",
+              use_regex=False, use_wildcard=False) -> List[Tuple[str, str, str]]:
+        """
+        (path, name, type) of matching prims, same matching rules as _match_filter.
+        """
+        clauses, params = [], []
+        for column, pattern in (("name", name), ("type", type_name), ("path", path)):
+            if not pattern:
+                continue
+            if use_regex:
+                clauses.append(f"{column} REGEXP ?")
+            elif use_wildcard:
+                # candidates only, build_content re-checks with fnmatch
+                pattern = _glob_prefilter(pattern)
+                if pattern is None:
+                    continue
+                clauses.append(f"{column} GLOB ?")
+            else:
+                clauses.append(f"{column} = ? COLLATE NOCASE")
+            params.append(pattern)
+
+        if attr_name:
+            clauses.append("instr(attrs, ?) > 0")
+            params.append(f" {attr_name} ")
+
+        sql = "SELECT path, name, type FROM prims"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return self._conn.execute(sql + " ORDER BY path", params).fetchall()
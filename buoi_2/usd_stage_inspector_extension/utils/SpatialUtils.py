@@ -0,0 +1,125 @@
+from collections import OrderedDict
+from pxr import Usd, UsdGeom, Gf, Tf
+from typing import Optional, Tuple
+
+# Time codes kept alive at once (e.g. default + a few scrubbed frames)
+MAX_CACHED_TIME_CODES = 4
+
+# Properties that move or resize prims; other value edits keep the caches
+_SPATIAL_PROPERTY_PREFIXES = ("xformOp", "extent", "extentsHint")
+_SPATIAL_PROPERTIES = {"points", "visibility", "purpose", "widths", "size", "radius", "height", "axis"}
+
+
+def _is_spatial_property(name: str) -> bool:
+    return name in _SPATIAL_PROPERTIES or name.startswith(_SPATIAL_PROPERTY_PREFIXES)
+
+
+class SharedGeomCaches:
+    """
+    Long-lived UsdGeom.XformCache / UsdGeom.BBoxCache pairs, one per time code,
+    shared by every window so siblings reuse the ancestor transforms and child
+    bounds already computed.
+
+    Neither cache supports per-prim invalidation, so any resync or any change
+    to a transform, extent, shape or visibility property clears them; the
+    clear is deferred to the next query.
+    """
+
+    def __init__(self):
+        self._stage = None
+        self._listener = None
+        self._dirty = False
+        self._caches: "OrderedDict[float, Tuple[UsdGeom.XformCache, UsdGeom.BBoxCache]]" = OrderedDict()
+
+    # ---------------------- Stage binding ----------------------
+    def _bind(self, stage: Usd.Stage):
+        if self._stage is not None and stage == self._stage:
+            return
+
+        self.destroy()
+        self._stage = stage
+        self._listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+        )
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+            self._listener = None
+        self._stage = None
+        self._dirty = False
+        self._caches.clear()
+
+    def _get_caches(self, stage: Usd.Stage, time: Usd.TimeCode):
+        self._bind(stage)
+        if self._dirty:
+            self._dirty = False
+            self._caches.clear()
+
+        key = time.GetValue()
+        if key in self._caches:
+            self._caches.move_to_end(key)
+            return self._caches[key]
+
+        caches = (
+            UsdGeom.XformCache(time),
+            UsdGeom.BBoxCache(time, [UsdGeom.Tokens.default_, UsdGeom.Tokens.render], useExtentsHint=True),
+        )
+        self._caches[key] = caches
+        if len(self._caches) > MAX_CACHED_TIME_CODES:
+            self._caches.popitem(last=False)
+        return caches
+
+    # ---------------------- Queries ----------------------
+    def world_transform(self, prim: Usd.Prim, time: Usd.TimeCode) -> Optional[Gf.Matrix4d]:
+        if not prim.IsA(UsdGeom.Xformable):
+            return None
+        xform_cache, _ = self._get_caches(prim.GetStage(), time)
+        return xform_cache.GetLocalToWorldTransform(prim)
+
+    def world_bounds(self, prim: Usd.Prim, time: Usd.TimeCode) -> Optional[Gf.Range3d]:
+        if not prim.IsA(UsdGeom.Imageable):
+            return None
+        _, bbox_cache = self._get_caches(prim.GetStage(), time)
+        bounds = bbox_cache.ComputeWorldBound(prim).ComputeAlignedRange()
+        return None if bounds.IsEmpty() else bounds
+
+    # ---------------------- Notices ----------------------
+    def _on_objects_changed(self, notice, sender):
+        if self._dirty or not self._caches:
+            return
+
+        if notice.GetResyncedPaths():
+            self._dirty = True
+            return
+
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPropertyPath() and _is_spatial_property(path.name):
+                self._dirty = True
+                return
+
+
+_geom_caches = SharedGeomCaches()
+
+
+def get_world_transform(prim: Usd.Prim, time: Usd.TimeCode = Usd.TimeCode.Default()) -> Optional[Gf.Matrix4d]:
+    return _geom_caches.world_transform(prim, time)
+
+
+def get_world_bounds(prim: Usd.Prim, time: Usd.TimeCode = Usd.TimeCode.Default()) -> Optional[Gf.Range3d]:
+    return _geom_caches.world_bounds(prim, time)
+
+
+def get_bounds_size_meters(prim: Usd.Prim, time: Usd.TimeCode = Usd.TimeCode.Default()) -> Optional[float]:
+    """
+    Largest side of the world-space bounds, in meters.
+    """
+    bounds = get_world_bounds(prim, time)
+    if bounds is None:
+        return None
+    size = bounds.GetSize()
+    return max(size[0], size[1], size[2]) * UsdGeom.GetStageMetersPerUnit(prim.GetStage())
+
+
+def format_vec3(v) -> str:
+    return f"({v[0]:.3g}, {v[1]:.3g}, {v[2]:.3g})"
@@ -1,10 +1,27 @@
 import os
+import sys
+import json
+import hashlib
+import subprocess
+import time
 import omni.ui as ui
 import omni.usd
 from pxr import UsdGeom, UsdLux, UsdShade, Usd, Sdf, Pcp
-from typing import Set, Dict, List
+from typing import Set, Dict, List, Iterable
 from pathlib import Path
 
+# Export modes
+# - strongest_spec: copy only the strongest prim spec (fast, drops weaker opinions)
+# - composed: flatten the composed subtree through a population-masked stage
+EXPORT_MODE_STRONGEST_SPEC = "strongest_spec"
+EXPORT_MODE_COMPOSED = "composed"
+
+FLATTENED_PROTOTYPE_PREFIX = "Flattened_Prototype"
+
+MANIFEST_SUFFIX = ".manifest.json"
+# 2: entries keyed by prim path (1 was keyed by file name)
+MANIFEST_VERSION = 2
+
 # ------------------------------------------------------------
 # Utils
 # ------------------------------------------------------------
@@ -28,45 +45,54 @@ def remove_all_prim_spec(
     prim_path: Sdf.Path
 ):
     prim_spec = layer.GetPrimAtPath(prim_path)
-
-    # --------------------------------------------------
-    # 1) Remove attribute specs
-    # --------------------------------------------------
-    for attr_spec in list(prim_spec.attributes.values()):
-        prim_spec.RemoveProperty(attr_spec)
-
-    # --------------------------------------------------
-    # 2) Remove relationship specs
-    # --------------------------------------------------
-    for rel_spec in list(prim_spec.relationships.values()):
-        prim_spec.RemoveProperty(rel_spec)
-
-    # --------------------------------------------------
-    # 3) Remove variant sets
-    # --------------------------------------------------
-    for vs_name in list(prim_spec.variantSets.keys()):
-        prim_spec.RemoveVariantSet(vs_name)
-
-    # --------------------------------------------------
-    # 4) Clear composition arcs (Sdf-style)
-    # --------------------------------------------------
-    prim_spec.referenceList.ClearEdits()
-    prim_spec.payloadList.ClearEdits()
-    prim_spec.inheritPathList.ClearEdits()
-    prim_spec.specializesList.ClearEdits()
-
-    # --------------------------------------------------
-    # 5) Remove children prims
-    # --------------------------------------------------
-    for child_name in list(prim_spec.nameChildren.keys()):
-        del prim_spec.nameChildren[child_name]
-
-def get_layer(path: str) -> Sdf.Layer:
-    layer = Sdf.Layer.FindOrOpen(path)
-    if layer:
-        raise RuntimeError(f"Existed layer path: {path}")
-
-    return Sdf.Layer.CreateNew(path)
+    if not prim_spec:
+        return
+
+    # One change notification for the whole prim instead of one per spec
+    with Sdf.ChangeBlock():
+        # --------------------------------------------------
+        # 1) Remove attribute specs
+        # --------------------------------------------------
+        for attr_spec in list(prim_spec.attributes.values()):
+            prim_spec.RemoveProperty(attr_spec)
+
+        # --------------------------------------------------
+        # 2) Remove relationship specs
+        # --------------------------------------------------
+        for rel_spec in list(prim_spec.relationships.values()):
+            prim_spec.RemoveProperty(rel_spec)
+
+        # --------------------------------------------------
+        # 3) Remove variant sets
+        # --------------------------------------------------
+        for vs_name in list(prim_spec.variantSets.keys()):
+            prim_spec.RemoveVariantSet(vs_name)
+
+        # --------------------------------------------------
+        # 4) Clear composition arcs (Sdf-style)
+        # --------------------------------------------------
+        prim_spec.referenceList.ClearEdits()
+        prim_spec.payloadList.ClearEdits()
+        prim_spec.inheritPathList.ClearEdits()
+        prim_spec.specializesList.ClearEdits()
+
+        # --------------------------------------------------
+        # 5) Remove children prims
+        # --------------------------------------------------
+        for child_name in list(prim_spec.nameChildren.keys()):
+            del prim_spec.nameChildren[child_name]
+
+def write_layer_file(layer: Sdf.Layer, out_file: Path):
+    """
+    Write an in-memory layer to out_file, reusing the registered layer
+    if that file is already open (so open stages pick up the new content).
+    """
+    existing = Sdf.Layer.Find(str(out_file))
+    if existing:
+        existing.TransferContent(layer)
+        existing.Save()
+    else:
+        layer.Export(str(out_file))
 
 def remap_relative_to_ancestor(
     paths: list[Sdf.Path],
@@ -100,38 +126,173 @@ def remap_relative_to_ancestor(
 
     return result
 
+# ------------------------------------------------------------
+# Manifest (incremental re-split)
+# ------------------------------------------------------------
+
+def get_manifest_path(out_dir: Path) -> Path:
+    """
+    <base>/splitted-asset -> <base>/splitted-asset.manifest.json
+    """
+    return out_dir.with_name(out_dir.name + MANIFEST_SUFFIX)
+
+def load_manifest(manifest_path: Path) -> Dict[str, dict]:
+    if not manifest_path.exists():
+        return {}
+
+    try:
+        with open(manifest_path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("files", {})
+
+def save_manifest(manifest_path: Path, files: Dict[str, dict]):
+    with open(manifest_path, "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": files}, f, indent=2, sort_keys=True)
+
+def hash_layer_content(layer: Sdf.Layer) -> str:
+    return hashlib.sha256(layer.ExportToString().encode("utf-8")).hexdigest()
+
+# ------------------------------------------------------------
+# Composed export
+# ------------------------------------------------------------
+
+def flatten_masked_subtrees(
+    stage: Usd.Stage,
+    prim_paths: List[Sdf.Path]
+) -> Sdf.Layer:
+    """
+    Flatten only the given subtrees of stage.
+
+    The stage is reopened with a Usd.StagePopulationMask so composition
+    cost scales with the subtrees, not with the whole scene.
+    """
+    mask = Usd.StagePopulationMask()
+    for p in prim_paths:
+        mask.Add(p)
+
+    masked_stage = Usd.Stage.OpenMasked(
+        stage.GetRootLayer(),
+        stage.GetSessionLayer(),
+        stage.GetPathResolverContext(),
+        mask,
+        Usd.Stage.LoadAll
+    )
+    return masked_stage.Flatten(False)
+
+def _copy_flattened_prototypes(
+    src_layer: Sdf.Layer,
+    out_layer: Sdf.Layer,
+    root_path: Sdf.Path
+):
+    """
+    Flatten() writes instance prototypes as root prims referenced internally.
+    Copy the ones used under root_path so the exported file stays valid.
+    """
+    pending = [root_path]
+    copied = set()
+    while pending:
+        prim_spec = out_layer.GetPrimAtPath(pending.pop())
+        if not prim_spec:
+            continue
+
+        refs = prim_spec.GetInfo("references") if prim_spec.HasInfo("references") else None
+        for ref in (refs.GetAddedOrExplicitItems() if refs else []):
+            proto_path = ref.primPath
+            if ref.assetPath or not proto_path.name.startswith(FLATTENED_PROTOTYPE_PREFIX):
+                continue
+            if proto_path in copied or not src_layer.GetPrimAtPath(proto_path):
+                continue
+            Sdf.CopySpec(src_layer, proto_path, out_layer, proto_path)
+            copied.add(proto_path)
+            pending.append(proto_path)
+
+        pending.extend(child.path for child in prim_spec.nameChildren.values())
+
 # ------------------------------------------------------------
 # Export logic
 # ------------------------------------------------------------
 
+def _normalize_file_path(file_path: str) -> str:
+    return os.path.normcase(os.path.normpath(file_path))
+
+def output_file_names(prim_paths: List[Sdf.Path]) -> Dict[Sdf.Path, str]:
+    """
+    <leaf name>.usda, or the whole path (World_A_Wheel.usda) for prims
+    sharing a leaf name. Raises if two prims still map to the same file.
+    """
+    leaf_counts: Dict[str, int] = {}
+    for p in prim_paths:
+        leaf_counts[p.name] = leaf_counts.get(p.name, 0) + 1
+
+    names: Dict[Sdf.Path, str] = {}
+    used: Dict[str, Sdf.Path] = {}
+    for p in prim_paths:
+        stem = p.name if leaf_counts[p.name] == 1 else "_".join(p.pathString.strip("/").split("/"))
+        file_name = stem + ".usda"
+        key = file_name.lower()
+        if key in used:
+            raise ValueError(f"{p} and {used[key]} would both be split to {file_name}")
+        used[key] = p
+        names[p] = file_name
+    return names
+
+def has_payload_to_files(prim_spec: Sdf.PrimSpec, file_paths: Set[str]) -> bool:
+    """
+    True if prim_spec has a payload to one of file_paths (normalized), i.e.
+    it was written by an earlier split into the same files.
+    """
+    if not prim_spec.HasInfo("payload"):
+        return False
+    for payload in prim_spec.GetInfo("payload").GetAddedOrExplicitItems():
+        if not payload.assetPath:
+            continue
+        resolved = Sdf.ComputeAssetPathRelativeToLayer(prim_spec.layer, payload.assetPath)
+        if _normalize_file_path(resolved) in file_paths:
+            return True
+    return False
+
 def export_subtree_excluding_children(
     stage: Usd.Stage,
     prim_path: Sdf.Path,
     excluded_children: List[Sdf.Path],
-    out_file: Path
+    out_layer: Sdf.Layer,
+    flattened_layer: Sdf.Layer = None
 ):
     """
-    Export prim_path subtree but REMOVE any excluded child prims
+    Export prim_path subtree into out_layer but REMOVE any excluded child prims
+
+    flattened_layer: result of flatten_masked_subtrees(). When given, the
+    composed subtree is exported instead of the strongest prim spec.
     """
-    prim = stage.GetPrimAtPath(prim_path)
-    out_layer = get_layer(str(out_file))
-    new_prim_path = to_leaf_path(prim.GetPrimStack()[0].path)
+    if flattened_layer is None:
+        prim = stage.GetPrimAtPath(prim_path)
+        src_spec = prim.GetPrimStack()[0]
+        src_layer, src_path = src_spec.layer, src_spec.path
+    else:
+        src_layer, src_path = flattened_layer, prim_path
 
+    new_prim_path = to_leaf_path(src_path)
     Sdf.CopySpec(
-        prim.GetPrimStack()[0].layer,
-        prim.GetPrimStack()[0].path,
+        src_layer,
+        src_path,
         out_layer,
         new_prim_path
     )
 
+    if flattened_layer is not None:
+        _copy_flattened_prototypes(flattened_layer, out_layer, new_prim_path)
+
     # Remove excluded children SAFELY
     excluded_children = sort_by_depth(excluded_children, True)
     relative_path_excluded_children = remap_relative_to_ancestor(excluded_children, prim_path)
     for child_path in relative_path_excluded_children:
         remove_all_prim_spec(out_layer, child_path)
 
-    out_layer.Save()
-
 def replace_prim_with_payload(
     layer: Sdf.Layer,
     prim_path: Sdf.Path,
@@ -142,30 +303,107 @@ def replace_prim_with_payload(
     relative_prim_path = remap_relative_to_ancestor([prim_path], parent_prim_path)[0] if parent_prim_path != None else prim_path
 
     remove_all_prim_spec(layer, relative_prim_path)
-    prim_spec = layer.GetPrimAtPath(relative_prim_path)
+    # the child may only exist through an arc of the exported spec
+    prim_spec = layer.GetPrimAtPath(relative_prim_path) or Sdf.CreatePrimInLayer(layer, relative_prim_path)
     prim_spec.payloadList.Add(
         Sdf.Payload(asset_path, new_prim_path)
     )
 
+def remove_prim_spec(layer: Sdf.Layer, prim_path: Sdf.Path):
+    """
+    Remove the prim spec and everything under it (metadata included).
+    """
+    prim_spec = layer.GetPrimAtPath(prim_path)
+    if not prim_spec:
+        return
+    parent_spec = prim_spec.nameParent or layer.pseudoRoot
+    del parent_spec.nameChildren[prim_spec.name]
+
+
+def replace_prims_with_payloads_transactional(
+    edits: List[tuple]
+) -> List[Sdf.Layer]:
+    """
+    edits: list of (layer, prim_path, asset_path); asset_path None removes
+    the prim spec instead.
+
+    Apply every edit inside a single Sdf.ChangeBlock so a live stage
+    recomposes once. Edited layers are snapshotted into anonymous layers
+    first; if any edit fails, all of them are restored and the error re-raised.
+
+    Returns the edited layers (not saved).
+    """
+    layers: List[Sdf.Layer] = []
+    for layer, _, _ in edits:
+        if layer not in layers:
+            layers.append(layer)
+
+    snapshots = []
+    for layer in layers:
+        snapshot = Sdf.Layer.CreateAnonymous(".usda")
+        snapshot.TransferContent(layer)
+        snapshots.append((layer, snapshot))
+
+    # Rollback happens inside the same block, so a failed split sends no
+    # intermediate notices to the stage
+    with Sdf.ChangeBlock():
+        try:
+            for layer, prim_path, asset_path in edits:
+                if asset_path is None:
+                    remove_prim_spec(layer, prim_path)
+                else:
+                    replace_prim_with_payload(layer, prim_path, asset_path, None)
+        except Exception:
+            for layer, snapshot in snapshots:
+                layer.TransferContent(snapshot)
+            raise
+
+    return layers
+
 # ------------------------------------------------------------
 # Main API
 # ------------------------------------------------------------
 
 def split_prims_to_files(
     stage: Usd.Stage,
-    prim_paths: Set[str],
-    output_dir: str
+    prim_paths: Iterable[str],
+    output_dir: str,
+    export_mode: str = EXPORT_MODE_STRONGEST_SPEC
 ):
     """
-    prim_paths: set of prim path strings
+    prim_paths: prim path strings (a set, or a PrimIdSet)
         ex:
         {
             "/World/Cube",
             "/World/Cube/Car",
             "/Car/Vehicle"
         }
+    export_mode: EXPORT_MODE_STRONGEST_SPEC or EXPORT_MODE_COMPOSED
+
+    Files are named after the prim (see output_file_names). Prims whose
+    strongest spec is the payload left by an earlier split into the same
+    files are exported composed even in strongest_spec mode: that spec no
+    longer holds the content, and copying it would make the file load
+    itself.
+
+    Files are built in memory and hashed. A sidecar manifest next to
+    output_dir records the hashes, so a re-split only rewrites the files
+    whose content changed.
+
+    For prims exported composed, their specs in the weaker layers of the
+    root layer stack are removed too, since the file already holds their
+    opinions.
+
+    The source layers are only edited once every file has been written
+    (transfer-on-success), in one change block that is rolled back on error.
+    If writing fails midway the manifest is left untouched, so the next
+    run rewrites the affected files.
     """
+    if export_mode not in (EXPORT_MODE_STRONGEST_SPEC, EXPORT_MODE_COMPOSED):
+        raise ValueError(f"Unknown export mode: {export_mode}")
+
     created_files: Dict[Sdf.Path, Path] = {}
+    out_layers: Dict[Sdf.Path, Sdf.Layer] = {}
 
     # Convert to Sdf.Path
     paths: Set[Sdf.Path] = {Sdf.Path(p) for p in prim_paths}
@@ -176,14 +414,26 @@ def split_prims_to_files(
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # --------------------------------------------------------
-    # 1) Export files
+    # 1) Export subtrees (in memory)
     # --------------------------------------------------------
     ordered_paths = sort_by_depth(paths)
+
+    file_names = output_file_names(ordered_paths)
+    out_files = {_normalize_file_path(str(out_dir / name)) for name in file_names.values()}
+
+    composed_paths = []
     for prim_path in ordered_paths:
-        print("Export for: " + str(prim_path))
         prim = stage.GetPrimAtPath(prim_path)
         if not prim or not prim.IsValid():
             raise RuntimeError(f"Invalid prim: {prim_path}")
+        if export_mode == EXPORT_MODE_COMPOSED or has_payload_to_files(prim.GetPrimStack()[0], out_files):
+            composed_paths.append(prim_path)
+
+    # Compose + flatten the subtrees once, shared by every composed export
+    flattened_layer = flatten_masked_subtrees(stage, composed_paths) if composed_paths else None
+
+    for prim_path in ordered_paths:
+        print("Export for: " + str(prim_path))
 
         # children that must be excluded from this file
         excluded_children = [
@@ -191,20 +441,21 @@ def split_prims_to_files(
             if is_ancestor(prim_path, p)
         ]
 
-        file_name = prim_path.name + ".usda"
-        out_file = out_dir / file_name
-        created_files[prim_path] = out_file
+        created_files[prim_path] = out_dir / file_names[prim_path]
+        out_layers[prim_path] = Sdf.Layer.CreateAnonymous(".usda")
 
         export_subtree_excluding_children(
             stage,
             prim_path,
             excluded_children,
-            out_file
+            out_layers[prim_path],
+            flattened_layer if prim_path in composed_paths else None
         )
 
     # --------------------------------------------------------
-    # 2) Setup payload chain
+    # 2) Setup payload chain between split files
     # --------------------------------------------------------
+    root_prim_paths = []
     for prim_path in ordered_paths:
         # find closest parent in split list
         parent_list = [p for p in ordered_paths if is_ancestor(p, prim_path)]
@@ -213,26 +464,412 @@ def split_prims_to_files(
 
         # payload inside parent file
         if parent:
-            parent_layer = Sdf.Layer.FindOrOpen(
-                str(created_files[parent])
-            )
             replace_prim_with_payload(
-                parent_layer,
+                out_layers[parent],
                 prim_path,
                 str(created_files[prim_path]),
                 parent
             )
-            parent_layer.Save()
 
-        # payload at root
+        # payload at root, done once the files are written
         else:
-            prim = stage.GetPrimAtPath(prim_path)
-            replace_prim_with_payload(
-                prim.GetPrimStack()[0].layer,
-                prim.GetPrimStack()[0].path,
-                str(created_files[prim_path]),
-                None
-            )
-            prim.GetPrimStack()[0].layer.Save()
+            root_prim_paths.append(prim_path)
+
+    # --------------------------------------------------------
+    # 3) Write changed files only
+    # --------------------------------------------------------
+    manifest_path = get_manifest_path(out_dir)
+    old_manifest = load_manifest(manifest_path)
+    new_manifest: Dict[str, dict] = {}
+
+    for prim_path in ordered_paths:
+        out_file = created_files[prim_path]
+        content_hash = hash_layer_content(out_layers[prim_path])
+        new_manifest[prim_path.pathString] = {
+            "file": out_file.name,
+            "hash": content_hash,
+        }
+
+        old_entry = old_manifest.get(prim_path.pathString)
+        if (old_entry and old_entry.get("file") == out_file.name
+                and old_entry.get("hash") == content_hash and out_file.exists()):
+            print("Unchanged: " + str(out_file))
+            continue
+
+        print("Write: " + str(out_file))
+        write_layer_file(out_layers[prim_path], out_file)
+
+    save_manifest(manifest_path, new_manifest)
+
+    # --------------------------------------------------------
+    # 4) Replace split prims with payloads in the source layers
+    # --------------------------------------------------------
+    # Resolve specs before editing: no Usd queries inside the change block
+    layer_stack = set(stage.GetLayerStack(includeSessionLayers=False))
+    edits = []
+    for prim_path in root_prim_paths:
+        prim_stack = stage.GetPrimAtPath(prim_path).GetPrimStack()
+        src_spec = prim_stack[0]
+        if prim_path in composed_paths:
+            # the file holds the composed prim: weaker specs of the root layer
+            # stack would compose over the payload again
+            for spec in reversed(prim_stack[1:]):
+                if spec.layer in layer_stack:
+                    edits.append((spec.layer, spec.path, None))
+        edits.append((src_spec.layer, src_spec.path, str(created_files[prim_path])))
+
+    edited_layers = replace_prims_with_payloads_transactional(edits)
+    for layer in edited_layers:
+        layer.Save()
+
+    if root_layer not in edited_layers:
+        root_layer.Save()
+
+# ------------------------------------------------------------
+# Consolidation (inverse splitter)
+# ------------------------------------------------------------
+
+CONSOLIDATE_MODE_INLINE = "inline"
+CONSOLIDATE_MODE_MERGE = "merge"
+
+def _is_anchored_asset_path(asset_path: str) -> bool:
+    return asset_path.startswith("./") or asset_path.startswith("../")
+
+def _reanchor_asset_path(asset_path: str, src_layer: Sdf.Layer, dst_layer: Sdf.Layer) -> str:
+    """
+    ./Wheel.usda authored in src_layer -> same file, relative to dst_layer
+    """
+    if not _is_anchored_asset_path(asset_path) or not src_layer.realPath or not dst_layer.realPath:
+        return asset_path
+
+    abs_path = os.path.normpath(os.path.join(os.path.dirname(src_layer.realPath), asset_path))
+    rel_path = os.path.relpath(abs_path, os.path.dirname(dst_layer.realPath)).replace(os.sep, "/")
+    return rel_path if rel_path.startswith("../") else "./" + rel_path
+
+def _reanchor_subtree(src_layer: Sdf.Layer, dst_layer: Sdf.Layer, root_path: Sdf.Path):
+    """
+    Fix anchored reference/payload/asset attribute paths after copying
+    root_path from src_layer into dst_layer.
+    """
+    if src_layer == dst_layer:
+        return
+
+    pending = [dst_layer.GetPrimAtPath(root_path)]
+    while pending:
+        prim_spec = pending.pop()
+        if not prim_spec:
+            continue
+
+        for key, item_type in (("references", Sdf.Reference), ("payload", Sdf.Payload)):
+            if not prim_spec.HasInfo(key):
+                continue
+            list_op = prim_spec.GetInfo(key)
+            items = list_op.GetAddedOrExplicitItems()
+            if not any(_is_anchored_asset_path(i.assetPath) for i in items):
+                continue
+            proxy = prim_spec.referenceList if key == "references" else prim_spec.payloadList
+            proxy.ClearEdits()
+            for i in items:
+                proxy.Prepend(item_type(
+                    _reanchor_asset_path(i.assetPath, src_layer, dst_layer),
+                    i.primPath,
+                    i.layerOffset
+                ))
+
+        for attr_spec in prim_spec.attributes.values():
+            if attr_spec.typeName != Sdf.ValueTypeNames.Asset or not attr_spec.HasDefaultValue():
+                continue
+            value = attr_spec.default
+            if value and _is_anchored_asset_path(value.path):
+                attr_spec.default = Sdf.AssetPath(_reanchor_asset_path(value.path, src_layer, dst_layer))
+
+        pending.extend(prim_spec.nameChildren.values())
+
+def _find_payload_specs(layer: Sdf.Layer, root_path: Sdf.Path) -> List[Sdf.PrimSpec]:
+    """
+    Prim specs under root_path (inclusive) that author external payloads.
+    Does not descend below a payload-bearing spec.
+    """
+    result = []
+    pending = [layer.GetPrimAtPath(root_path)]
+    while pending:
+        prim_spec = pending.pop()
+        if not prim_spec:
+            continue
 
-    root_layer.Save()
\ No newline at end of file
+        if prim_spec.HasInfo("payload") and any(
+            p.assetPath for p in prim_spec.GetInfo("payload").GetAddedOrExplicitItems()
+        ):
+            result.append(prim_spec)
+            continue
+
+        pending.extend(prim_spec.nameChildren.values())
+
+    return sorted(result, key=lambda spec: (_depth(spec.path), spec.path.pathString))
+
+def _open_payload_source(layer: Sdf.Layer, prim_spec: Sdf.PrimSpec):
+    """
+    Returns (payload_layer, source prim path) for a spec with exactly one
+    external payload, otherwise None.
+    """
+    payloads = prim_spec.GetInfo("payload").GetAddedOrExplicitItems()
+    if len(payloads) != 1:
+        return None
+
+    payload = payloads[0]
+    payload_layer = Sdf.Layer.FindOrOpen(
+        Sdf.ComputeAssetPathRelativeToLayer(layer, payload.assetPath)
+    )
+    if not payload_layer:
+        return None
+
+    if not payload.primPath.isEmpty:
+        src_path = payload.primPath
+    elif payload_layer.defaultPrim:
+        src_path = Sdf.Path.absoluteRootPath.AppendChild(payload_layer.defaultPrim)
+    else:
+        # splitter convention: /World/Car -> Car.usda</Car>
+        src_path = to_leaf_path(prim_spec.path)
+
+    if not payload_layer.GetPrimAtPath(src_path):
+        return None
+    return payload_layer, src_path
+
+def _has_local_opinions(prim_spec: Sdf.PrimSpec) -> bool:
+    """
+    True if the spec authors anything besides its payload (and specifier/type),
+    in which case inlining would have to merge opinion strengths.
+    """
+    if prim_spec.properties or prim_spec.nameChildren or prim_spec.variantSets:
+        return True
+    for key in ("references", "inheritPaths", "specializes", "variantSelection"):
+        if prim_spec.HasInfo(key):
+            return True
+    return False
+
+# Run in a fresh interpreter, so no layer is already in the registry:
+# 1. open the masked stage once to list the used layer files, then release it
+# 2. read: parse each file with Sdf.Layer.OpenAsAnonymous
+# 3. open the masked stage again on the empty registry; compose = open - read
+# Steps 2 and 3 both see the OS file cache warmed by step 1.
+_LOAD_TIME_SCRIPT = """
+import json, sys, time
+from pxr import Sdf, Usd
+layer_path, prim_path = sys.argv[1], sys.argv[2]
+mask = Usd.StagePopulationMask([Sdf.Path(prim_path)])
+stage = Usd.Stage.OpenMasked(layer_path, mask, Usd.Stage.LoadAll)
+files = [l.realPath for l in stage.GetUsedLayers() if not l.anonymous and l.realPath]
+layer_count = len(stage.GetUsedLayers())
+del stage
+start = time.perf_counter()
+for f in files:
+    Sdf.Layer.OpenAsAnonymous(f)
+read_seconds = time.perf_counter() - start
+cold = not any(Sdf.Layer.Find(f) for f in files)
+start = time.perf_counter()
+stage = Usd.Stage.OpenMasked(layer_path, mask, Usd.Stage.LoadAll)
+open_seconds = time.perf_counter() - start
+json.dump({"read": read_seconds, "compose": max(open_seconds - read_seconds, 0.0),
+           "layers": layer_count, "cold": cold}, sys.stdout)
+"""
+
+def _measure_subtree_load_time_in_process(layer_path: str, prim_path: Sdf.Path):
+    """
+    Fallback when no interpreter can be started: the registry is shared with
+    the open stages, so compose time includes reading only the layers not
+    already loaded, and depends on what is open.
+    """
+    mask = Usd.StagePopulationMask([prim_path])
+    start = time.perf_counter()
+    masked_stage = Usd.Stage.OpenMasked(layer_path, mask, Usd.Stage.LoadAll)
+    open_seconds = time.perf_counter() - start
+
+    used_layers = masked_stage.GetUsedLayers()
+    start = time.perf_counter()
+    for layer in used_layers:
+        if not layer.anonymous and layer.realPath:
+            Sdf.Layer.OpenAsAnonymous(layer.realPath)
+    read_seconds = time.perf_counter() - start
+    return read_seconds, open_seconds, len(used_layers), False
+
+def measure_subtree_load_time(layer_path: str, prim_path: Sdf.Path):
+    """
+    Cost of loading prim_path with all payloads from the files on disk,
+    measured in a separate Python process (see _LOAD_TIME_SCRIPT), so layers
+    held by the stages open here cannot make it look cheaper:
+      - read: every used layer file parsed with Sdf.Layer.OpenAsAnonymous;
+      - compose: Usd.Stage.OpenMasked on an empty layer registry, minus read.
+
+    Returns (read seconds, compose seconds, used layer count, cold). cold is
+    False when the subprocess could not run and the in-process fallback
+    (registry shared with the open stages) was used.
+    """
+    # inside Kit, sys.executable can be the app itself rather than Python
+    python = sys.executable if os.path.basename(sys.executable or "").lower().startswith("python") else None
+    if not python:
+        print("Cold load timing unavailable (no Python executable), timing in process")
+        return _measure_subtree_load_time_in_process(layer_path, prim_path)
+
+    try:
+        # pass this interpreter's sys.path, pxr may not be on PYTHONPATH
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        result = subprocess.run(
+            [python, "-c", _LOAD_TIME_SCRIPT, layer_path, prim_path.pathString],
+            capture_output=True, text=True, timeout=600, check=True, env=env
+        )
+        timing = json.loads(result.stdout)
+        return timing["read"], timing["compose"], timing["layers"], timing["cold"]
+    except (OSError, subprocess.SubprocessError, ValueError, KeyError) as e:
+        print(f"Cold load timing unavailable, timing in process: {e}")
+        return _measure_subtree_load_time_in_process(layer_path, prim_path)
+
+def _inline_payloads(layer: Sdf.Layer, root_path: Sdf.Path, report: dict):
+    """
+    Copy payload content back into layer, level by level, until no
+    external payload is left under root_path.
+    """
+    skipped = set()
+    while True:
+        work = []
+        for prim_spec in _find_payload_specs(layer, root_path):
+            if prim_spec.path in skipped:
+                continue
+            source = _open_payload_source(layer, prim_spec) if not _has_local_opinions(prim_spec) else None
+            if source is None:
+                skipped.add(prim_spec.path)
+                report["skipped"].append(prim_spec.path.pathString)
+                continue
+            work.append((prim_spec.path, source[0], source[1]))
+
+        if not work:
+            return
+
+        with Sdf.ChangeBlock():
+            for dst_path, payload_layer, src_path in work:
+                Sdf.CopySpec(payload_layer, src_path, layer, dst_path)
+                _reanchor_subtree(payload_layer, layer, dst_path)
+                report["inlined"].append(dst_path.pathString)
+
+def _merge_sibling_payloads(
+    layer: Sdf.Layer,
+    root_path: Sdf.Path,
+    out_dir: Path,
+    max_files: int,
+    report: dict
+):
+    """
+    Group payload-bearing siblings by parent and copy them into at most
+    max_files bundle files per parent, re-pointing each payload.
+    """
+    groups: Dict[Sdf.Path, list] = {}
+    for prim_spec in _find_payload_specs(layer, root_path):
+        source = _open_payload_source(layer, prim_spec)
+        if source is None:
+            report["skipped"].append(prim_spec.path.pathString)
+            continue
+        groups.setdefault(prim_spec.path.GetParentPath(), []).append((prim_spec.path, source))
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for parent_path, members in groups.items():
+        if len(members) < 2:
+            continue
+
+        bundle_count = min(max_files, len(members))
+        chunk_size = -(-len(members) // bundle_count)
+        for index in range(bundle_count):
+            chunk = members[index * chunk_size:(index + 1) * chunk_size]
+            if not chunk:
+                continue
+
+            out_file = out_dir / f"{parent_path.name}_bundle_{index}.usda"
+            bundle = Sdf.Layer.CreateAnonymous(".usda")
+            # /World/Cars/CarA relative to /World/Cars -> /Cars/CarA
+            bundle_paths = remap_relative_to_ancestor([p for p, _ in chunk], parent_path)
+            for (member_path, (payload_layer, src_path)), bundle_path in zip(chunk, bundle_paths):
+                Sdf.CreatePrimInLayer(bundle, bundle_path)
+                Sdf.CopySpec(payload_layer, src_path, bundle, bundle_path)
+            write_layer_file(bundle, out_file)
+
+            bundle_layer = Sdf.Layer.FindOrOpen(str(out_file))
+            with Sdf.ChangeBlock():
+                for (member_path, (payload_layer, _)), bundle_path in zip(chunk, bundle_paths):
+                    _reanchor_subtree(payload_layer, bundle_layer, bundle_path)
+                    prim_spec = layer.GetPrimAtPath(member_path)
+                    prim_spec.payloadList.ClearEdits()
+                    prim_spec.payloadList.Prepend(Sdf.Payload(str(out_file), bundle_path))
+                    report["merged"].append(member_path.pathString)
+            bundle_layer.Save()
+            report["files_written"].append(str(out_file))
+
+def consolidate_payloads(
+    stage: Usd.Stage,
+    prim_path: str,
+    mode: str = CONSOLIDATE_MODE_INLINE,
+    target_layer: Sdf.Layer = None,
+    max_files: int = 4,
+    output_dir: str = "consolidated-asset"
+) -> dict:
+    """
+    Inverse of split_prims_to_files: reduce the number of payload files
+    under prim_path.
+
+    mode:
+        CONSOLIDATE_MODE_INLINE: copy payload content back into target_layer
+            (default: the layer holding the strongest spec of prim_path)
+        CONSOLIDATE_MODE_MERGE: merge sibling payload files into at most
+            max_files bundles per parent, written to output_dir
+
+    Returns a report with layer read / compose times and used layer counts
+    before/after (see measure_subtree_load_time); cold_timing is False if
+    either measurement fell back to the in-process timing.
+    """
+    if mode not in (CONSOLIDATE_MODE_INLINE, CONSOLIDATE_MODE_MERGE):
+        raise ValueError(f"Unknown consolidate mode: {mode}")
+    if max_files < 1:
+        raise ValueError(f"max_files must be >= 1: {max_files}")
+
+    path = Sdf.Path(prim_path)
+    prim = stage.GetPrimAtPath(path)
+    if not prim or not prim.IsValid():
+        raise RuntimeError(f"Invalid prim: {prim_path}")
+
+    if target_layer is None:
+        src_spec = prim.GetPrimStack()[0]
+        target_layer, root_path = src_spec.layer, src_spec.path
+    else:
+        root_path = path
+        if not target_layer.GetPrimAtPath(root_path):
+            raise RuntimeError(f"{prim_path} has no spec in {target_layer.identifier}")
+
+    root_layer = stage.GetRootLayer()
+    report = {
+        "mode": mode,
+        "prim_path": prim_path,
+        "target_layer": target_layer.identifier,
+        "inlined": [],
+        "merged": [],
+        "skipped": [],
+        "files_written": [],
+    }
+    (report["read_seconds_before"], report["compose_seconds_before"],
+     report["layers_before"], cold_before) = measure_subtree_load_time(root_layer.identifier, path)
+
+    if mode == CONSOLIDATE_MODE_INLINE:
+        _inline_payloads(target_layer, root_path, report)
+    else:
+        out_dir = Path(root_layer.realPath).parent / output_dir
+        _merge_sibling_payloads(target_layer, root_path, out_dir, max_files, report)
+
+    target_layer.Save()
+
+    (report["read_seconds_after"], report["compose_seconds_after"],
+     report["layers_after"], cold_after) = measure_subtree_load_time(root_layer.identifier, path)
+    report["cold_timing"] = cold_before and cold_after
+    print(
+        f"Consolidate {prim_path} ({mode}): "
+        f"{report['layers_before']} -> {report['layers_after']} layers, "
+        f"read {report['read_seconds_before'] * 1000:.1f} -> {report['read_seconds_after'] * 1000:.1f} ms, "
+        f"compose {report['compose_seconds_before'] * 1000:.1f} -> {report['compose_seconds_after'] * 1000:.1f} ms"
+        + ("" if report["cold_timing"] else " (warm, in process)")
+    )
+    return report
@@ -0,0 +1,60 @@
+import sys
+import numpy as np
+from pxr import Sdf
+
+MAX_PREVIEW_ITEMS = 4
+MAX_PREVIEW_CHARS = 120
+
+
+def as_numpy_view(value):
+    """
+    Zero-copy NumPy view over a Vt array buffer.
+    Returns None for values without a buffer (scalars, token/string arrays...).
+    """
+    try:
+        return np.asarray(memoryview(value))
+    except TypeError:
+        return None
+
+
+def is_array_value(value) -> bool:
+    return hasattr(value, "__len__") and type(value).__name__.endswith("Array")
+
+
+def describe_value(value, max_items: int = MAX_PREVIEW_ITEMS) -> str:
+    """
+    Short preview: type, element count and a truncated head.
+    Never stringifies a whole array.
+    """
+    if value is None:
+        return "None"
+
+    if is_array_value(value):
+        count = len(value)
+        view = as_numpy_view(value)
+        if view is not None:
+            head = np.array2string(view[:max_items], separator=", ", threshold=max_items * 4).replace("\n", "")
+        else:
+            head = "[" + ", ".join(str(value[i]) for i in range(min(count, max_items))) + "]"
+        if count > max_items:
+            head = head[:-1] + ", ...]"
+        return f"{type(value).__name__}[{count}] {head}"
+
+    text = str(value)
+    if len(text) > MAX_PREVIEW_CHARS:
+        text = text[:MAX_PREVIEW_CHARS] + "..."
+    return text
+
+
+def get_time_sample_info(layer: Sdf.Layer, path: Sdf.Path):
+    """
+    (count, first time, last time) of the time samples authored at path
+    in layer, without loading any sample value. (0, None, None) if none.
+    """
+    count = layer.GetNumTimeSamplesForPath(path)
+    if not count:
+        return 0, None, None
+
+    _, first, _ = layer.GetBracketingTimeSamplesForPath(path, -sys.float_info.max)
+    _, _, last = layer.GetBracketingTimeSamplesForPath(path, sys.float_info.max)
+    return count, first, last
@@ -0,0 +1,168 @@
+import itertools
+import json
+import math
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterator, List, Optional
+from pxr import Usd, Sdf
+
+DEFAULT_MAX_COMBINATIONS = 32
+DEFAULT_MAX_SECONDS = 30.0
+# Default traversal minus IsLoaded, so unloaded payload prims are counted
+_SWEEP_PREDICATE = Usd.PrimIsActive & Usd.PrimIsDefined & ~Usd.PrimIsAbstract
+
+
+@dataclass
+class VariantSweepRow:
+    selections: Dict[str, str]
+    compose_ms: float = 0.0
+    prim_count: int = 0
+    # loaded payload arcs in the subtree
+    payloads: int = 0
+    # layers brought in by references / payloads, and their size on disk
+    layers: int = 0
+    layer_bytes: int = 0
+    is_current: bool = False
+    error: str = ""
+
+    @property
+    def label(self) -> str:
+        return ", ".join(f"{name}={choice}" for name, choice in self.selections.items())
+
+
+@dataclass
+class VariantSweep:
+    prim_path: str
+    variant_sets: Dict[str, List[str]]
+    total_combinations: int
+    rows: List[VariantSweepRow] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def get_variant_sets(prim: Usd.Prim, set_names: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    """
+    {variant set: choices} of prim, optionally only the sets in set_names.
+    Sets nested inside another set's variants only show up for the current
+    selection.
+    """
+    variant_sets = prim.GetVariantSets()
+    result = {}
+    for name in variant_sets.GetNames():
+        if set_names and name not in set_names:
+            continue
+        choices = variant_sets.GetVariantSet(name).GetVariantNames()
+        if choices:
+            result[name] = list(choices)
+    return result
+
+
+def count_combinations(variant_sets: Dict[str, List[str]]) -> int:
+    return math.prod(len(choices) for choices in variant_sets.values()) if variant_sets else 0
+
+
+def iter_variant_combinations(variant_sets: Dict[str, List[str]], current: Dict[str, str],
+                              max_combinations: int) -> Iterator[Dict[str, str]]:
+    """
+    Current selection first (the baseline), then the other combinations in
+    order, at most max_combinations in total.
+    """
+    names = list(variant_sets)
+    baseline = {name: current.get(name) or variant_sets[name][0] for name in names}
+    yield baseline
+
+    combinations = (dict(zip(names, choices)) for choices in itertools.product(*variant_sets.values()))
+    others = (c for c in combinations if c != baseline)
+    yield from itertools.islice(others, max_combinations - 1)
+
+
+def _open_sweep_stage(stage: Usd.Stage, prim_path: str, selections: Dict[str, str], load_payloads: bool):
+    """
+    Stage masked to prim_path, with the selections authored in its own
+    session layer. The live session layer is sublayered under it so its
+    opinions still apply; the live stage is never edited.
+    """
+    session = Sdf.Layer.CreateAnonymous("variant_sweep_session.usda")
+    live_session = stage.GetSessionLayer()
+    if live_session:
+        session.subLayerPaths.append(live_session.identifier)
+    spec = Sdf.CreatePrimInLayer(session, prim_path)
+    for name, choice in selections.items():
+        spec.variantSelections[name] = choice
+
+    mask = Usd.StagePopulationMask([Sdf.Path(prim_path)])
+    load = Usd.Stage.LoadAll if load_payloads else Usd.Stage.LoadNone
+    return Usd.Stage.OpenMasked(stage.GetRootLayer(), session, stage.GetPathResolverContext(), mask, load)
+
+
+def _layer_size(layer: Sdf.Layer) -> int:
+    real_path = layer.realPath
+    return os.path.getsize(real_path) if real_path and os.path.isfile(real_path) else 0
+
+
+def measure_selection(stage: Usd.Stage, prim_path: str, selections: Dict[str, str],
+                      load_payloads: bool = True) -> VariantSweepRow:
+    row = VariantSweepRow(selections=dict(selections))
+    try:
+        start = time.perf_counter()
+        sweep_stage = _open_sweep_stage(stage, prim_path, selections, load_payloads)
+        row.compose_ms = (time.perf_counter() - start) * 1000.0
+    except Exception as e:
+        row.error = str(e)
+        return row
+
+    prim = sweep_stage.GetPrimAtPath(prim_path)
+    if prim:
+        for p in Usd.PrimRange(prim, _SWEEP_PREDICATE):
+            row.prim_count += 1
+            if p.HasAuthoredPayloads() and p.IsLoaded():
+                row.payloads += 1
+
+    layer_stacks = set(sweep_stage.GetLayerStack(includeSessionLayers=True))
+    for layer in sweep_stage.GetUsedLayers():
+        if layer not in layer_stacks:
+            row.layers += 1
+            row.layer_bytes += _layer_size(layer)
+    return row
+
+
+def sweep_variants(stage: Usd.Stage, prim_path: str, max_combinations: int = DEFAULT_MAX_COMBINATIONS,
+                   max_seconds: float = DEFAULT_MAX_SECONDS, set_names: Optional[List[str]] = None,
+                   load_payloads: bool = True) -> VariantSweep:
+    """
+    Compose prim_path once per variant combination (bounded by
+    max_combinations and max_seconds) on a masked stage and measure
+    composition time, prim count and the layers references / payloads bring
+    in. Rows are in sweep order, the first one is the current selection.
+    """
+    prim = stage.GetPrimAtPath(prim_path)
+    variant_sets = get_variant_sets(prim, set_names) if prim else {}
+    sweep = VariantSweep(prim_path, variant_sets, count_combinations(variant_sets))
+    if not variant_sets or max_combinations <= 0:
+        return sweep
+
+    current = prim.GetVariantSets().GetAllVariantSelections()
+    start = time.perf_counter()
+    for selections in iter_variant_combinations(variant_sets, current, max_combinations):
+        row = measure_selection(stage, prim_path, selections, load_payloads)
+        row.is_current = not sweep.rows
+        sweep.rows.append(row)
+        if time.perf_counter() - start > max_seconds:
+            break
+    sweep.seconds = time.perf_counter() - start
+    return sweep
+
+
+def write_variant_sweep(sweep: VariantSweep, file_path: str):
+    folder = os.path.dirname(file_path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder, exist_ok=True)
+
+    with open(file_path, "w") as f:
+        json.dump({
+            "prim_path": sweep.prim_path,
+            "variant_sets": sweep.variant_sets,
+            "total_combinations": sweep.total_combinations,
+            "seconds": sweep.seconds,
+            "rows": [dict(asdict(row), label=row.label) for row in sweep.rows],
+        }, f, indent=2)
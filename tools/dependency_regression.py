@@ -0,0 +1,179 @@
+"""
+Regression checks for the layer dependency graph, its snapshots and the
+layer profiler built on it, on real files.
+
+    python tools/dependency_regression.py
+
+Exits 1 when a check fails. Uses the headless harness stand-ins, since the
+extension modules import omni.ui / omni.usd.
+"""
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tools import ui_harness  # noqa: E402
+
+ui_harness.install()
+
+from pxr import Sdf, Usd, UsdGeom  # noqa: E402
+from buoi_2.usd_stage_inspector_extension.utils.DependencyUtils import (  # noqa: E402
+    ARC_REFERENCE,
+    ARC_SUBLAYER,
+    AsyncLayerGraphBuilder,
+    build_layer_dependency_graph,
+    clear_layer_dependency_graphs,
+)
+from buoi_2.usd_stage_inspector_extension.utils import LayerProfilerUtils  # noqa: E402
+from buoi_2.usd_stage_inspector_extension.utils.DependencyUtils import build_arc_index  # noqa: E402
+from buoi_2.usd_stage_inspector_extension.utils.DependencySnapshotUtils import (  # noqa: E402
+    diff_snapshots,
+    write_snapshot_json,
+)
+
+failures = []
+
+
+def check(name, condition):
+    print(("ok    " if condition else "FAIL  ") + name)
+    if not condition:
+        failures.append(name)
+
+
+def make_textured_stage(folder) -> Usd.Stage:
+    """
+    root.usda: sublayer ./sub.usda, a reference to ./asset.usda, a missing
+    reference, and asset attributes to an existing and a missing texture.
+    """
+    with open(os.path.join(folder, "tex.png"), "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+
+    asset = Usd.Stage.CreateNew(os.path.join(folder, "asset.usda"))
+    UsdGeom.Cube.Define(asset, "/Asset")
+    asset.SetDefaultPrim(asset.GetPrimAtPath("/Asset"))
+    asset.Save()
+    Sdf.Layer.CreateNew(os.path.join(folder, "sub.usda")).Save()
+
+    stage = Usd.Stage.CreateNew(os.path.join(folder, "root.usda"))
+    stage.GetRootLayer().subLayerPaths.append("./sub.usda")
+    prim = stage.DefinePrim("/World/Looks", "Scope")
+    prim.CreateAttribute("diffuse", Sdf.ValueTypeNames.Asset).Set(Sdf.AssetPath("./tex.png"))
+    prim.CreateAttribute("normal", Sdf.ValueTypeNames.Asset).Set(Sdf.AssetPath("./missing.exr"))
+    stage.DefinePrim("/World/Car").GetReferences().AddReference("./asset.usda")
+    stage.DefinePrim("/World/Gone").GetReferences().AddReference("./gone.usda")
+    stage.Save()
+    return stage
+
+
+def check_graph(label, graph, folder):
+    root = graph.nodes[graph.root]
+    targets = {(e.arc, os.path.basename(e.target)) for e in root.edges}
+    check(f"{label}: sublayer edge", (ARC_SUBLAYER, "sub.usda") in targets)
+    check(f"{label}: reference edges", {(ARC_REFERENCE, "asset.usda"), (ARC_REFERENCE, "gone.usda")} <= targets)
+    check(f"{label}: no texture edges", not any(name.endswith((".png", ".exr")) for _, name in targets))
+    errors = sorted(os.path.basename(key) for key, node in graph.nodes.items() if node.error)
+    check(f"{label}: only the missing layer is an error node", errors == ["gone.usda"])
+
+
+def run_async_profiler(stage):
+    profiler = LayerProfilerUtils.AsyncLayerProfiler(stage)
+    profiler.start()
+    deadline = time.perf_counter() + 10.0
+    while not profiler.done and time.perf_counter() < deadline:
+        profiler.poll()
+        time.sleep(0.001)
+    return profiler
+
+
+def check_profile(label, rows):
+    by_name = {os.path.basename(r["identifier"]): r for r in rows}
+    check(f"{label}: referenced layer profiled", not by_name.get("asset.usda", {"error": "missing"})["error"])
+    check(f"{label}: missing layer is an error row", bool(by_name.get("gone.usda", {}).get("error")))
+    check(f"{label}: no texture rows", not any(n.endswith((".png", ".exr")) for n in by_name))
+
+
+def check_layer_profiler(stage):
+    clear_layer_dependency_graphs()
+    try:
+        check_profile("profile sync", LayerProfilerUtils.profile_stage_layers(stage))
+    except Exception as e:
+        check(f"profile sync: raised {e}", False)
+
+    clear_layer_dependency_graphs()
+    profiler = run_async_profiler(stage)
+    check("profile async: finished", profiler.done)
+    check_profile("profile async", profiler.rows)
+
+    # a failing graph build is reported, the used layers are still profiled
+    def failing_build(root_layer):
+        raise RuntimeError("graph build failed")
+
+    clear_layer_dependency_graphs()
+    original = LayerProfilerUtils.build_layer_dependency_graph
+    LayerProfilerUtils.build_layer_dependency_graph = failing_build
+    try:
+        profiler = run_async_profiler(stage)
+    finally:
+        LayerProfilerUtils.build_layer_dependency_graph = original
+    errors = [r for r in profiler.rows if r["error"]]
+    check("profile async, graph fails: error row", any("graph build failed" in r["error"] for r in errors))
+    check("profile async, graph fails: root layer profiled",
+          any(r["identifier"] == stage.GetRootLayer().identifier and not r["error"] for r in profiler.rows))
+
+
+def _snapshot(stage) -> dict:
+    # session layer included: it is anonymous and differs in every process
+    Sdf.CreatePrimInLayer(stage.GetSessionLayer(), "/World/Car").variantSelections["look"] = "red"
+    fp = io.StringIO()
+    write_snapshot_json(build_layer_dependency_graph(stage.GetRootLayer()), build_arc_index(stage.GetLayerStack()), fp)
+    return json.loads(fp.getvalue())
+
+
+def check_snapshot_diff(folder):
+    """
+    The same asset in two checkouts diffs as unchanged.
+    """
+    copy = folder + "_checkout2"
+    shutil.copytree(folder, copy)
+    old = _snapshot(Usd.Stage.Open(os.path.join(folder, "root.usda")))
+    new = _snapshot(Usd.Stage.Open(os.path.join(copy, "root.usda")))
+    diff = diff_snapshots(old, new)
+    check("snapshot: no absolute or anonymous keys",
+          not any(l["id"].startswith(("/", "anon:")) for l in old["layers"]))
+    check("snapshot: two checkouts diff as unchanged", not any(diff.values()))
+
+
+def main():
+    folder = tempfile.mkdtemp(prefix="dependency_regression_")
+    stage = make_textured_stage(folder)
+    root_layer = stage.GetRootLayer()
+
+    try:
+        check_graph("sync", build_layer_dependency_graph(root_layer), folder)
+    except Exception as e:
+        check(f"sync: build raised {e}", False)
+
+    builder = AsyncLayerGraphBuilder(root_layer, 4)
+    builder.start()
+    deadline = time.perf_counter() + 10.0
+    while not builder.done and time.perf_counter() < deadline:
+        builder.poll()
+        time.sleep(0.001)
+    check("async: finished", builder.done)
+    check_graph("async", builder.graph, folder)
+
+    check_layer_profiler(stage)
+    check_snapshot_diff(folder)
+
+    print(f"{len(failures)} failed" if failures else "all passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
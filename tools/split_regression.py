@@ -0,0 +1,163 @@
+"""
+Regression checks for split_prims_to_files on real files.
+
+    python tools/split_regression.py
+
+Exits 1 when a check fails. Uses the headless harness stand-ins, since the
+splitter module imports omni.ui / omni.usd.
+"""
+import json
+import pathlib
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tools import ui_harness  # noqa: E402
+
+ui_harness.install()
+
+from pxr import Sdf, Usd, UsdGeom  # noqa: E402
+from buoi_2.usd_stage_inspector_extension.utils.SplitterUtils import (  # noqa: E402
+    EXPORT_MODE_COMPOSED,
+    consolidate_payloads,
+    get_manifest_path,
+    split_prims_to_files,
+)
+
+failures = []
+
+
+def check(name, condition):
+    print(("ok    " if condition else "FAIL  ") + name)
+    if not condition:
+        failures.append(name)
+
+
+def make_car_stage(folder) -> Usd.Stage:
+    stage = Usd.Stage.CreateNew(os.path.join(folder, "root.usda"))
+    UsdGeom.Xform.Define(stage, "/World")
+    UsdGeom.Xform.Define(stage, "/World/Car")
+    UsdGeom.Cube.Define(stage, "/World/Car/Body").GetSizeAttr().Set(2.0)
+    UsdGeom.Xform.Define(stage, "/World/Car/Wheel")
+    UsdGeom.Cube.Define(stage, "/World/Car/Wheel/Tire").GetSizeAttr().Set(0.5)
+    stage.Save()
+    return stage
+
+
+def size_of(stage_path, prim_path):
+    # fresh stage from disk, kept alive while the prim is read
+    stage = Usd.Stage.Open(stage_path)
+    prim = stage.GetPrimAtPath(prim_path)
+    return prim.GetAttribute("size").Get() if prim else None
+
+
+def check_split_twice(folder, prim_paths, label):
+    stage = make_car_stage(folder)
+    root_path = stage.GetRootLayer().realPath
+    split_prims_to_files(stage, prim_paths, "out")
+    check(f"{label}: first split keeps Body", size_of(root_path, "/World/Car/Body") == 2.0)
+
+    # edit after the split, then split the same prims again (twice)
+    UsdGeom.Cube(stage.GetPrimAtPath("/World/Car/Body")).GetSizeAttr().Set(5.0)
+    for run in ("second", "third"):
+        split_prims_to_files(stage, prim_paths, "out")
+        check(f"{label}: {run} split keeps the Body edit", size_of(root_path, "/World/Car/Body") == 5.0)
+        check(f"{label}: {run} split keeps Wheel/Tire", size_of(root_path, "/World/Car/Wheel/Tire") == 0.5)
+
+
+def check_same_leaf_names(folder):
+    stage = Usd.Stage.CreateNew(os.path.join(folder, "root.usda"))
+    UsdGeom.Cube.Define(stage, "/A/Wheel").GetSizeAttr().Set(1.0)
+    UsdGeom.Cube.Define(stage, "/B/Wheel").GetSizeAttr().Set(9.0)
+    stage.Save()
+    root_path = stage.GetRootLayer().realPath
+
+    split_prims_to_files(stage, {"/A/Wheel", "/B/Wheel"}, "out")
+    check("same leaf: /A/Wheel keeps size 1", size_of(root_path, "/A/Wheel") == 1.0)
+    check("same leaf: /B/Wheel keeps size 9", size_of(root_path, "/B/Wheel") == 9.0)
+
+    out_dir = os.path.join(folder, "out")
+    check("same leaf: one file per prim", sorted(os.listdir(out_dir)) == ["A_Wheel.usda", "B_Wheel.usda"])
+    with open(get_manifest_path(pathlib.Path(out_dir))) as f:
+        files = json.load(f)["files"]
+    check("same leaf: manifest keyed by prim path", sorted(files) == ["/A/Wheel", "/B/Wheel"])
+
+
+def attr_of(stage_path, prim_path, name):
+    stage = Usd.Stage.Open(stage_path)
+    prim = stage.GetPrimAtPath(prim_path)
+    attr = prim.GetAttribute(name) if prim else None
+    return attr.Get() if attr else None
+
+
+def check_composed_with_sublayer(folder):
+    """
+    /World/Car has opinions in root.usda and in a weaker sublayer. A
+    composed split must leave neither spec composing over the payload.
+    """
+    weak = Usd.Stage.CreateNew(os.path.join(folder, "weak.usda"))
+    UsdGeom.Xform.Define(weak, "/World/Car")
+    body = UsdGeom.Cube.Define(weak, "/World/Car/Body")
+    body.GetSizeAttr().Set(3.0)
+    body.GetPrim().CreateAttribute("weakOnly", Sdf.ValueTypeNames.Int).Set(7)
+    weak.Save()
+
+    stage = Usd.Stage.CreateNew(os.path.join(folder, "root.usda"))
+    stage.GetRootLayer().subLayerPaths.append("./weak.usda")
+    stage.OverridePrim("/World/Car/Body").CreateAttribute("size", Sdf.ValueTypeNames.Double).Set(2.0)
+    stage.Save()
+    root_path = stage.GetRootLayer().realPath
+
+    for run in ("first", "second"):
+        split_prims_to_files(stage, {"/World/Car"}, "out", EXPORT_MODE_COMPOSED)
+        check(f"sublayer: {run} composed split keeps the stronger size", size_of(root_path, "/World/Car/Body") == 2.0)
+        check(f"sublayer: {run} composed split keeps weaker-only opinions",
+              attr_of(root_path, "/World/Car/Body", "weakOnly") == 7)
+        weak_layer = Sdf.Layer.FindOrOpen(os.path.join(folder, "weak.usda"))
+        check(f"sublayer: {run} split clears the weaker spec", not weak_layer.GetPrimAtPath("/World/Car"))
+        reopened = Usd.Stage.Open(root_path)
+        layers = [spec.layer.GetDisplayName() for spec in reopened.GetPrimAtPath("/World/Car").GetPrimStack()]
+        check(f"sublayer: {run} split leaves only the root spec over the payload",
+              layers == ["root.usda", "Car.usda"])
+
+
+def check_consolidate(folder):
+    stage = make_car_stage(folder)
+    root_path = stage.GetRootLayer().realPath
+    split_prims_to_files(stage, {"/World/Car", "/World/Car/Wheel"}, "out")
+
+    report = consolidate_payloads(stage, "/World/Car")
+    check("consolidate: Body kept", size_of(root_path, "/World/Car/Body") == 2.0)
+    check("consolidate: Wheel/Tire kept", size_of(root_path, "/World/Car/Wheel/Tire") == 0.5)
+    check("consolidate: fewer layers", report["layers_after"] < report["layers_before"])
+    check("consolidate: timed on a cold layer registry", report["cold_timing"])
+
+
+def main():
+    base = tempfile.mkdtemp(prefix="split_regression_")
+    for name, prim_paths in (("parent only", {"/World/Car"}), ("parent + child", {"/World/Car", "/World/Car/Wheel"})):
+        folder = os.path.join(base, name.replace(" ", "_").replace("+", "and"))
+        os.makedirs(folder)
+        check_split_twice(folder, prim_paths, name)
+
+    folder = os.path.join(base, "same_leaf")
+    os.makedirs(folder)
+    check_same_leaf_names(folder)
+
+    folder = os.path.join(base, "sublayer")
+    os.makedirs(folder)
+    check_composed_with_sublayer(folder)
+
+    folder = os.path.join(base, "consolidate")
+    os.makedirs(folder)
+    check_consolidate(folder)
+
+    print(f"{len(failures)} failed" if failures else "all passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Headless stand-ins for the Kit APIs used by usd_stage_inspector_extension.
+
+    from tools import ui_harness
+    ui_harness.install()          # before importing the extension
+    ui_harness.set_stage(stage)   # a real pxr stage
+    window = StageInspectorWindow("USD Stage Inspector")
+    ui_harness.pump()             # dispatch events, build dirty frames
+    print(ui_harness.counters.snapshot())
+
+Only the part of omni.ui / omni.usd / carb the extension calls is covered.
+"""
+import sys
+import types
+from . import kit_runtime, omni_ui
+from .counters import counters
+
+_MODULES = {
+    "omni.ui": omni_ui,
+    "omni.usd": kit_runtime.usd,
+    "omni.kit.app": kit_runtime.kit_app,
+    "omni.kit.ui": kit_runtime.kit_ui,
+    "omni.appwindow": kit_runtime.appwindow,
+    "omni.ext": kit_runtime.ext,
+    "carb.input": kit_runtime.carb_input,
+    "carb.events": kit_runtime.carb_events,
+}
+
+
+def _as_module(name, source):
+    if isinstance(source, types.ModuleType):
+        return source
+    module = types.ModuleType(name)
+    module.__dict__.update(vars(source))
+    return module
+
+
+def install():
+    """
+    Register the stand-ins in sys.modules. Parent packages (omni, omni.kit,
+    carb) are created as empty modules.
+    """
+    for name, source in _MODULES.items():
+        sys.modules[name] = _as_module(name, source)
+
+    for name in sorted(_MODULES, key=lambda n: n.count(".")):
+        parts = name.split(".")
+        for depth in range(1, len(parts)):
+            parent_name = ".".join(parts[:depth])
+            parent = sys.modules.get(parent_name)
+            if parent is None:
+                parent = sys.modules[parent_name] = types.ModuleType(parent_name)
+                parent.__path__ = []
+            child_name = ".".join(parts[:depth + 1])
+            if child_name not in sys.modules:
+                sys.modules[child_name] = types.ModuleType(child_name)
+                sys.modules[child_name].__path__ = []
+            setattr(parent, parts[depth], sys.modules[child_name])
+
+
+def set_stage(stage):
+    kit_runtime.get_context().set_stage(stage)
+
+
+def pump(frames: int = 1) -> int:
+    """
+    Simulate app updates: each one dispatches update and stage events, then
+    runs every pending frame build. Returns the number of builds.
+    """
+    built = 0
+    for _ in range(frames):
+        update_stream = kit_runtime.get_app().get_update_event_stream()
+        update_stream.push(0)
+        update_stream.dispatch()
+        kit_runtime.get_context().get_stage_event_stream().dispatch()
+        built += omni_ui.draw_pending()
+    return built
+
+
+def find_buttons(window, text):
+    """
+    Buttons with this text in a BaseWindow (or omni.ui window).
+    """
+    return omni_ui.find_widgets(getattr(window, "_window", window), omni_ui.Button, text)
+
+
+def click(window, text):
+    buttons = find_buttons(window, text)
+    if not buttons:
+        raise LookupError(f"No button {text!r}")
+    buttons[0].call_clicked_fn()
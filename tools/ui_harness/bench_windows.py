@@ -0,0 +1,318 @@
+"""
+Window build benchmarks on the headless harness.
+
+    python tools/ui_harness/bench_windows.py [--prims 100000]
+
+Builds an in-memory stage, drives the windows through the stand-in omni.ui
+and checks widget / rebuild / subscription budgets. Exits 1 when a budget
+is exceeded, so UI scaling regressions show up without a Kit app.
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from tools import ui_harness  # noqa: E402
+from tools.ui_harness import counters  # noqa: E402
+
+ui_harness.install()
+
+from pxr import Usd, UsdGeom, Sdf, Vt, Gf  # noqa: E402
+
+PACKAGE = "buoi_2.usd_stage_inspector_extension"
+# Only imported when a tool window / the splitter / a filter needs them
+LAZY_MODULES = [
+    f"{PACKAGE}.ui.StageInspectorWindow",
+    f"{PACKAGE}.ui.DependencyGraphWindow",
+    f"{PACKAGE}.ui.PrimPropertyWindow",
+    f"{PACKAGE}.utils.DependencyUtils",
+    f"{PACKAGE}.utils.SplitterUtils",
+    f"{PACKAGE}.utils.PrimIndexUtils",
+]
+# The inspector itself is loaded on first show, the tool windows stay lazy
+LAZY_AFTER_SHOW_MODULES = LAZY_MODULES[1:]
+
+# ---------------------- Budgets ----------------------
+# on_startup, and the extension module import (file system bound, so looser;
+# importing the tool windows eagerly costs ~60 ms)
+STARTUP_MAX_MS = 5.0
+IMPORT_MAX_MS = 20.0
+# App updates after startup during which the window must stay unbuilt
+STARTUP_IDLE_PUMPS = 5
+# Whole inspector window with the root rows listed
+OPEN_INSPECTOR_MAX_WIDGETS = 150
+# Filter results are paged: one page of rows plus the pager, whatever the
+# number of matches (FILTER_PAGE_SIZE = 100 rows of 6 widgets)
+FILTER_MAX_WIDGETS = 700
+# Tree rows (label, spacers, expand / choose / select / inspect buttons)
+EXPAND_MAX_WIDGETS_PER_ROW = 12
+# One attribute edit only rebuilds its row and the type section
+LIVE_EDIT_MAX_REBUILDS = 2
+LIVE_EDIT_MAX_WIDGETS = 40
+PROPERTY_WINDOW_MAX_WIDGETS = 400
+COMPOSITION_WINDOW_MAX_WIDGETS = 400
+DEPENDENCY_WINDOW_MAX_WIDGETS = 400
+# Pumps to wait for the background layer graph build
+DEPENDENCY_MAX_PUMPS = 2000
+
+GROUP_SIZE = 1000
+
+
+def build_stage(prim_count: int) -> Usd.Stage:
+    """
+    /World/Group_g/Prim_i Xforms (every 10th matching the filter name), and
+    a referenced mesh under /World/Asset.
+    """
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.Xform.Define(stage, "/World")
+    layer = stage.GetRootLayer()
+    with Sdf.ChangeBlock():
+        for i in range(prim_count):
+            group = f"/World/Group_{i // GROUP_SIZE}"
+            if i % GROUP_SIZE == 0:
+                Sdf.CreatePrimInLayer(layer, group).specifier = Sdf.SpecifierDef
+            name = f"Target_{i}" if i % 10 == 0 else f"Prim_{i}"
+            spec = Sdf.CreatePrimInLayer(layer, f"{group}/{name}")
+            spec.specifier = Sdf.SpecifierDef
+            spec.typeName = "Xform"
+
+    asset = Sdf.Layer.CreateAnonymous("asset.usda")
+    asset_stage = Usd.Stage.Open(asset)
+    mesh = UsdGeom.Mesh.Define(asset_stage, "/Asset")
+    mesh.CreatePointsAttr(Vt.Vec3fArray([Gf.Vec3f(0, 0, 0), Gf.Vec3f(1, 0, 0), Gf.Vec3f(1, 1, 0), Gf.Vec3f(0, 1, 0)]))
+    mesh.CreateFaceVertexCountsAttr(Vt.IntArray([4]))
+    mesh.CreateFaceVertexIndicesAttr(Vt.IntArray([0, 1, 2, 3]))
+    mesh.CreateDisplayColorAttr(Vt.Vec3fArray([Gf.Vec3f(1, 0, 0)]))
+    asset_stage.SetDefaultPrim(mesh.GetPrim())
+
+    prim = stage.DefinePrim("/World/Asset")
+    prim.GetReferences().AddReference(asset.identifier)
+    # local opinion, so the live edit benchmark changes a value instead of adding a spec
+    UsdGeom.Mesh(prim).GetDisplayColorAttr().Set(Vt.Vec3fArray([Gf.Vec3f(0, 0, 1)]))
+    return stage
+
+
+def _windows():
+    """
+    Window modules, imported after the startup benchmark.
+    """
+    from buoi_2.usd_stage_inspector_extension.ui import (
+        BaseWindow, CompositionWindow, DependencyGraphWindow, PrimPropertyWindow, StageInspectorWindow, WindowManager)
+    return BaseWindow, CompositionWindow, DependencyGraphWindow, PrimPropertyWindow, StageInspectorWindow, WindowManager
+
+
+class Bench:
+    def __init__(self):
+        self.results = []
+        self.failures = []
+
+    def measure(self, name, fn, pumps=1):
+        counters.reset()
+        start = time.perf_counter()
+        result = fn()
+        ui_harness.pump(pumps)
+        seconds = time.perf_counter() - start
+        stats = counters.snapshot()
+        stats["seconds"] = round(seconds, 3)
+        self.results.append((name, stats))
+        return result, stats
+
+    def check(self, name, value, limit):
+        if value > limit:
+            self.failures.append(f"{name}: {value} > {limit}")
+
+    def report(self):
+        for name, stats in self.results:
+            print(f"{name:<32} {stats}")
+        for failure in self.failures:
+            print(f"BUDGET EXCEEDED {failure}")
+        return not self.failures
+
+
+def bench_startup(bench, stage):
+    """
+    Extension import and on_startup only register the window and its menu
+    item; nothing is built until the window is shown from the menu.
+    """
+    counters.reset()
+    start = time.perf_counter()
+    extension = importlib.import_module(f"{PACKAGE}.extension")
+    imported = time.perf_counter()
+    ext = extension.UsdStageInspectorExtension()
+    ext.on_startup(PACKAGE)
+    import_ms = round((imported - start) * 1000, 2)
+    startup_ms = round((time.perf_counter() - imported) * 1000, 2)
+    stats = counters.snapshot()
+    stats["import_ms"] = import_ms
+    stats["startup_ms"] = startup_ms
+    bench.results.append(("extension startup", stats))
+    bench.check("import ms", import_ms, IMPORT_MAX_MS)
+    bench.check("startup ms", startup_ms, STARTUP_MAX_MS)
+    bench.check("startup widgets", stats["widgets_created"], 0)
+    for name in LAZY_MODULES:
+        if name in sys.modules:
+            bench.failures.append(f"{name} imported at startup")
+
+    def open_stage():
+        ui_harness.set_stage(stage)
+        ui_harness.pump(STARTUP_IDLE_PUMPS)
+
+    _, stats = bench.measure("stage OPENED, window not shown", open_stage)
+    bench.check("widgets before first show", stats["widgets_created"], 0)
+    if ext._window is not None:
+        bench.failures.append("inspector built without being shown")
+
+    def show_from_menu():
+        editor_menu = sys.modules["omni.kit.ui"].get_editor_menu()
+        editor_menu.click(extension.MENU_PATH)
+        return ext._window
+
+    window, stats = bench.measure("first show from menu", show_from_menu)
+    if window is None or not window._rows:
+        bench.failures.append("inspector not built / stage not scanned on first show")
+    for name in LAZY_AFTER_SHOW_MODULES:
+        if name in sys.modules:
+            bench.failures.append(f"{name} imported by the inspector window")
+    ext.on_shutdown()
+
+
+def bench_inspector(bench, prim_count):
+    StageInspectorWindow = _windows()[4].StageInspectorWindow
+    inspector, stats = bench.measure("open inspector", lambda: StageInspectorWindow("USD Stage Inspector"))
+    bench.check("open inspector widgets", stats["widgets_created"], OPEN_INSPECTOR_MAX_WIDGETS)
+
+    def apply_filter():
+        inspector._input_name.model.set_value("Target_*")
+        inspector._search_mode.model.set_value(2)
+        ui_harness.click(inspector, "Apply")
+
+    _, stats = bench.measure("filter name (wildcard)", apply_filter)
+    results = len(inspector._filtered_prim_paths)
+    expected = (prim_count + 9) // 10
+    if results != expected:
+        bench.failures.append(f"filter results: {results} != {expected}")
+    bench.check("filter widgets", stats["widgets_created"], FILTER_MAX_WIDGETS)
+    bench.check("filter rebuilds", stats["rebuilds"], 2)
+
+    def choose_result():
+        ui_harness.click(inspector, "Choose")
+
+    _, stats = bench.measure("choose one result", choose_result)
+    bench.check("choose widgets", stats["widgets_created"], FILTER_MAX_WIDGETS)
+    if len(inspector._selected_prim_paths) != 1:
+        bench.failures.append("choose: result not added to the chosen set")
+
+    _, stats = bench.measure("clear filter", lambda: ui_harness.click(inspector, "Clear"))
+    bench.check("path table after clear", len(inspector._path_table), 0)
+
+    def expand_world():
+        world = next(r for r in inspector._rows if r.path == "/World")
+        inspector._toggle_expand(world)
+        return len(world.children) + len(inspector._rows)
+
+    rows, stats = bench.measure("expand /World", expand_world)
+    bench.check("expand widgets", stats["widgets_created"], rows * EXPAND_MAX_WIDGETS_PER_ROW + OPEN_INSPECTOR_MAX_WIDGETS)
+    return inspector
+
+
+def bench_property_window(bench, stage):
+    PrimPropertyWindow = _windows()[3].PrimPropertyWindow
+    window_manager = _windows()[5].window_manager
+    window, stats = bench.measure(
+        "open prim properties", lambda: window_manager.show(PrimPropertyWindow, "/World/Asset"))
+    bench.check("property window widgets", stats["widgets_created"], PROPERTY_WINDOW_MAX_WIDGETS)
+
+    def edit_attribute():
+        attr = stage.GetPrimAtPath("/World/Asset").GetAttribute("primvars:displayColor")
+        attr.Set(Vt.Vec3fArray([Gf.Vec3f(0, 1, 0)]))
+
+    _, stats = bench.measure("live edit one attribute", edit_attribute)
+    bench.check("live edit rebuilds", stats["rebuilds"], LIVE_EDIT_MAX_REBUILDS)
+    bench.check("live edit widgets", stats["widgets_created"], LIVE_EDIT_MAX_WIDGETS)
+
+
+def bench_composition_window(bench):
+    CompositionWindow = _windows()[1].CompositionWindow
+    window_manager = _windows()[5].window_manager
+    _, stats = bench.measure(
+        "open composition", lambda: window_manager.show(CompositionWindow, "/World/Asset", "points"))
+    bench.check("composition widgets", stats["widgets_created"], COMPOSITION_WINDOW_MAX_WIDGETS)
+
+
+def bench_dependency_window(bench):
+    DependencyGraphWindow = _windows()[2].DependencyGraphWindow
+    window_manager = _windows()[5].window_manager
+
+    def open_and_wait():
+        window = window_manager.show(DependencyGraphWindow)
+        for _ in range(DEPENDENCY_MAX_PUMPS):
+            ui_harness.pump()
+            if window._builder is None:
+                break
+            time.sleep(0.001)
+        return window
+
+    window, stats = bench.measure("open dependency graph", open_and_wait)
+    if window._builder is not None:
+        bench.failures.append("dependency graph build did not finish")
+    bench.check("dependency widgets", stats["widgets_created"], DEPENDENCY_WINDOW_MAX_WIDGETS)
+
+
+def bench_pooling(bench, inspector, paths):
+    BaseWindow = _windows()[0].BaseWindow
+    PrimPropertyWindow = _windows()[3].PrimPropertyWindow
+    window_manager = _windows()[5].window_manager
+
+    def open_many():
+        for path in paths:
+            inspector._open_prim_window(path)
+
+    _, stats = bench.measure(f"inspect {len(paths)} prims", open_many)
+    pooled = window_manager.get_stats()["pooled_windows"].get("PrimPropertyWindow", 0)
+    bench.check("pooled property windows", pooled, PrimPropertyWindow.POOL_SIZE)
+    keyboard = counters.subscriptions["keyboard"]
+    if keyboard != BaseWindow.live_windows:
+        bench.failures.append(f"keyboard subscriptions {keyboard} != live windows {BaseWindow.live_windows}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--prims", type=int, default=100000, help="Xform prims under /World")
+    args = parser.parse_args()
+
+    # Exports and the prim index write to ../outputs, keep them out of the tree
+    work_dir = os.path.join(tempfile.mkdtemp(prefix="ui_harness_"), "work")
+    os.makedirs(work_dir)
+    os.chdir(work_dir)
+
+    start = time.perf_counter()
+    stage = build_stage(args.prims)
+    print(f"Stage with {args.prims} prims built in {time.perf_counter() - start:.2f}s")
+    bench = Bench()
+    bench_startup(bench, stage)
+    inspector = bench_inspector(bench, args.prims)
+    bench_property_window(bench, stage)
+    bench_composition_window(bench)
+    bench_dependency_window(bench)
+    bench_pooling(bench, inspector, [f"/World/Group_0/Prim_{i}" for i in range(1, 11)])
+
+    window_manager = _windows()[5].window_manager
+    window_manager.destroy_all()
+    inspector.__destroy__()
+    ui_harness.pump()
+    leaked = {k: v for k, v in counters.subscriptions.items() if v}
+    if leaked:
+        bench.failures.append(f"subscriptions left after destroy: {leaked}")
+
+    passed = bench.report()
+    print(f"Window stats: {window_manager.get_stats()}")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
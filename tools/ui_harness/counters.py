@@ -0,0 +1,49 @@
+from collections import Counter
+
+
+class HarnessCounters:
+    """
+    What the stand-in APIs recorded since the last reset().
+
+    widgets_created / widgets_destroyed: omni.ui widgets constructed, and
+        the ones dropped by a frame rebuild or a window destroy.
+    rebuilds: frame / tree view build function calls.
+    callbacks: registered callbacks by kind (clicked_fn, build_fn, ...).
+
+    live_widgets and subscriptions describe the current state and are not
+    cleared by reset().
+    """
+
+    def __init__(self):
+        self.live_widgets = 0
+        self.subscriptions = Counter()
+        self.reset()
+
+    def reset(self):
+        self.widgets_created = 0
+        self.widgets_destroyed = 0
+        self.widgets_by_type = Counter()
+        self.rebuilds = 0
+        self.callbacks = Counter()
+
+    def widget_created(self, widget):
+        self.widgets_created += 1
+        self.live_widgets += 1
+        self.widgets_by_type[type(widget).__name__] += 1
+
+    def widget_destroyed(self):
+        self.widgets_destroyed += 1
+        self.live_widgets -= 1
+
+    def snapshot(self) -> dict:
+        return {
+            "widgets_created": self.widgets_created,
+            "widgets_destroyed": self.widgets_destroyed,
+            "live_widgets": self.live_widgets,
+            "rebuilds": self.rebuilds,
+            "callbacks": sum(self.callbacks.values()),
+            "subscriptions": {k: v for k, v in self.subscriptions.items() if v},
+        }
+
+
+counters = HarnessCounters()
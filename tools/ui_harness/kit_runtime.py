@@ -0,0 +1,291 @@
+"""
+Stand-ins for omni.usd, omni.kit.app, omni.appwindow, omni.ext and carb.
+
+The usd context holds a real pxr stage (set_stage). Event streams queue
+events and dispatch them on pump(), the way Kit dispatches on the next
+update; subscriptions are counted until unsubscribed.
+"""
+import weakref
+from enum import IntEnum
+from types import SimpleNamespace
+from .counters import counters
+
+
+class Subscription:
+    def __init__(self, stream, fn, kind):
+        self._stream = stream
+        self._fn = fn
+        self._kind = kind
+        self._ref = weakref.ref(self)
+        counters.subscriptions[kind] += 1
+
+    def unsubscribe(self):
+        if self._stream is None:
+            return
+        self._stream._subs.remove(self._ref)
+        self._stream = None
+        counters.subscriptions[self._kind] -= 1
+
+    def __del__(self):
+        # Kit releases a subscription when its last reference goes away
+        self.unsubscribe()
+
+
+class EventStream:
+    """
+    Holds its subscriptions weakly, like Kit: dropping the subscription
+    object is enough to stop receiving events.
+    """
+
+    def __init__(self, kind):
+        self._kind = kind
+        self._subs = []
+        self._queue = []
+
+    def create_subscription_to_pop(self, fn, name=None, order=0):
+        sub = Subscription(self, fn, self._kind)
+        self._subs.append(sub._ref)
+        return sub
+
+    def push(self, event_type, payload=None):
+        self._queue.append(SimpleNamespace(type=int(event_type), payload=payload or {}))
+
+    def dispatch(self) -> int:
+        """
+        Deliver the queued events, returns how many were delivered.
+        """
+        events, self._queue = self._queue, []
+        for event in events:
+            for ref in list(self._subs):
+                sub = ref()
+                if sub is not None and sub._stream is not None:
+                    sub._fn(event)
+        return len(events)
+
+    @property
+    def subscription_count(self) -> int:
+        return len(self._subs)
+
+
+# ---------------------- omni.usd ----------------------
+class StageEventType(IntEnum):
+    SAVED = 0
+    SAVE_FAILED = 1
+    OPENING = 2
+    OPENED = 3
+    OPEN_FAILED = 4
+    CLOSING = 5
+    CLOSED = 6
+    SELECTION_CHANGED = 7
+
+
+class StageState(IntEnum):
+    CLOSED = 0
+    CLOSING = 1
+    OPENING = 2
+    OPENED = 3
+
+
+class Selection:
+    def __init__(self, context):
+        self._context = context
+        self._paths = []
+
+    def set_selected_prim_paths(self, paths, expand_in_stage=False):
+        self._paths = list(paths)
+        self._context._stage_events.push(StageEventType.SELECTION_CHANGED)
+
+    def get_selected_prim_paths(self):
+        return list(self._paths)
+
+    def clear_selected_prim_paths(self):
+        self.set_selected_prim_paths([])
+
+
+class _StageEventStream(EventStream):
+    def __init__(self, context):
+        super().__init__("stage_event")
+        self._context = context
+
+    def dispatch(self) -> int:
+        if any(e.type == StageEventType.OPENED for e in self._queue):
+            self._context._stage_state = StageState.OPENED
+        return super().dispatch()
+
+
+class UsdContext:
+    def __init__(self):
+        self._stage = None
+        self._stage_state = StageState.CLOSED
+        self._stage_events = _StageEventStream(self)
+        self._selection = Selection(self)
+
+    def get_stage(self):
+        return self._stage
+
+    def get_stage_state(self):
+        return self._stage_state
+
+    def set_stage(self, stage):
+        """
+        Harness only: swap the open stage and queue CLOSING / CLOSED / OPENED.
+        The stage stays OPENING until OPENED is dispatched.
+        """
+        if self._stage is not None:
+            self._stage_events.push(StageEventType.CLOSING)
+            self._stage_events.push(StageEventType.CLOSED)
+        self._stage = stage
+        self._stage_state = StageState.OPENING if stage is not None else StageState.CLOSED
+        if stage is not None:
+            self._stage_events.push(StageEventType.OPENED)
+
+    def get_stage_event_stream(self):
+        return self._stage_events
+
+    def get_selection(self):
+        return self._selection
+
+
+_usd_context = UsdContext()
+
+
+def get_context(name=""):
+    return _usd_context
+
+
+usd = SimpleNamespace(StageEventType=StageEventType, StageState=StageState, get_context=get_context)
+
+
+# ---------------------- omni.kit.app ----------------------
+class App:
+    def __init__(self):
+        self._update_events = EventStream("update_event")
+
+    def get_update_event_stream(self):
+        return self._update_events
+
+
+_app = App()
+
+
+def get_app():
+    return _app
+
+
+kit_app = SimpleNamespace(get_app=get_app)
+
+
+# ---------------------- omni.kit.ui ----------------------
+class EditorMenu:
+    """
+    Menu items by path; click() calls the item the way Kit does.
+    """
+
+    def __init__(self):
+        self._items = {}
+
+    def add_item(self, menu_path, on_click, toggle=False, value=False):
+        self._items[menu_path] = {"fn": on_click, "toggle": toggle, "value": value}
+        return menu_path
+
+    def remove_item(self, menu_path):
+        self._items.pop(menu_path, None)
+
+    def set_value(self, menu_path, value):
+        if menu_path in self._items:
+            self._items[menu_path]["value"] = value
+
+    def get_value(self, menu_path):
+        return self._items[menu_path]["value"]
+
+    def has_item(self, menu_path) -> bool:
+        return menu_path in self._items
+
+    def click(self, menu_path):
+        item = self._items[menu_path]
+        if item["toggle"]:
+            item["value"] = not item["value"]
+        item["fn"](menu_path, item["value"])
+
+
+_editor_menu = EditorMenu()
+
+kit_ui = SimpleNamespace(get_editor_menu=lambda: _editor_menu)
+
+
+# ---------------------- omni.appwindow / omni.ext ----------------------
+class AppWindow:
+    def __init__(self):
+        self._keyboard = object()
+
+    def get_keyboard(self):
+        return self._keyboard
+
+
+_app_window = AppWindow()
+
+appwindow = SimpleNamespace(get_default_app_window=lambda: _app_window)
+
+
+class IExt:
+    pass
+
+
+ext = SimpleNamespace(IExt=IExt)
+
+
+# ---------------------- carb ----------------------
+class KeyboardEventType(IntEnum):
+    KEY_PRESS = 0
+    KEY_REPEAT = 1
+    KEY_RELEASE = 2
+    CHAR = 3
+
+
+class KeyboardInput(IntEnum):
+    UNKNOWN = 0
+    ESCAPE = 1
+    ENTER = 2
+    DEL = 3
+    F5 = 4
+
+
+class InputInterface:
+    def __init__(self):
+        self._next_id = 1
+        self._keyboard_subs = {}
+
+    def subscribe_to_keyboard_events(self, keyboard, fn):
+        sub_id = self._next_id
+        self._next_id += 1
+        self._keyboard_subs[sub_id] = fn
+        counters.subscriptions["keyboard"] += 1
+        return sub_id
+
+    def unsubscribe_to_keyboard_events(self, keyboard, sub_id):
+        if self._keyboard_subs.pop(sub_id, None) is not None:
+            counters.subscriptions["keyboard"] -= 1
+
+    def send_key(self, key, event_type=KeyboardEventType.KEY_RELEASE):
+        """
+        Harness only: deliver a key event to every subscriber.
+        """
+        event = SimpleNamespace(input=key, type=event_type)
+        for fn in list(self._keyboard_subs.values()):
+            fn(event)
+
+
+_input = InputInterface()
+
+carb_input = SimpleNamespace(
+    acquire_input_interface=lambda: _input,
+    KeyboardEventType=KeyboardEventType,
+    KeyboardInput=KeyboardInput,
+)
+
+
+class IEvent:
+    pass
+
+
+carb_events = SimpleNamespace(IEvent=IEvent)
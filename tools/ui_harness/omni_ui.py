@@ -0,0 +1,472 @@
+"""
+Stand-in for the part of omni.ui the extension uses.
+
+Widgets only record their tree and arguments. Frame build functions run
+when the harness draws a frame (pump()), like Kit does on the next draw,
+and several rebuild() calls in between cost one build.
+"""
+from enum import IntEnum
+from .counters import counters
+
+_container_stack = []
+# frames / tree views waiting for the next draw
+_dirty = []
+
+
+def _register_callback(kind, fn):
+    if fn is not None:
+        counters.callbacks[kind] += 1
+    return fn
+
+
+def draw_pending():
+    """
+    Run the pending builds, returns how many ran.
+    """
+    built = 0
+    while _dirty:
+        pending = list(_dirty)
+        _dirty.clear()
+        for widget in pending:
+            widget._dirty = False
+            if not widget.destroyed:
+                widget._build()
+                built += 1
+    return built
+
+
+class Alignment(IntEnum):
+    LEFT = 0
+    CENTER = 1
+    RIGHT = 2
+
+
+class ScrollBarPolicy(IntEnum):
+    SCROLLBAR_AS_NEEDED = 0
+    SCROLLBAR_ALWAYS_OFF = 1
+    SCROLLBAR_ALWAYS_ON = 2
+
+
+class Percent(float):
+    pass
+
+
+class Pixel(float):
+    pass
+
+
+# ---------------------- Models ----------------------
+class AbstractValueModel:
+    def __init__(self, value=None):
+        self._value = value
+        self._value_changed_fns = []
+
+    def add_value_changed_fn(self, fn):
+        self._value_changed_fns.append(_register_callback("value_changed_fn", fn))
+
+    def set_value(self, value):
+        if value == self._value:
+            return
+        self._value = value
+        for fn in list(self._value_changed_fns):
+            fn(self)
+
+    def get_value_as_int(self) -> int:
+        return int(self._value or 0)
+
+    def get_value_as_float(self) -> float:
+        return float(self._value or 0.0)
+
+    def get_value_as_bool(self) -> bool:
+        return bool(self._value)
+
+    def get_value_as_string(self) -> str:
+        return "" if self._value is None else str(self._value)
+
+    as_int = property(get_value_as_int, set_value)
+    as_float = property(get_value_as_float, set_value)
+    as_bool = property(get_value_as_bool, set_value)
+    as_string = property(get_value_as_string, set_value)
+
+
+class SimpleIntModel(AbstractValueModel):
+    def __init__(self, value=0):
+        super().__init__(int(value))
+
+
+class SimpleFloatModel(AbstractValueModel):
+    def __init__(self, value=0.0):
+        super().__init__(float(value))
+
+
+class SimpleBoolModel(AbstractValueModel):
+    def __init__(self, value=False):
+        super().__init__(bool(value))
+
+
+class SimpleStringModel(AbstractValueModel):
+    def __init__(self, value=""):
+        super().__init__(str(value))
+
+
+class AbstractItem:
+    def __init__(self):
+        pass
+
+
+class AbstractItemModel:
+    def __init__(self):
+        self._item_changed_fns = []
+        self._views = []
+
+    def add_item_changed_fn(self, fn):
+        self._item_changed_fns.append(_register_callback("item_changed_fn", fn))
+
+    def _item_changed(self, item):
+        for view in self._views:
+            view.rebuild()
+        for fn in list(self._item_changed_fns):
+            fn(self, item)
+
+    def get_item_children(self, item):
+        return []
+
+    def get_item_value_model_count(self, item):
+        return 1
+
+    def get_item_value_model(self, item, column_id):
+        return None
+
+
+class AbstractItemDelegate:
+    def __init__(self):
+        pass
+
+    def build_branch(self, model, item, column_id, level, expanded):
+        pass
+
+    def build_widget(self, model, item, column_id, level, expanded):
+        pass
+
+    def build_header(self, column_id):
+        pass
+
+
+class _ComboBoxModel(AbstractItemModel):
+    def __init__(self, current, items):
+        super().__init__()
+        self._current = SimpleIntModel(current)
+        self._current.add_value_changed_fn(lambda _: self._item_changed(None))
+        self.items = list(items)
+
+    def get_item_value_model(self, item=None, column_id=0):
+        return self._current
+
+    def get_item_children(self, item):
+        return self.items
+
+
+# ---------------------- Widgets ----------------------
+class Widget:
+    def __init__(self, **kwargs):
+        self.children = []
+        self.destroyed = False
+        self.visible = kwargs.pop("visible", True)
+        self.kwargs = kwargs
+        self.parent = _container_stack[-1] if _container_stack else None
+        if self.parent is not None:
+            self.parent.children.append(self)
+        counters.widget_created(self)
+
+    def _clear_children(self):
+        for child in self.children:
+            child.destroy()
+        self.children = []
+
+    def destroy(self):
+        if self.destroyed:
+            return
+        self._clear_children()
+        self.destroyed = True
+        counters.widget_destroyed()
+
+    def iter_tree(self):
+        yield self
+        for child in self.children:
+            yield from child.iter_tree()
+
+    def __getattr__(self, name):
+        # style / tooltip / width ... passed at construction
+        kwargs = self.__dict__.get("kwargs", {})
+        if name in kwargs:
+            return kwargs[name]
+        raise AttributeError(name)
+
+
+class Container(Widget):
+    def __enter__(self):
+        _container_stack.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _container_stack.pop()
+        return False
+
+
+class Stack(Container):
+    pass
+
+
+class HStack(Stack):
+    pass
+
+
+class VStack(Stack):
+    pass
+
+
+class ZStack(Stack):
+    pass
+
+
+class Frame(Container):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._build_fn = None
+        self._dirty = False
+
+    def set_build_fn(self, fn):
+        self._build_fn = _register_callback("build_fn", fn)
+        self.rebuild()
+
+    def rebuild(self):
+        if not self._dirty:
+            self._dirty = True
+            _dirty.append(self)
+
+    def _build(self):
+        self._clear_children()
+        if self._build_fn:
+            counters.rebuilds += 1
+            with self:
+                self._build_fn()
+
+
+class ScrollingFrame(Frame):
+    pass
+
+
+class CollapsableFrame(Frame):
+    def __init__(self, title="", **kwargs):
+        super().__init__(**kwargs)
+        self.title = title
+
+
+class Label(Widget):
+    def __init__(self, text="", **kwargs):
+        super().__init__(**kwargs)
+        self.text = text
+
+
+class Button(Widget):
+    def __init__(self, text="", clicked_fn=None, **kwargs):
+        super().__init__(**kwargs)
+        self.text = text
+        self._clicked_fn = _register_callback("clicked_fn", clicked_fn)
+
+    def set_clicked_fn(self, fn):
+        self._clicked_fn = _register_callback("clicked_fn", fn)
+
+    def call_clicked_fn(self):
+        if self._clicked_fn:
+            self._clicked_fn()
+
+
+class Spacer(Widget):
+    pass
+
+
+class Separator(Widget):
+    pass
+
+
+class Line(Widget):
+    pass
+
+
+class Rectangle(Widget):
+    pass
+
+
+class Image(Widget):
+    def __init__(self, source_url="", **kwargs):
+        super().__init__(**kwargs)
+        self.source_url = source_url
+
+
+class _ModelWidget(Widget):
+    def __init__(self, model=None, default_model_cls=SimpleStringModel, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model if model is not None else default_model_cls()
+
+
+class StringField(_ModelWidget):
+    def __init__(self, model=None, **kwargs):
+        super().__init__(model, SimpleStringModel, **kwargs)
+
+
+class FloatField(_ModelWidget):
+    def __init__(self, model=None, **kwargs):
+        super().__init__(model, SimpleFloatModel, **kwargs)
+
+
+class IntField(_ModelWidget):
+    def __init__(self, model=None, **kwargs):
+        super().__init__(model, SimpleIntModel, **kwargs)
+
+
+class CheckBox(_ModelWidget):
+    def __init__(self, model=None, **kwargs):
+        super().__init__(model, SimpleBoolModel, **kwargs)
+
+
+class ComboBox(Widget):
+    def __init__(self, *args, **kwargs):
+        super().__init__(**kwargs)
+        current, items = (args[0], args[1:]) if args else (0, ())
+        if isinstance(current, AbstractValueModel):
+            current = current.get_value_as_int()
+        self.model = _ComboBoxModel(current, items)
+
+
+class RadioCollection:
+    def __init__(self):
+        self.model = SimpleIntModel(0)
+
+
+class RadioButton(Widget):
+    def __init__(self, text="", radio_collection=None, **kwargs):
+        super().__init__(**kwargs)
+        self.text = text
+        self.radio_collection = radio_collection
+
+
+class TreeView(Container):
+    """
+    Builds one row per top-level item through the delegate, again whenever
+    the model reports a change.
+    """
+    def __init__(self, model, delegate=None, column_count=1, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+        self.delegate = delegate
+        self.column_count = column_count
+        self._dirty = False
+        model._views.append(self)
+        self.rebuild()
+
+    def rebuild(self):
+        if not self._dirty:
+            self._dirty = True
+            _dirty.append(self)
+
+    def _build(self):
+        self._clear_children()
+        if not self.delegate:
+            return
+        counters.rebuilds += 1
+        with self:
+            for item in self.model.get_item_children(None):
+                for column_id in range(self.column_count):
+                    self.delegate.build_branch(self.model, item, column_id, 0, False)
+                    self.delegate.build_widget(self.model, item, column_id, 0, False)
+
+    def destroy(self):
+        if self in self.model._views:
+            self.model._views.remove(self)
+        super().destroy()
+
+
+# ---------------------- Windows ----------------------
+_windows = []
+
+
+class Window:
+    def __init__(self, title="", width=400, height=300, visible=True, **kwargs):
+        self.title = title
+        self.width = width
+        self.height = height
+        self._visible = visible
+        self._visibility_changed_fn = None
+        self.frame = Frame()
+        self.destroyed = False
+        _windows.append(self)
+
+    @property
+    def visible(self):
+        return self._visible
+
+    @visible.setter
+    def visible(self, value):
+        if value == self._visible:
+            return
+        self._visible = value
+        if self._visibility_changed_fn:
+            self._visibility_changed_fn(value)
+
+    def set_visibility_changed_fn(self, fn):
+        self._visibility_changed_fn = _register_callback("visibility_changed_fn", fn)
+
+    def focus(self):
+        pass
+
+    def destroy(self):
+        if self.destroyed:
+            return
+        self.destroyed = True
+        self.frame.destroy()
+        if self in _windows:
+            _windows.remove(self)
+
+
+def get_windows():
+    return list(_windows)
+
+
+class Workspace:
+    """
+    Show functions registered by title; show_window() calls them, the way
+    Kit does from menus and restored layouts.
+    """
+    _show_window_fns = {}
+
+    @staticmethod
+    def set_show_window_fn(title, fn):
+        if fn is None:
+            Workspace._show_window_fns.pop(title, None)
+        else:
+            Workspace._show_window_fns[title] = _register_callback("show_window_fn", fn)
+
+    @staticmethod
+    def show_window(title, show=True):
+        fn = Workspace._show_window_fns.get(title)
+        if fn:
+            fn(show)
+        return fn is not None
+
+    @staticmethod
+    def get_window(title):
+        return next((w for w in _windows if w.title == title), None)
+
+
+def find_widgets(root, widget_type=None, text=None):
+    """
+    Widgets under root (a Window or a widget) of a type and / or with a text.
+    """
+    if isinstance(root, Window):
+        root = root.frame
+    return [
+        w for w in root.iter_tree()
+        if (widget_type is None or isinstance(w, widget_type))
+        and (text is None or getattr(w, "text", None) == text)
+    ]